@@ -3,6 +3,7 @@
 # region #-- imports --#
 import logging
 import uuid
+from functools import partial
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -21,7 +22,9 @@ from .const import (
     CONF_DEVICE_TRACKERS,
     CONF_DEVICE_TRACKERS_TO_REMOVE,
     CONF_EVENTS_OPTIONS,
+    CONF_FORCE_REFRESH_SETTLE,
     CONF_NODE,
+    CONF_PRESENCE_DHCP,
     CONF_REDACT_OPTIONS,
     CONF_SCAN_INTERVAL_DEVICE_TRACKER,
     CONF_SELECT_TEMP_UI_DEVICE,
@@ -29,6 +32,8 @@ from .const import (
     CONF_UI_PLACEHOLDER_DEVICE_ID,
     DEF_API_REQUEST_TIMEOUT,
     DEF_EVENTS_OPTIONS,
+    DEF_FORCE_REFRESH_SETTLE_SECS,
+    DEF_PRESENCE_DHCP,
     DEF_SCAN_INTERVAL,
     DEF_SCAN_INTERVAL_DEVICE_TRACKER,
     DEF_SELECT_TEMP_UI_DEVICE,
@@ -41,13 +46,18 @@ from .coordinator import (
     LinksysVelopDataUpdateCoordinatorSpeedtest,
     LinksysVelopRuntimeData,
     get_mesh_device_for_config_entry,
+    get_mesh_index_for_config_entry,
 )
 from .helpers import (
     async_get_integration_version,
     remove_velop_device_from_registry,
-    remove_velop_entity_from_registry,
+    remove_velop_entities_from_registry,
+    remove_velop_platform_entities_from_registry,
 )
 from .logger import Logger
+from .orchestrator import MeshOrchestrator, get_orchestrator
+from .presence import DhcpPresenceWatcher
+from .request_policy import RequestPolicy
 from .service_handler import LinksysVelopServiceHandler
 
 # endregion
@@ -66,6 +76,33 @@ _PLATFORMS: tuple[Platform, ...] = (
 )
 
 
+def _get_platforms(config_entry: LinksysVelopConfigEntry) -> tuple[Platform, ...]:
+    """Establish the platforms that will have entities.
+
+    Platforms without entities for the capabilities of the mesh and the
+    configured options aren't set up. Both are established again when the
+    config entry is reloaded, which happens when the options change.
+    """
+
+    not_required: set[Platform] = set()
+    if not config_entry.options.get(CONF_DEVICE_TRACKERS):
+        not_required.add(Platform.DEVICE_TRACKER)
+    if not config_entry.options.get(
+        CONF_SELECT_TEMP_UI_DEVICE, DEF_SELECT_TEMP_UI_DEVICE
+    ):
+        not_required.add(Platform.TEXT)
+    if (
+        Actions.GET_UPDATE_FIRMWARE_STATE.key
+        not in config_entry.runtime_data.mesh.capabilities
+    ):
+        not_required.add(Platform.UPDATE)
+
+    ret: tuple[Platform, ...] = tuple(
+        platform for platform in _PLATFORMS if platform not in not_required
+    )
+    return ret
+
+
 async def _async_update_listener(
     hass: HomeAssistant, config_entry: LinksysVelopConfigEntry
 ) -> None:
@@ -186,17 +223,24 @@ async def async_setup_entry(
     _LOGGER.debug("entered")
 
     # region #-- initialise runtime data --#
+    orchestrator: MeshOrchestrator = get_orchestrator(hass)
+    request_timeout: float = config_entry.options.get(
+        CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
+    )
     config_entry.runtime_data = LinksysVelopRuntimeData(
         # log_formatter=log_formatter.format,
         mesh=Mesh(
             node=config_entry.options[CONF_NODE],
             password=config_entry.options[CONF_PASSWORD],
-            request_timeout=config_entry.options.get(
-                CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
-            ),
-            session=async_get_clientsession(hass=hass),
+            request_timeout=request_timeout,
+            session=async_get_clientsession(hass),
             supplementary_redactions=config_entry.options.get(CONF_REDACT_OPTIONS),
         ),
+        request_policy=RequestPolicy(request_timeout),
+    )
+    orchestrator.register(config_entry)
+    config_entry.async_on_unload(
+        partial(orchestrator.unregister, config_entry.entry_id)
     )
     # endregion
 
@@ -230,6 +274,9 @@ async def async_setup_entry(
             _LOGGER.get_logger(),
             coordinator_name,
             config_entry=config_entry,
+            force_refresh_settle_secs=config_entry.options.get(
+                CONF_FORCE_REFRESH_SETTLE, DEF_FORCE_REFRESH_SETTLE_SECS
+            ),
             **update_intervals,
         )
     )
@@ -261,14 +308,29 @@ async def async_setup_entry(
             CoordinatorTypes.SPEEDTEST
         ].async_config_entry_first_refresh()
     # endregion
+
+    # spread the polls out from those of the other meshes
+    config_entry.async_on_unload(orchestrator.async_stagger(config_entry))
     # endregion
 
     # region #-- setup the platforms --#
+    config_entry.runtime_data.platforms = _get_platforms(config_entry)
     _LOGGER.debug(
         "setting up platforms: %s",
-        list(map(str, _PLATFORMS)),
+        list(map(str, config_entry.runtime_data.platforms)),
     )
-    await hass.config_entries.async_forward_entry_setups(config_entry, _PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(
+        config_entry, config_entry.runtime_data.platforms
+    )
+
+    # the text entities are only for the temporary UI device so would be left
+    # behind once it has been turned off. Platforms not set up because of the
+    # capabilities of the mesh keep their entities in case they're reported
+    # again.
+    if config_entry.options.get(CONF_SELECT_TEMP_UI_DEVICE) is False:
+        remove_velop_platform_entities_from_registry(
+            hass, config_entry.entry_id, Platform.TEXT
+        )
     # endregion
 
     # region #-- remove unnecessary ui devices --#
@@ -288,20 +350,22 @@ async def async_setup_entry(
     )
     if mesh_device is not None:
         connections = mesh_device.connections
-    for tracker in new_data.get(CONF_DEVICE_TRACKERS_TO_REMOVE, []):
-        # region #-- remove entity --#
-        remove_velop_entity_from_registry(
-            hass,
-            config_entry.entry_id,
-            f"{config_entry.entry_id}::{Platform.DEVICE_TRACKER}::{tracker}",
-        )
-        # endregion
+    trackers_to_remove: list[str] = new_data.get(CONF_DEVICE_TRACKERS_TO_REMOVE, [])
+    remove_velop_entities_from_registry(
+        hass,
+        config_entry.entry_id,
+        {
+            f"{config_entry.entry_id}::{Platform.DEVICE_TRACKER}::{tracker}"
+            for tracker in trackers_to_remove
+        },
+    )
+    for tracker in trackers_to_remove:
         # region #-- remove connection from the mesh device --#
-        device: list[DeviceEntity]
-        if device := [
-            d for d in config_entry.runtime_data.mesh.devices if d.unique_id == tracker
-        ]:
-            if adapter := list(device[0].adapter_info):
+        device: DeviceEntity | None
+        if (
+            device := get_mesh_index_for_config_entry(config_entry).devices.get(tracker)
+        ) is not None:
+            if adapter := list(device.adapter_info):
                 connections.discard(
                     (
                         dr.CONNECTION_NETWORK_MAC,
@@ -323,6 +387,15 @@ async def async_setup_entry(
     hass.config_entries.async_update_entry(config_entry, data=new_data)
     # endregion
 
+    # region #-- local presence detection for the device trackers --#
+    if config_entry.options.get(CONF_DEVICE_TRACKERS) and config_entry.options.get(
+        CONF_PRESENCE_DHCP, DEF_PRESENCE_DHCP
+    ):
+        presence_watcher: DhcpPresenceWatcher = DhcpPresenceWatcher(hass, config_entry)
+        await presence_watcher.async_start()
+        config_entry.async_on_unload(presence_watcher.async_stop)
+    # endregion
+
     # region #-- listen for config changes --#
     _LOGGER.debug("listening for config changes")
     config_entry.async_on_unload(
@@ -348,8 +421,12 @@ async def async_unload_entry(
     # endregion
 
     # region #-- clean up the platforms --#
-    _LOGGER.debug("cleaning up platforms: %s", _PLATFORMS)
-    ret = await hass.config_entries.async_unload_platforms(config_entry, _PLATFORMS)
+    _LOGGER.debug(
+        "cleaning up platforms: %s", list(map(str, config_entry.runtime_data.platforms))
+    )
+    ret = await hass.config_entries.async_unload_platforms(
+        config_entry, config_entry.runtime_data.platforms
+    )
     # endregion
 
     _LOGGER.debug("exited")
@@ -20,7 +20,7 @@ from pyvelop.mesh import Mesh
 from pyvelop.mesh_attribute import MeshAttribute
 from pyvelop.mesh_entity import AdapterInfo, DeviceEntity, NodeEntity
 
-from .const import CONF_UI_DEVICES, IntensiveTask
+from .const import CONF_STALE_GRACE, CONF_UI_DEVICES, DEF_STALE_GRACE, IntensiveTask
 from .coordinator import (
     CoordinatorTimers,
     CoordinatorTypes,
@@ -28,6 +28,7 @@ from .coordinator import (
     LinksysVelopDataUpdateCoordinatorMultiUse,
     LinksysVelopDataUpdateCoordinatorSpeedtest,
     SpeedtestStatus,
+    get_mesh_index_for_config_entry,
 )
 from .entities import (
     EntityType,
@@ -36,7 +37,7 @@ from .entities import (
     LinksysVelopMultiUseEntity,
     LinksysVelopSpeedtestEntity,
 )
-from .helpers import remove_velop_entity_from_registry
+from .helpers import remove_velop_entities_from_registry
 from .logger import Logger
 
 # endregion
@@ -423,6 +424,33 @@ async def async_setup_entry(
                 )
             )
 
+        if config_entry.options.get(CONF_STALE_GRACE, DEF_STALE_GRACE) > 0:
+
+            def _mesh_coordinator() -> LinksysVelopDataUpdateCoordinatorMultiUse:
+                """Get the mesh coordinator."""
+
+                return cast(
+                    LinksysVelopDataUpdateCoordinatorMultiUse,
+                    config_entry.runtime_data.coordinators.get(CoordinatorTypes.MESH),
+                )
+
+            mesh_entities.append(
+                LinksysVelopBinarySensorEntityDescription(
+                    device_class=BinarySensorDeviceClass.PROBLEM,
+                    entity_category=EntityCategory.DIAGNOSTIC,
+                    esa_fn=lambda _: {
+                        "age": _mesh_coordinator().stale_age,
+                        "failures": _mesh_coordinator().stale_failures,
+                        "since": _mesh_coordinator().stale_since,
+                    },
+                    key="",
+                    name="Stale Data",
+                    target_type=EntityType.MESH,
+                    translation_key="stale_data",
+                    value_fn=lambda _: _mesh_coordinator().stale_since is not None,
+                )
+            )
+
         ret = (
             *[
                 LinksysVelopBinarySensorMultiUseEntity(
@@ -459,32 +487,31 @@ async def async_setup_entry(
         ret: tuple[LinksysVelopBinarySensorCoordinatorEntity, ...] = ()
         ret_temp: list[LinksysVelopBinarySensorCoordinatorEntity] = []
 
-        current_nodes: set[str] = {
-            str(cast(NodeEntity, n).unique_id)
-            for n in config_entry.runtime_data.mesh.nodes
-            if cast(NodeEntity, n).unique_id.value is not None
-        }
-        new_nodes: set[str] = current_nodes - known_nodes
+        new_nodes: set[str] = (
+            get_mesh_index_for_config_entry(config_entry).nodes.keys() - known_nodes
+        )
 
         if new_nodes:
             known_nodes.update(new_nodes)
+            # the same descriptions are used for all nodes
+            mesh_entities: list[LinksysVelopBinarySensorEntityDescription] = []
+
+            mesh_entities.append(
+                LinksysVelopBinarySensorEntityDescription(
+                    device_class=BinarySensorDeviceClass.CONNECTIVITY,
+                    entity_category=EntityCategory.DIAGNOSTIC,
+                    esa_fn=status_extra_attributes,
+                    key="status",
+                    name="Status",
+                    target_type=EntityType.NODE,
+                    translation_key="status",
+                )
+            )
+
             for node in new_nodes:
                 context: LinksysVelopEntityContext = LinksysVelopEntityContext(
                     unique_id=node
                 )
-                mesh_entities: list[LinksysVelopBinarySensorEntityDescription] = []
-
-                mesh_entities.append(
-                    LinksysVelopBinarySensorEntityDescription(
-                        device_class=BinarySensorDeviceClass.CONNECTIVITY,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                        esa_fn=status_extra_attributes,
-                        key="status",
-                        name="Status",
-                        target_type=EntityType.NODE,
-                        translation_key="status",
-                    )
-                )
 
                 ret_temp.extend(
                     [
@@ -518,6 +545,11 @@ async def async_setup_entry(
         ):
             entities_to_remove.add(f"{config_entry.entry_id}::{ENTITY_DOMAIN}::sip")
 
+        if not config_entry.options.get(CONF_STALE_GRACE, DEF_STALE_GRACE):
+            entities_to_remove.add(
+                f"{config_entry.entry_id}::{ENTITY_DOMAIN}::stale_data"
+            )
+
         if (
             Actions.GET_CHANNEL_SCAN_STATUS.key
             not in config_entry.runtime_data.mesh.capabilities
@@ -619,12 +651,9 @@ async def async_setup_entry(
             )
 
         if len(entities_to_remove) > 0:
-            for entity_unique_id in entities_to_remove:
-                remove_velop_entity_from_registry(
-                    hass,
-                    config_entry.entry_id,
-                    entity_unique_id,
-                )
+            remove_velop_entities_from_registry(
+                hass, config_entry.entry_id, entities_to_remove
+            )
 
     def create_node_entities() -> None:
         """Create the node entities.
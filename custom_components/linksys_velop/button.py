@@ -38,6 +38,7 @@ from .coordinator import (
     LinksysVelopConfigEntry,
     LinksysVelopDataUpdateCoordinatorMultiUse,
     LinksysVelopDataUpdateCoordinatorSpeedtest,
+    get_mesh_index_for_config_entry,
 )
 from .entities import (
     EntityType,
@@ -46,8 +47,10 @@ from .entities import (
     LinksysVelopMultiUseEntity,
     LinksysVelopSpeedtestEntity,
 )
-from .helpers import remove_velop_entity_from_registry
+from .helpers import remove_velop_entities_from_registry
 from .logger import Logger
+from .mesh_index import MeshIndex
+from .request_policy import RequestPolicy
 
 # endregion
 
@@ -63,15 +66,34 @@ class LinksysVelopButtonEntityDescription(
     press_fn: Callable[..., Awaitable[None]] | str
 
 
-async def _wait_for_mesh(mesh: Mesh, wait_for_mins: float = 5.0) -> None:
-    """Wait for the mesh to become available."""
+async def _wait_for_mesh(
+    mesh: Mesh, request_policy: RequestPolicy, wait_for_mins: float = 5.0
+) -> None:
+    """Wait for the mesh to become available.
+
+    The pings don't go through the request policy because they are expected
+    to fail whilst the mesh is unavailable, but they are timed out using it.
+    A successful ping lets the coordinators make requests again straight away.
+    """
 
     deadline: float = time.monotonic() + (wait_for_mins * 60)
 
     while time.monotonic() < deadline:
         await asyncio.sleep(10)
-        available: str | None = await mesh.async_ping()
+        available: str | None = None
+        started: float = time.monotonic()
+        try:
+            async with asyncio.timeout(
+                request_policy.get_timeout(mesh.async_ping.__name__)
+            ):
+                available = await mesh.async_ping()
+        except TimeoutError:
+            _LOGGER.debug("timed out waiting for a response to the ping")
         if available == "pong":
+            request_policy.record_success(
+                mesh.async_ping.__name__, time.monotonic() - started
+            )
+            request_policy.close_circuits()
             break
 
 
@@ -98,7 +120,9 @@ async def async_restart_primary_node(config_entry: LinksysVelopConfigEntry) -> N
     # If the mesh doesn't reboot within the given timeframe then there
     # will likely be timeout warnings raised in the system log.
     # Don't want to wait infinitely though because that could cause issues.
-    await _wait_for_mesh(config_entry.runtime_data.mesh)
+    await _wait_for_mesh(
+        config_entry.runtime_data.mesh, config_entry.runtime_data.request_policy
+    )
 
     # region #-- flag reboot complete and send event --#
     config_entry.runtime_data.mesh_is_rebooting = False
@@ -284,41 +308,35 @@ async def async_setup_entry(
 
         ret: tuple[LinksysVelopButtonCoordinatorEntity, ...] = ()
         ret_temp: list[LinksysVelopButtonCoordinatorEntity] = []
-        current_nodes: set[str] = {
-            n.unique_id
-            for n in config_entry.runtime_data.mesh.nodes
-            if n.unique_id is not None
-        }
-        new_nodes: set[str] = current_nodes - known_nodes
+        mesh_index: MeshIndex = get_mesh_index_for_config_entry(config_entry)
+        new_nodes: set[str] = mesh_index.nodes.keys() - known_nodes
 
         if new_nodes:
             known_nodes.update(new_nodes)
+            # the same descriptions are used for all secondary nodes
+            secondary_node_entities: list[LinksysVelopButtonEntityDescription] = []
+
+            secondary_node_entities.append(
+                LinksysVelopButtonEntityDescription(
+                    device_class=ButtonDeviceClass.RESTART,
+                    key="",
+                    name="Reboot",
+                    translation_key="reboot",
+                    target_type=EntityType.NODE,
+                    press_fn="_async_restart_node",
+                )
+            )
+
             for node in new_nodes:
                 mesh_entities: list[LinksysVelopButtonEntityDescription] = []
                 context: LinksysVelopEntityContext = LinksysVelopEntityContext(
                     unique_id=node
                 )
-                node_details: NodeEntity | None = next(
-                    (
-                        n
-                        for n in config_entry.runtime_data.mesh.nodes
-                        if n.unique_id.value == context.unique_id
-                    ),
-                    None,
-                )
+                node_details: NodeEntity | None = mesh_index.nodes.get(node)
 
                 if node_details is not None:
                     if node_details.type == NodeType.SECONDARY:
-                        mesh_entities.append(
-                            LinksysVelopButtonEntityDescription(
-                                device_class=ButtonDeviceClass.RESTART,
-                                key="",
-                                name="Reboot",
-                                translation_key="reboot",
-                                target_type=EntityType.NODE,
-                                press_fn="_async_restart_node",
-                            )
-                        )
+                        mesh_entities = secondary_node_entities
 
                 ret_temp.extend(
                     [
@@ -380,12 +398,9 @@ async def async_setup_entry(
             )
 
         if len(entities_to_remove) > 0:
-            for entity_unique_id in entities_to_remove:
-                remove_velop_entity_from_registry(
-                    hass,
-                    config_entry.entry_id,
-                    entity_unique_id,
-                )
+            remove_velop_entities_from_registry(
+                hass, config_entry.entry_id, entities_to_remove
+            )
 
     def create_node_entities() -> None:
         """Create the node entities.
@@ -7,6 +7,7 @@ import asyncio
 import contextlib
 import logging
 import uuid
+from collections.abc import Iterable
 from enum import StrEnum, auto
 from typing import Any
 
@@ -37,16 +38,20 @@ from . import LinksysVelopConfigEntry
 from .const import (
     CONF_ALLOW_MESH_REBOOT,
     CONF_API_REQUEST_TIMEOUT,
+    CONF_COMPACT_ATTRIBUTES,
     CONF_DEVICE_TRACKERS,
     CONF_DEVICE_TRACKERS_TO_REMOVE,
     CONF_EVENTS_OPTIONS,
     CONF_EVENTS_WAIT_IP,
     CONF_FLOW_NAME,
+    CONF_FORCE_REFRESH_SETTLE,
     CONF_NODE,
     CONF_NODE_IMAGES,
+    CONF_PRESENCE_DHCP,
     CONF_REDACT_OPTIONS,
     CONF_SCAN_INTERVAL_DEVICE_TRACKER,
     CONF_SELECT_TEMP_UI_DEVICE,
+    CONF_STALE_GRACE,
     CONF_TITLE_PLACEHOLDERS,
     CONF_UI_DEVICES,
     CONF_UI_DEVICES_TO_REMOVE,
@@ -54,18 +59,25 @@ from .const import (
     DEF_ALLOW_MESH_REBOOT,
     DEF_API_CONFIG_FLOW_REQUEST_TIMEOUT,
     DEF_API_REQUEST_TIMEOUT,
+    DEF_COMPACT_ATTRIBUTES,
     DEF_CONSIDER_HOME,
     DEF_EVENTS_OPTIONS,
     DEF_EVENTS_WAIT_IP,
     DEF_FLOW_NAME,
+    DEF_FORCE_REFRESH_SETTLE_SECS,
+    DEF_PRESENCE_DHCP,
     DEF_SCAN_INTERVAL,
     DEF_SCAN_INTERVAL_DEVICE_TRACKER,
     DEF_SELECT_TEMP_UI_DEVICE,
+    DEF_STALE_GRACE,
     DOMAIN,
     ST_IGD,
 )
+from .coordinator import CoordinatorTypes, get_mesh_index_for_config_entry
 from .helpers import async_get_integration_version
 from .logger import Logger
+from .mesh_index import MeshIndex
+from .presence import is_dhcp_watch_available
 
 # endregion
 
@@ -141,6 +153,12 @@ async def _async_build_schema_with_user_input(
                         CONF_ALLOW_MESH_REBOOT, DEF_ALLOW_MESH_REBOOT
                     ),
                 ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_COMPACT_ATTRIBUTES,
+                    default=user_input.get(
+                        CONF_COMPACT_ATTRIBUTES, DEF_COMPACT_ATTRIBUTES
+                    ),
+                ): selector.BooleanSelector(),
             }
         )
     elif step == Steps.DEVICE_TRACKERS:
@@ -162,7 +180,11 @@ async def _async_build_schema_with_user_input(
                             for value, label in kwargs["multi_select_contents"].items()
                         ],
                     )
-                )
+                ),
+                vol.Required(
+                    CONF_PRESENCE_DHCP,
+                    default=user_input.get(CONF_PRESENCE_DHCP, DEF_PRESENCE_DHCP),
+                ): selector.BooleanSelector(),
             }
         )
     elif step == Steps.EVENTS:
@@ -248,6 +270,28 @@ async def _async_build_schema_with_user_input(
                         CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
                     ),
                 ): cv.positive_float,
+                vol.Required(
+                    CONF_STALE_GRACE,
+                    default=user_input.get(CONF_STALE_GRACE, DEF_STALE_GRACE),
+                ): selector.NumberSelector(
+                    config=selector.NumberSelectorConfig(
+                        min=0,
+                        mode=selector.NumberSelectorMode.BOX,
+                        step=1,
+                    )
+                ),
+                vol.Required(
+                    CONF_FORCE_REFRESH_SETTLE,
+                    default=user_input.get(
+                        CONF_FORCE_REFRESH_SETTLE, DEF_FORCE_REFRESH_SETTLE_SECS
+                    ),
+                ): selector.NumberSelector(
+                    config=selector.NumberSelectorConfig(
+                        min=0,
+                        mode=selector.NumberSelectorMode.BOX,
+                        step=0.1,
+                    )
+                ),
             }
         )
     elif step == Steps.UI_DEVICE:
@@ -291,17 +335,25 @@ async def _async_build_schema_with_user_input(
     return schema
 
 
-async def _async_get_devices(mesh: Mesh) -> dict[str, str]:
+async def _async_get_devices(
+    mesh: Mesh, mesh_index: MeshIndex | None = None
+) -> dict[str, str]:
     """Get the devices from the mesh for display purposes.
 
     The device unique_id (as per the Mesh) is used as the key.
 
     :param mesh: the Mesh object
+    :param mesh_index: the index from the last poll, used instead of
+    requesting the devices from the mesh when populated
     :return: a dictionary containing the devices to present
     """
     ret: dict = {}
 
-    devices: list[DeviceEntity] = await mesh.async_get_devices()
+    devices: Iterable[DeviceEntity]
+    if mesh_index is not None and mesh_index.devices:
+        devices = mesh_index.devices.values()
+    else:
+        devices = await mesh.async_get_devices()
     for device in devices:
         for adapter in device.adapter_info:
             ret[device.unique_id.value] = f"{device.name} --> {adapter.mac}"
@@ -401,7 +453,10 @@ class LinksysVelopConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             self._errors = {}
             self._options.update(user_input)
-            return await self.async_step_finish()
+            if user_input.get(CONF_PRESENCE_DHCP) and not is_dhcp_watch_available():
+                self._errors["base"] = "presence_unavailable"
+            else:
+                return await self.async_step_finish()
 
         devices: dict = await _async_get_devices(mesh=self._mesh)
 
@@ -707,11 +762,16 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
         _LOGGER.debug("entered, user_input: %s", user_input)
 
         if user_input is not None:
+            self._errors = {}
             self._options.update(user_input)
-            return await self.async_step_ui_device()
+            if user_input.get(CONF_PRESENCE_DHCP) and not is_dhcp_watch_available():
+                self._errors["base"] = "presence_unavailable"
+            else:
+                return await self.async_step_ui_device()
 
         if self._devices is None:
             mesh: Mesh
+            mesh_index: MeshIndex | None = None
             if (mesh := self.config_entry.runtime_data.mesh) is None:
                 mesh = Mesh(
                     node=self._options.get(CONF_NODE),
@@ -721,7 +781,9 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
                     supplementary_redactions=self._options.get(CONF_REDACT_OPTIONS),
                 )
                 await mesh.async_initialise()
-            self._devices = await _async_get_devices(mesh=mesh)
+            elif CoordinatorTypes.MESH in self.config_entry.runtime_data.coordinators:
+                mesh_index = get_mesh_index_for_config_entry(self.config_entry)
+            self._devices = await _async_get_devices(mesh=mesh, mesh_index=mesh_index)
 
         return self.async_show_form(
             step_id=Steps.DEVICE_TRACKERS,
@@ -916,6 +978,7 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
 
         if self._devices is None:
             mesh: Mesh
+            mesh_index: MeshIndex | None = None
             if (mesh := self.config_entry.runtime_data.mesh) is None:
                 mesh = Mesh(
                     node=self._options.get(CONF_NODE),
@@ -925,7 +988,9 @@ class LinksysOptionsFlowHandler(config_entries.OptionsFlow):
                     supplementary_redactions=self._options.get(CONF_REDACT_OPTIONS),
                 )
                 await mesh.async_initialise()
-            self._devices = await _async_get_devices(mesh=mesh)
+            elif CoordinatorTypes.MESH in self.config_entry.runtime_data.coordinators:
+                mesh_index = get_mesh_index_for_config_entry(self.config_entry)
+            self._devices = await _async_get_devices(mesh=mesh, mesh_index=mesh_index)
 
         return self.async_show_form(
             step_id=Steps.UI_DEVICE,
@@ -43,16 +43,20 @@ DOMAIN: str = "linksys_velop"
 
 CONF_ALLOW_MESH_REBOOT: str = "allow_mesh_reboot"
 CONF_API_REQUEST_TIMEOUT: str = "api_request_timeout"
+CONF_COMPACT_ATTRIBUTES: str = "compact_attributes"
 CONF_DEVICE_TRACKERS: str = "tracked"
 CONF_DEVICE_TRACKERS_TO_REMOVE: str = "tracked_to_remove"
 CONF_EVENTS_OPTIONS: str = "events_options"
 CONF_EVENTS_WAIT_IP: str = "events_wait_ip"
 CONF_FLOW_NAME: str = "name"
+CONF_FORCE_REFRESH_SETTLE: str = "force_refresh_settle"
 CONF_REDACT_OPTIONS: str = "redact_options"
 CONF_NODE: str = "node"
 CONF_NODE_IMAGES: str = "node_images"
+CONF_PRESENCE_DHCP: str = "presence_dhcp"
 CONF_SCAN_INTERVAL_DEVICE_TRACKER: str = "scan_interval_device_tracker"
 CONF_SELECT_TEMP_UI_DEVICE: str = "select_temp_ui_device"
+CONF_STALE_GRACE: str = "stale_grace"
 CONF_UI_PLACEHOLDER_DEVICE_ID: str = "ui_placeholder_device_id"
 CONF_TITLE_PLACEHOLDERS: str = "title_placeholders"
 CONF_UI_DEVICES_TO_REMOVE: str = "ui_devices_to_remove"
@@ -62,14 +66,26 @@ DEF_ALLOW_MESH_REBOOT: bool = False
 DEF_API_CONFIG_FLOW_REQUEST_TIMEOUT: int = 60
 DEF_API_REQUEST_TIMEOUT: int = 15
 DEF_CHANNEL_SCAN_PROGRESS_INTERVAL_SECS: float = 40
+DEF_CIRCUIT_BREAKER_COOLDOWN_SECS: float = 120
+DEF_CIRCUIT_BREAKER_THRESHOLD: int = 3
+DEF_COMPACT_ATTRIBUTES: bool = False
 DEF_CONSIDER_HOME: int = 180
 DEF_EVENTS_OPTIONS: list[str] = [event.value for event in EventSubTypes]
 DEF_EVENTS_WAIT_IP: bool = False
 DEF_FLOW_NAME: str = "Linksys Velop Mesh"
+DEF_FORCE_REFRESH_SETTLE_SECS: float = 0.5
+DEF_MAX_POLL_BACKOFF: int = 4
+DEF_PRESENCE_DHCP: bool = False
+DEF_REQUEST_RETRIES: int = 1
+DEF_REQUEST_RETRY_DELAY_SECS: float = 1
+DEF_REQUEST_TIMEOUT_MAX_FACTOR: float = 2
+DEF_REQUEST_TIMEOUT_MIN: float = 3
 DEF_SCAN_INTERVAL: int = 60
 DEF_SCAN_INTERVAL_DEVICE_TRACKER: int = 10
 DEF_SELECT_TEMP_UI_DEVICE: bool = False
 DEF_SPEEDTEST_PROGRESS_INTERVAL_SECS: float = 1
+DEF_STALE_GRACE: int = 0
+DEF_TELEMETRY_HISTORY: int = 50
 
 ISSUE_MISSING_DEVICE_TRACKER: str = "missing_device_tracker"
 ISSUE_MISSING_UI_DEVICE: str = "missing_ui_device"
@@ -82,6 +98,7 @@ except PackageNotFoundError:
     pass
 
 
+SIGNAL_DEVICE_PRESENT: str = f"{DOMAIN}_device_present"
 SIGNAL_UI_PLACEHOLDER_DEVICE_UPDATE: str = f"{DOMAIN}_ui_placeholder_update"
 
 ST_IGD: str = "urn:schemas-upnp-org:device:InternetGatewayDevice:2"
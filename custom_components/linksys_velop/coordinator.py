@@ -6,15 +6,15 @@ import copy
 import logging
 import math
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from dataclasses import dataclass, field
-from datetime import timedelta
+from datetime import datetime, timedelta
 from enum import StrEnum, auto
-from typing import Any
+from typing import Any, cast, override
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -27,28 +27,31 @@ from homeassistant.helpers.device_registry import DeviceEntry, DeviceRegistry
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.issue_registry import IssueSeverity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from pyvelop.exceptions import (
     MeshConnectionError,
-    MeshDeviceNotFoundResponse,
     MeshException,
     MeshInvalidCredentials,
     MeshTimeoutError,
 )
 from pyvelop.mesh import Mesh, SpeedtestResult, SpeedtestStatus
-from pyvelop.mesh_entity import DeviceEntity, NodeEntity, NodeType
+from pyvelop.mesh_entity import DeviceEntity, NodeEntity
 
 from .const import (
     CONF_API_REQUEST_TIMEOUT,
     CONF_DEVICE_TRACKERS,
     CONF_EVENTS_OPTIONS,
     CONF_EVENTS_WAIT_IP,
+    CONF_STALE_GRACE,
     CONF_UI_DEVICES,
     CONF_UI_PLACEHOLDER_DEVICE_ID,
     DEF_API_REQUEST_TIMEOUT,
     DEF_CHANNEL_SCAN_PROGRESS_INTERVAL_SECS,
     DEF_EVENTS_OPTIONS,
     DEF_EVENTS_WAIT_IP,
+    DEF_FORCE_REFRESH_SETTLE_SECS,
     DEF_SPEEDTEST_PROGRESS_INTERVAL_SECS,
+    DEF_STALE_GRACE,
     DOMAIN,
     ISSUE_MISSING_DEVICE_TRACKER,
     ISSUE_MISSING_UI_DEVICE,
@@ -63,8 +66,12 @@ from .exceptions import (
     GeneralException,
     IntensiveTaskRunning,
 )
-from .helpers import get_mesh_parent_node
 from .logger import Logger
+from .mesh_index import MESH_TARGET, MeshIndex
+from .reconcile import MeshChanges, diff_mesh
+from .request_policy import RequestPolicy, RequestTimeoutError
+from .scheduler import DeadlineTimers, MeshActionScheduler
+from .telemetry import CoordinatorTelemetry
 
 # endregion
 
@@ -82,11 +89,23 @@ class LinksysVelopRuntimeData:
     )
     intensive_running_tasks: list[str] = field(default_factory=list)
     mesh_is_rebooting: bool = False
+    platforms: tuple[Platform, ...] = ()
+    request_policy: RequestPolicy = field(default_factory=RequestPolicy)
 
 
 type LinksysVelopConfigEntry = ConfigEntry[LinksysVelopRuntimeData]
 
 
+@dataclass(frozen=True, kw_only=True)
+class ForceRefreshResult:
+    """Details of the refresh that satisfied a forced refresh request."""
+
+    generation: int
+    requests: int
+    success: bool
+    timers: frozenset[str]
+
+
 class CoordinatorTimers(StrEnum):
     """The timer types available to a DataCoordinator."""
 
@@ -137,6 +156,55 @@ class LinksyVelopDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=update_interval_secs),
         )
 
+        self.telemetry: CoordinatorTelemetry = CoordinatorTelemetry()
+
+    @override
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh the data, measuring the cost of doing so.
+
+        The refresh is measured up to the point that the listeners are updated,
+        so that the entities report on this refresh rather than the previous
+        one. The measurement is completed here if the listeners aren't updated.
+        """
+
+        self.telemetry.start()
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            self.telemetry.finish(self.last_update_success)
+
+    @override
+    @callback
+    def async_update_listeners(self) -> None:
+        """Complete the measurement of the refresh before updating listeners."""
+
+        self.telemetry.finish(self.last_update_success)
+        super().async_update_listeners()
+
+    async def _async_request(
+        self, method: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Make a request to the mesh with the timeout from the request policy."""
+
+        return await self.config_entry.runtime_data.request_policy.async_request(
+            method, *args, **kwargs
+        )
+
+    def _get_timeout_for_error(self, err: Exception) -> float:
+        """Get the timeout that applied to the failed request.
+
+        This is the adaptive timeout for the action if that is what fired,
+        otherwise the timeout of the mesh for each request.
+        """
+
+        ret: float = self.config_entry.options.get(
+            CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
+        )
+        if isinstance(err, RequestTimeoutError) and err.timeout is not None:
+            ret = err.timeout
+
+        return ret
+
     async def _debounce(self) -> bool:
         """Return True if the request to the mesh should be delayed."""
 
@@ -174,6 +242,7 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
         name: str,
         config_entry: LinksysVelopConfigEntry,
         update_interval_secs: float,
+        force_refresh_settle_secs: float = DEF_FORCE_REFRESH_SETTLE_SECS,
         **kwargs: float,
     ) -> None:
         """Initialise.
@@ -224,7 +293,27 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
                     }
                 }
             )
+        self._initial_details: bool = False
+        self._stale_grace: int = int(
+            config_entry.options.get(CONF_STALE_GRACE, DEF_STALE_GRACE)
+        )
+        self.stale_failures: int = 0
+        self.stale_since: datetime | None = None
         self._waiting_for_ip: set[str] = set()
+        self.consider_home_timers: DeadlineTimers = DeadlineTimers(hass.loop)
+        self.mesh_index: MeshIndex = MeshIndex()
+        self._scheduler: MeshActionScheduler = MeshActionScheduler(
+            base_interval=update_interval_secs
+        )
+        self._force_refresh_future: asyncio.Future[ForceRefreshResult] | None = None
+        self._force_refresh_generation: int = 0
+        self._force_refresh_lock: asyncio.Lock = asyncio.Lock()
+        self._force_refresh_requests: int = 0
+        self._force_refresh_settle_secs: float = force_refresh_settle_secs
+        self._force_refresh_timers: set[CoordinatorTimers] = set()
+        self._changed_targets: set[str] | None = None
+        self._listeners_last_success: bool = self.last_update_success
+        self._target_listeners: dict[str | None, dict[CALLBACK_TYPE, None]] = {}
         # endregion
 
         # region #-- add a listener --#
@@ -245,6 +334,63 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
                             "unexpected error executing listener for %s", timer_type
                         )
 
+    @override
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates.
+
+        Listeners are bucketed by their context, which is the key of the target
+        in the index, so that only those bound to a changed target are updated.
+        """
+
+        remove_listener: Callable[[], None] = super().async_add_listener(
+            update_callback, context
+        )
+        self._target_listeners.setdefault(context, {})[update_callback] = None
+
+        @callback
+        def _remove_listener() -> None:
+            remove_listener()
+            if (bucket := self._target_listeners.get(context)) is not None:
+                bucket.pop(update_callback, None)
+                if not bucket:
+                    self._target_listeners.pop(context, None)
+
+        return _remove_listener
+
+    @override
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners bound to targets that have changed.
+
+        All listeners are updated if the availability of the coordinator has
+        changed or there are no details of what changed. The time taken to
+        update the listeners is added to the refresh that has just completed.
+        """
+
+        self.telemetry.finish(self.last_update_success)
+        started: float = time.perf_counter()
+        changed_targets: set[str] | None = self._changed_targets
+        self._changed_targets = None
+        update_all: bool = (
+            changed_targets is None
+            or self.last_update_success != self._listeners_last_success
+        )
+        self._listeners_last_success = self.last_update_success
+
+        if update_all:
+            super().async_update_listeners()
+        else:
+            _LOGGER.debug("targets changed: %s", changed_targets)
+            for context, bucket in list(self._target_listeners.items()):
+                if context is None or context in changed_targets:
+                    for update_callback in list(bucket):
+                        update_callback()
+
+        self.telemetry.record_phase("listeners", started)
+
     def add_listener_for_timer_type(
         self, timer_type: CoordinatorTimers, listener: Callable[[], None]
     ) -> Callable[[], None]:
@@ -258,76 +404,74 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
 
         return _unsub
 
+    def _process_missing_trackers(self, trackers_missing: Iterable[str]) -> None:
+        """Raise issues for, or stop tracking, devices no longer on the mesh."""
+
+        entity_registry: er.EntityRegistry = er.async_get(self.hass)
+        for tracker_missing in trackers_missing:
+            tracker_entity: er.RegistryEntry | None = None
+            if (
+                tracker_entity_id := entity_registry.async_get_entity_id(
+                    Platform.DEVICE_TRACKER,
+                    DOMAIN,
+                    f"{self.config_entry.entry_id}::{Platform.DEVICE_TRACKER}::{tracker_missing}",
+                )
+            ) is not None:
+                tracker_entity = entity_registry.async_get(tracker_entity_id)
+            if tracker_entity is not None:
+                # region #-- raise an issue --#
+                ir.async_create_issue(
+                    self.hass,
+                    DOMAIN,
+                    ISSUE_MISSING_DEVICE_TRACKER,
+                    data={
+                        "config_entry": self.config_entry.entry_id,
+                        "device_id": tracker_entity.entity_id,
+                        "device_name": tracker_entity.name
+                        or tracker_entity.original_name,
+                        "velop_id": tracker_missing,
+                    },
+                    is_fixable=True,
+                    is_persistent=False,
+                    severity=IssueSeverity.ERROR,
+                    translation_key=ISSUE_MISSING_DEVICE_TRACKER,
+                    translation_placeholders={
+                        "device_name": tracker_entity.name
+                        or tracker_entity.original_name
+                        or ""
+                    },
+                )
+                # endregion
+            else:
+                # region #-- cleanup the config entry --#
+                new_options = copy.deepcopy(dict(self.config_entry.options))
+                if tracker_missing in new_options.get(CONF_DEVICE_TRACKERS, []):
+                    new_options.get(CONF_DEVICE_TRACKERS, []).remove(tracker_missing)
+                    self.hass.config_entries.async_update_entry(
+                        self.config_entry,
+                        options=new_options,
+                    )
+                # endregion
+
     async def _async_get_device_tracker_data(self) -> list[DeviceEntity]:
-        """Get the device tracker information from the mesh."""
+        """Get the device tracker information from the mesh.
+
+        All devices are returned by the mesh for a single request so the
+        tracked devices are picked out here. This avoids a missing device
+        preventing the others from being updated.
+        """
 
         if await self._debounce():
             return self.data.get(CoordinatorTimers.DEVICE_TRACKER, [])
 
-        devices: list[DeviceEntity] = []
+        all_devices: list[DeviceEntity] | None = None
+        started: float = time.perf_counter()
         try:
-            tracked_devices: tuple[str] = self.config_entry.options.get(
-                CONF_DEVICE_TRACKERS, []
-            )
-            devices = await self.config_entry.runtime_data.mesh.async_get_devices(
-                tracked_devices,
+            self.telemetry.count_request()
+            all_devices = await self._async_request(
+                self.config_entry.runtime_data.mesh.async_get_devices,
                 force_refresh=True,
             )
-        except MeshDeviceNotFoundResponse as err:
-            for tracker_missing in err.devices:
-                entity_registry: er.EntityRegistry = er.async_get(self.hass)
-                config_entities: list[er.RegistryEntry] = (
-                    er.async_entries_for_config_entry(
-                        entity_registry, self.config_entry.entry_id
-                    )
-                )
-                tracker_entity: er.RegistryEntry | None
-                if (
-                    tracker_entity := next(
-                        (
-                            e
-                            for e in config_entities
-                            if e.unique_id
-                            == f"{self.config_entry.entry_id}::{Platform.DEVICE_TRACKER}::{tracker_missing}"
-                        ),
-                        None,
-                    )
-                ) is not None:
-                    # region #-- raise an issue --#
-                    ir.async_create_issue(
-                        self.hass,
-                        DOMAIN,
-                        ISSUE_MISSING_DEVICE_TRACKER,
-                        data={
-                            "config_entry": self.config_entry.entry_id,
-                            "device_id": tracker_entity.entity_id,
-                            "device_name": tracker_entity.name
-                            or tracker_entity.original_name,
-                            "velop_id": tracker_missing,
-                        },
-                        is_fixable=True,
-                        is_persistent=False,
-                        severity=IssueSeverity.ERROR,
-                        translation_key=ISSUE_MISSING_DEVICE_TRACKER,
-                        translation_placeholders={
-                            "device_name": tracker_entity.name
-                            or tracker_entity.original_name
-                            or ""
-                        },
-                    )
-                    # endregion
-                else:
-                    # region #-- cleanup the config entry --#
-                    new_options = copy.deepcopy(dict(self.config_entry.options))
-                    if tracker_missing in new_options.get(CONF_DEVICE_TRACKERS, []):
-                        new_options.get(CONF_DEVICE_TRACKERS, []).remove(
-                            tracker_missing
-                        )
-                        self.hass.config_entries.async_update_entry(
-                            self.config_entry,
-                            options=new_options,
-                        )
-                    # endregion
         except (MeshConnectionError, MeshTimeoutError) as err:
             exc_timeout: DeviceTrackerMeshTimeout = DeviceTrackerMeshTimeout(
                 translation_domain=DOMAIN,
@@ -351,52 +495,97 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
             )
             _LOGGER.warning(exc_general)
             raise UpdateFailed(err) from err
+        finally:
+            self.telemetry.record_phase("fetch", started)
+
+        # region #-- pick out the tracked devices --#
+        devices_by_id: dict[str, DeviceEntity] = {
+            str(device.unique_id.value): device
+            for device in all_devices or []
+            if device.unique_id.value is not None
+        }
+        tracked_devices: list[str] = self.config_entry.options.get(
+            CONF_DEVICE_TRACKERS, []
+        )
+        devices: list[DeviceEntity] = [
+            device
+            for tracked_device in tracked_devices
+            if (device := devices_by_id.get(tracked_device)) is not None
+        ]
+        if trackers_missing := set(tracked_devices).difference(devices_by_id):
+            self._process_missing_trackers(trackers_missing)
+        # endregion
 
         return devices
 
-    async def _async_get_mesh_data(self) -> Mesh:
-        """Get all data from the mesh."""
+    async def _async_get_mesh_devices(self) -> list[DeviceEntity] | None:
+        """Get the details of the devices from the mesh.
 
-        current_devices: set[str] = set()
-        current_nodes_serials: set[str] = set()
-        dr_ui_device: DeviceEntry | None = None
-        previous_devices: set[str] = set()
-        previous_nodes: list[NodeEntity] = []
-        previous_nodes_serials: set[str] = set()
-        device_registry: DeviceRegistry
+        This is used instead of gathering all details when the other details
+        are not due to be refreshed.
+        """
 
-        # region #-- debounce? --#
         if await self._debounce():
-            return self.config_entry.runtime_data.mesh
-        # endregion
+            return None
 
-        # region #-- set the previous details before getting mesh details --#
-        previous_nodes = self.config_entry.runtime_data.mesh.nodes
-        previous_nodes_serials = {
-            node.serial.value
-            for node in previous_nodes
-            if node.serial.value is not None
-        }
-        if EventSubTypes.NEW_DEVICE_FOUND.value in self._configured_events:
-            previous_devices = {
-                device.unique_id.value
-                for device in self.config_entry.runtime_data.mesh.devices
-                if device.unique_id.value is not None
-            }
-        # endregion
+        devices: list[DeviceEntity] | None = None
+        started: float = time.perf_counter()
+        try:
+            self.telemetry.count_request()
+            devices = await self._async_request(
+                self.config_entry.runtime_data.mesh.async_get_devices,
+                force_refresh=True,
+            )
+        except (MeshConnectionError, MeshTimeoutError) as err:
+            if not self.config_entry.runtime_data.mesh_is_rebooting:
+                exc_mesh_timeout: CoordinatorMeshTimeout = CoordinatorMeshTimeout(
+                    translation_domain=DOMAIN,
+                    translation_key="coordinator_mesh_timeout",
+                    translation_placeholders={
+                        "current_timeout": self._get_timeout_for_error(err)
+                    },
+                )
+                _LOGGER.warning(exc_mesh_timeout)
+                raise UpdateFailed(err) from err
+        except MeshInvalidCredentials as err:
+            raise ConfigEntryAuthFailed(
+                translation_domain=DOMAIN,
+                translation_key="failed_login",
+            ) from err
+        except MeshException as err:
+            raise UpdateFailed(type(err).__name__) from err
+        except Exception as err:
+            exc_general: GeneralException = GeneralException(
+                translation_domain=DOMAIN,
+                translation_key="general",
+                translation_placeholders={
+                    "exc_type": type(err).__name__,
+                    "exc_msg": str(err),
+                },
+            )
+            _LOGGER.warning(exc_general)
+            raise UpdateFailed(err) from err
+        finally:
+            self.telemetry.record_phase("fetch", started)
 
-        # region #-- get the details from the mesh --#
+        return devices
+
+    async def _async_gather_details(self) -> None:
+        """Gather all details from the mesh."""
+
+        started: float = time.perf_counter()
         try:
-            await self.config_entry.runtime_data.mesh.async_gather_details()
+            self.telemetry.count_request()
+            await self._async_request(
+                self.config_entry.runtime_data.mesh.async_gather_details
+            )
         except (MeshConnectionError, MeshTimeoutError) as err:
             if not self.config_entry.runtime_data.mesh_is_rebooting:
                 exc_mesh_timeout: CoordinatorMeshTimeout = CoordinatorMeshTimeout(
                     translation_domain=DOMAIN,
                     translation_key="coordinator_mesh_timeout",
                     translation_placeholders={
-                        "current_timeout": self.config_entry.options.get(
-                            CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
-                        )
+                        "current_timeout": self._get_timeout_for_error(err)
                     },
                 )
                 _LOGGER.warning(exc_mesh_timeout)
@@ -419,233 +608,208 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
             )
             _LOGGER.warning(exc_general)
             raise UpdateFailed(err) from err
+        finally:
+            self.telemetry.record_phase("fetch", started)
+
+    def _build_mesh_index(self) -> MeshIndex:
+        """Index the current details of the mesh."""
+
+        ret: MeshIndex = MeshIndex.build(
+            self.config_entry.runtime_data.mesh,
+            self.data.get(CoordinatorTimers.DEVICE_TRACKER, []),
+            mesh_flags=(
+                sorted(self.config_entry.runtime_data.intensive_running_tasks),
+                self.config_entry.runtime_data.mesh_is_rebooting,
+            ),
+        )
+        return ret
+
+    async def _async_get_mesh_data(self) -> MeshIndex:
+        """Get all data from the mesh.
+
+        :return: the index of the mesh details
+        """
+
+        dr_ui_device: DeviceEntry | None = None
+        previous_devices: set[str] | None = None
+        previous_nodes: dict[str, NodeEntity] = {}
+        device_registry: DeviceRegistry
+
+        # region #-- debounce? --#
+        if await self._debounce():
+            return self._build_mesh_index()
         # endregion
 
-        # region #-- get the current details for comparison --#
-        current_nodes_serials = {
-            node.serial.value
+        # region #-- set the previous details before getting mesh details --#
+        previous_nodes = {
+            str(node.serial.value): node
             for node in self.config_entry.runtime_data.mesh.nodes
             if node.serial.value is not None
         }
         if EventSubTypes.NEW_DEVICE_FOUND.value in self._configured_events:
-            current_devices = {
-                device.unique_id.value
+            previous_devices = {
+                str(device.unique_id.value)
                 for device in self.config_entry.runtime_data.mesh.devices
                 if device.unique_id.value is not None
             }
         # endregion
 
+        # region #-- get the details from the mesh --#
+        # the details gathered whilst initialising are used for the first
+        # refresh rather than asking the mesh for them again
+        if self._initial_details:
+            self._initial_details = False
+        else:
+            await self._async_gather_details()
+        # endregion
+
+        # region #-- record the responses for scheduling --#
+        mesh_attributes: dict[str, Any] = getattr(
+            self.config_entry.runtime_data.mesh, "_mesh_attributes", {}
+        )
+        changed_actions: set[str] = self._scheduler.observe(
+            {
+                key: value
+                for key, value in mesh_attributes.items()
+                if key != "processed_devices"
+            },
+            time.monotonic(),
+        )
+        _LOGGER.debug("actions changed since the last gather: %s", changed_actions)
+        # endregion
+
+        # region #-- get the current details for comparison --#
+        started = time.perf_counter()
+        mesh_index: MeshIndex = self._build_mesh_index()
+        self.telemetry.record_phase("index", started)
+
+        started = time.perf_counter()
+        ui_placeholder: str | None = self.config_entry.data.get(
+            CONF_UI_PLACEHOLDER_DEVICE_ID
+        )
+        changes: MeshChanges = diff_mesh(
+            previous_nodes=previous_nodes,
+            mesh_index=mesh_index,
+            previous_devices=previous_devices,
+            ui_devices=(
+                ui_device
+                for ui_device in self.config_entry.options.get(CONF_UI_DEVICES, [])
+                if ui_device != ui_placeholder
+            ),
+        )
+        # endregion
+
         # region #-- update node `device` attributes if we need to --#
-        attr_to_check: set[str] = {"ip", "name", "parent_id"}
         device_registry = dr.async_get(self.hass)
-        prev_node: NodeEntity
-        cur_node: NodeEntity | None
-        for prev_node in previous_nodes:
-            if prev_node.serial.value is not None:
+        for node_serial in changes.node_updates.keys() | changes.node_parents.keys():
+            if (
+                dr_node := device_registry.async_get_device(
+                    identifiers={(DOMAIN, node_serial)}
+                )
+            ) is None:
+                continue
+
+            attr_to_update: dict[str, Any] = dict(
+                changes.node_updates.get(node_serial, {})
+            )
+            if (parent_serial := changes.node_parents.get(node_serial)) is not None:
+                parent_dr_node: DeviceEntry | None = device_registry.async_get_device(
+                    identifiers={(DOMAIN, parent_serial)}
+                )
                 if (
-                    dr_node := device_registry.async_get_device(
-                        identifiers={(DOMAIN, prev_node.serial.value)}
-                    )
-                ) is not None and (
-                    cur_node := next(
-                        (
-                            n
-                            for n in self.config_entry.runtime_data.mesh.nodes
-                            if n.serial.value == prev_node.serial.value
-                        ),
-                        None,
-                    )
-                ) is not None:
-                    attr_to_update: dict[str, Any] = {}
-                    for attr in attr_to_check:
-                        if attr == "ip":
-                            # region #-- update the configuration_url --#
-                            if cur_node.type == NodeType.SECONDARY:
-                                cur_ip: str | None = next(
-                                    filter(
-                                        lambda adi: adi.primary,
-                                        cur_node.adapter_info,
-                                    ),
-                                ).ip
-
-                                prev_ip: str | None = next(
-                                    filter(
-                                        lambda adi: adi.primary,
-                                        prev_node.adapter_info,
-                                    ),
-                                ).ip
-
-                                if cur_ip != prev_ip:
-                                    attr_to_update["configuration_url"] = (
-                                        f"http://{cur_ip}/ca"
-                                        if cur_ip is not None
-                                        else None
-                                    )
-                            # endregion
-                        elif attr == "name":
-                            # region #-- update the name --#
-                            # this doesn't change the visible name in Home Assistant if that was set by the user.
-                            if cur_node.name.value != prev_node.name.value:
-                                attr_to_update["name"] = cur_node.name.value
-                            # endregion
-                        elif attr == "parent_id":
-                            # region #-- update the via_device --#
-                            # this reflects the parent/child relationship on the mesh and only affects secondary nodes.
-                            if cur_node.type.value == NodeType.SECONDARY:
-                                parent_node: NodeEntity | None = get_mesh_parent_node(
-                                    cur_node, self.config_entry.runtime_data.mesh
-                                )
-                                if (
-                                    parent_node is not None
-                                    and parent_node.serial.value is not None
-                                ):
-                                    parent_dr_node: DeviceEntry | None = (
-                                        device_registry.async_get_device(
-                                            identifiers={
-                                                (DOMAIN, parent_node.serial.value)
-                                            }
-                                        )
-                                    )
-                                    if (
-                                        parent_dr_node is not None
-                                        and dr_node.via_device_id != parent_dr_node.id
-                                    ):
-                                        attr_to_update["via_device_id"] = (
-                                            parent_dr_node.id
-                                        )
-                            # endregion
-                    if len(attr_to_update) > 0:
-                        _LOGGER.debug(
-                            "updating the following attributes for %s: %s",
-                            prev_node.name,
-                            attr_to_update,
-                        )
-                        device_registry.async_update_device(
-                            dr_node.id,
-                            **attr_to_update,
-                        )
+                    parent_dr_node is not None
+                    and dr_node.via_device_id != parent_dr_node.id
+                ):
+                    attr_to_update["via_device_id"] = parent_dr_node.id
 
+            if len(attr_to_update) > 0:
+                _LOGGER.debug(
+                    "updating the following attributes for %s: %s",
+                    previous_nodes[node_serial].name,
+                    attr_to_update,
+                )
+                device_registry.async_update_device(
+                    dr_node.id,
+                    **attr_to_update,
+                )
         # endregion
 
         # region #-- update UI device names if we need to --#
-        for ui_device in self.config_entry.options.get(CONF_UI_DEVICES, []):
-            if ui_device != self.config_entry.data.get(CONF_UI_PLACEHOLDER_DEVICE_ID):
-                dr_ui_device = device_registry.async_get_device(
-                    identifiers={(DOMAIN, ui_device)}
-                )
-                cur_ui_device: DeviceEntity | None = next(
-                    (
-                        device
-                        for device in self.config_entry.runtime_data.mesh.devices
-                        if device.unique_id.value == ui_device
-                    ),
-                    None,
+        for ui_device, ui_device_name in changes.ui_device_names.items():
+            dr_ui_device = device_registry.async_get_device(
+                identifiers={(DOMAIN, ui_device)}
+            )
+            if dr_ui_device is not None and ui_device_name != dr_ui_device.name:
+                device_registry.async_update_device(
+                    dr_ui_device.id,
+                    name=ui_device_name,
                 )
-                if (
-                    cur_ui_device is not None
-                    and dr_ui_device is not None
-                    and cur_ui_device.name.value != dr_ui_device.name
-                ):
-                    device_registry.async_update_device(
-                        dr_ui_device.id,
-                        name=cur_ui_device.name.value,
-                    )
         # endregion
 
         # region #-- missing UI devices --#
-        if len(self.config_entry.options.get(CONF_UI_DEVICES, [])) > 0:
-            missing_ui_devices: set[str] = set(
-                self.config_entry.options.get(CONF_UI_DEVICES, [])
-            ).difference(current_devices)
-            missing_ui_devices.discard(
-                self.config_entry.data.get(CONF_UI_PLACEHOLDER_DEVICE_ID)
+        for ui_device in changes.missing_ui_devices:
+            dr_ui_device = device_registry.async_get_device(
+                identifiers={(DOMAIN, ui_device)}
             )
-            if missing_ui_devices:
-                for ui_device in missing_ui_devices:
-                    dr_ui_device: DeviceEntry | None = device_registry.async_get_device(
-                        identifiers={(DOMAIN, ui_device)}
-                    )
-                    if dr_ui_device is not None:
-                        ir.async_create_issue(
-                            self.hass,
-                            DOMAIN,
-                            f"{ISSUE_MISSING_UI_DEVICE}::{ui_device}",
-                            data={
-                                "config_entry": self.config_entry.entry_id,
-                                "device_name": dr_ui_device.name_by_user
-                                or dr_ui_device.name,
-                                "velop_id": ui_device,
-                            },
-                            is_fixable=True,
-                            is_persistent=False,
-                            severity=IssueSeverity.WARNING,
-                            translation_key=ISSUE_MISSING_UI_DEVICE,
-                            translation_placeholders={
-                                "device_name": str(
-                                    dr_ui_device.name_by_user or dr_ui_device.name
-                                )
-                            },
+            if dr_ui_device is not None:
+                ir.async_create_issue(
+                    self.hass,
+                    DOMAIN,
+                    f"{ISSUE_MISSING_UI_DEVICE}::{ui_device}",
+                    data={
+                        "config_entry": self.config_entry.entry_id,
+                        "device_name": dr_ui_device.name_by_user or dr_ui_device.name,
+                        "velop_id": ui_device,
+                    },
+                    is_fixable=True,
+                    is_persistent=False,
+                    severity=IssueSeverity.WARNING,
+                    translation_key=ISSUE_MISSING_UI_DEVICE,
+                    translation_placeholders={
+                        "device_name": str(
+                            dr_ui_device.name_by_user or dr_ui_device.name
                         )
-                    else:  # device not found in the registry so just remove it
-                        new_options = copy.deepcopy(dict(**self.config_entry.options))
-                        if ui_device in new_options.get(CONF_UI_DEVICES, []):
-                            new_options.get(CONF_UI_DEVICES, {}).remove(ui_device)
-                            self.hass.config_entries.async_update_entry(
-                                self.config_entry, options=new_options
-                            )
+                    },
+                )
+            else:  # device not found in the registry so just remove it
+                new_options = copy.deepcopy(dict(**self.config_entry.options))
+                if ui_device in new_options.get(CONF_UI_DEVICES, []):
+                    new_options.get(CONF_UI_DEVICES, {}).remove(ui_device)
+                    self.hass.config_entries.async_update_entry(
+                        self.config_entry, options=new_options
+                    )
         # endregion
 
         # region #-- missing nodes --#
-        if stale_nodes := previous_nodes_serials - current_nodes_serials:
-            for node_serial in stale_nodes:
-                dr_device: DeviceEntry | None = device_registry.async_get_device(
-                    identifiers={(DOMAIN, node_serial)}
+        for node_serial in changes.stale_nodes:
+            dr_device: DeviceEntry | None = device_registry.async_get_device(
+                identifiers={(DOMAIN, node_serial)}
+            )
+            if dr_device is not None:
+                device_registry.async_update_device(
+                    device_id=dr_device.id,
+                    remove_config_entry_id=self.config_entry.entry_id,
                 )
-                if dr_device is not None:
-                    device_registry.async_update_device(
-                        device_id=dr_device.id,
-                        remove_config_entry_id=self.config_entry.entry_id,
-                    )
+        self.telemetry.record_phase("registry", started)
         # endregion
 
         # region #-- check for new nodes --#
+        started = time.perf_counter()
         if EventSubTypes.NEW_NODE_FOUND.value in self._configured_events:
-            new_nodes_serials: set[str] = current_nodes_serials.difference(
-                previous_nodes_serials
-            )
-            node_info: NodeEntity | None
-            for node in new_nodes_serials:
-                if (
-                    node_info := next(
-                        (
-                            n
-                            for n in self.config_entry.runtime_data.mesh.nodes
-                            if n.serial.value == node
-                        ),
-                        None,
-                    )
-                ) is not None:
-                    async_dispatcher_send(
-                        self.hass,
-                        f"{DOMAIN}_{EventSubTypes.NEW_NODE_FOUND.value}",
-                        node_info,
-                    )
+            for node_info in changes.new_nodes:
+                async_dispatcher_send(
+                    self.hass,
+                    f"{DOMAIN}_{EventSubTypes.NEW_NODE_FOUND.value}",
+                    node_info,
+                )
         # endregion
 
         # region #-- new device found --#
         if EventSubTypes.NEW_DEVICE_FOUND.value in self._configured_events:
-            new_devices: set[str] = current_devices.difference(previous_devices)
-            all_new_devices: set[str] = new_devices.union(self._waiting_for_ip)
+            all_new_devices: set[str] = changes.new_devices.union(self._waiting_for_ip)
             device_info: DeviceEntity | None
             for device in all_new_devices:
-                if device_info := next(
-                    (
-                        d
-                        for d in self.config_entry.runtime_data.mesh.devices
-                        if d.unique_id.value == device
-                    ),
-                    None,
-                ):
+                if (device_info := mesh_index.devices.get(device)) is not None:
                     dev_ip = next(
                         (
                             adi
@@ -668,9 +832,10 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
                             f"{DOMAIN}_{EventSubTypes.NEW_DEVICE_FOUND.value}",
                             device_info,
                         )
+        self.telemetry.record_phase("events", started)
         # endregion
 
-        return self.config_entry.runtime_data.mesh
+        return mesh_index
 
     async def _async_setup(self) -> None:
         """Set up the coordinator."""
@@ -709,6 +874,8 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
             ) from exc
         # endregion
 
+        self._initial_details = True
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Refresh the mesh data."""
 
@@ -716,9 +883,8 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
         now: float = time.monotonic()
         _data: dict[str, Any] = copy.copy(self.data)
 
-        # region #-- establish the functions that need to run--#
+        # region #-- establish the timers that need to run--#
         timers_running: list[CoordinatorTimers] = []
-        coro_running: list = []
         for timer_type, timer_data in self._timers.items():
             last_success: float | None = timer_data.get("last_success")
             interval: float = timer_data.get("interval", 0)
@@ -726,59 +892,255 @@ class LinksysVelopDataUpdateCoordinatorMultiUse(LinksyVelopDataUpdateCoordinator
                 last_success is None or math.ceil(now - last_success) >= interval
             )
             if run_update:
-                timer_data["is_running"] = True
-                timers_running.append(timer_type)
-
-                if timer_type == CoordinatorTimers.DEVICE_TRACKER:
-                    coro_running.append(self._async_get_device_tracker_data())
-                elif timer_type == CoordinatorTimers.MESH:
-                    coro_running.append(self._async_get_mesh_data())
-                else:
+                if timer_type not in (
+                    CoordinatorTimers.DEVICE_TRACKER,
+                    CoordinatorTimers.MESH,
+                ):
                     raise UpdateFailed(
                         f"unknown timer type: {timer_type} - cannot update data"
                     )
+                timer_data["is_running"] = True
+                timers_running.append(timer_type)
+        # endregion
+
+        # region #-- establish the requests to make --#
+        # only a single request is made to the mesh per tick.
+        # the full gather includes the devices so if the mesh timer is running
+        # the device trackers are taken from the result of that.
+        coro_running: Coroutine[Any, Any, Any] | None = None
+        full_gather: bool = False
+        if CoordinatorTimers.MESH in timers_running:
+            full_gather = self._scheduler.is_gather_due(now)
+            coro_running = (
+                self._async_get_mesh_data()
+                if full_gather
+                else self._async_get_mesh_devices()
+            )
+            self.telemetry.describe("mesh" if full_gather else "devices")
+        elif CoordinatorTimers.DEVICE_TRACKER in timers_running:
+            coro_running = self._async_get_device_tracker_data()
+            self.telemetry.describe(CoordinatorTimers.DEVICE_TRACKER)
 
         _LOGGER.debug(
-            "retrieving data for the multi use coordinator, %s",
+            "retrieving data for the multi use coordinator, %s (full gather: %s)",
             list(map(str, timers_running)),
+            full_gather,
         )
         # endregion
 
-        # run the tasks
-        res: list = await asyncio.gather(*coro_running)
+        try:
+            res: Any = await coro_running if coro_running is not None else None
+            # region #-- gather everything if the devices show the mesh changed --#
+            # keeps the latency of node changes and the events for new devices
+            # at the base interval however far the full gather has backed off
+            if (
+                CoordinatorTimers.MESH in timers_running
+                and not full_gather
+                and res is not None
+                and self.mesh_index.is_outdated_by(res)
+            ):
+                _LOGGER.debug("the devices show a change to the mesh, gathering")
+                full_gather = True
+                self.telemetry.describe("mesh")
+                res = await self._async_get_mesh_data()
+            # endregion
+        except UpdateFailed:
+            if self.stale_failures >= self._stale_grace:
+                raise
+
+            # region #-- keep the last details for the grace period --#
+            # the entities stay available with their current state, only the
+            # mesh entities are updated so they can report the details are stale.
+            self.stale_failures += 1
+            if self.stale_since is None:
+                self.stale_since = dt_util.utcnow()
+            _LOGGER.debug(
+                "keeping the last details from the mesh (failure %i of %i)",
+                self.stale_failures,
+                self._stale_grace,
+            )
+            for timer in timers_running:
+                self._timers.get(timer, {}).update({"is_running": False})
+            self._changed_targets = {MESH_TARGET}
+            # endregion
+
+            return self.data
+
+        was_stale: bool = self.stale_since is not None
+        self.stale_failures = 0
+        self.stale_since = None
 
         # region #-- set the results and appropriate attributes --#
-        for idx, timer in enumerate(timers_running):
-            _data.update({timer.value: res[idx]})
+        for timer in timers_running:
             self._timers.get(timer, {}).update({"last_success": now})
         # endregion
 
+        # region #-- index the results for the entities --#
+        started: float = time.perf_counter()
+        previous_index: MeshIndex = self.mesh_index
+        if CoordinatorTimers.MESH in timers_running:
+            if full_gather:
+                self.mesh_index = res
+                self.telemetry.record_payload(self.mesh_index.mesh_payload_size)
+            elif res is not None:
+                self.mesh_index = self.mesh_index.with_devices(res)
+            if full_gather or res is not None:
+                self.mesh_index = self.mesh_index.with_offline_since(
+                    previous_index.offline_since, dt_util.utcnow()
+                )
+
+            if CoordinatorTimers.DEVICE_TRACKER in timers_running:
+                tracked_devices: list[str] = self.config_entry.options.get(
+                    CONF_DEVICE_TRACKERS, []
+                )
+                _data[CoordinatorTimers.DEVICE_TRACKER] = [
+                    device
+                    for tracked_device in tracked_devices
+                    if (device := self.mesh_index.devices.get(tracked_device))
+                    is not None
+                ]
+                if (full_gather or res is not None) and (
+                    trackers_missing := set(tracked_devices).difference(
+                        self.mesh_index.devices
+                    )
+                ):
+                    self._process_missing_trackers(trackers_missing)
+        elif CoordinatorTimers.DEVICE_TRACKER in timers_running:
+            _data[CoordinatorTimers.DEVICE_TRACKER] = res
+
+        if CoordinatorTimers.DEVICE_TRACKER in timers_running:
+            self.mesh_index = self.mesh_index.with_tracked_devices(
+                _data.get(CoordinatorTimers.DEVICE_TRACKER, [])
+            )
+        self._changed_targets = self.mesh_index.changed_targets(previous_index)
+        if was_stale:
+            self._changed_targets.add(MESH_TARGET)
+        self.telemetry.record_phase("index", started)
+        # endregion
+
         return _data
 
+    async def _async_run_forced_refresh(self) -> None:
+        """Carry out a forced refresh for all the requests made so far.
+
+        Waits for the settle window so that requests made in quick succession
+        are satisfied by the same refresh.
+        """
+
+        # anything requested before the pending requests are taken is waiting on
+        # this future, so it must be resolved however the task ends
+        future: asyncio.Future[ForceRefreshResult] | None = self._force_refresh_future
+        generation: int = self._force_refresh_generation
+        requests: int = 0
+        timer_cache: dict[CoordinatorTimers, float | None] = {}
+        timers_to_force: set[CoordinatorTimers] = set()
+        try:
+            await asyncio.sleep(self._force_refresh_settle_secs)
+            async with self._force_refresh_lock:
+                # region #-- take the pending requests --#
+                # anything requested from here on will be part of the next refresh
+                timers_to_force = self._force_refresh_timers
+                requests = self._force_refresh_requests
+                self._force_refresh_future = None
+                self._force_refresh_timers = set()
+                self._force_refresh_requests = 0
+                self._force_refresh_generation += 1
+                generation = self._force_refresh_generation
+                # endregion
+
+                if CoordinatorTimers.MESH in timers_to_force:
+                    self._scheduler.expire()
+
+                # region #-- cahce the timers --#
+                for t in timers_to_force:
+                    timer_cache.update({t: self._timers.get(t, {}).get("last_success")})
+                    self._timers.get(t, {}).update({"last_success": None})
+                # endregion
+
+                # region #-- refresh --#
+                _LOGGER.debug(
+                    "forced refresh %s for %s request(s): %s",
+                    generation,
+                    requests,
+                    list(map(str, timers_to_force)),
+                )
+                await self.async_refresh()
+                # endregion
+        except asyncio.CancelledError:
+            # release the callers waiting on the refresh, e.g. when unloading.
+            # the requests are still pending if cancelled whilst settling.
+            if self._force_refresh_future is future:
+                self._force_refresh_future = None
+                self._force_refresh_timers = set()
+                self._force_refresh_requests = 0
+            if future is not None:
+                future.cancel()
+            raise
+        finally:
+            # region #-- restore the cache --#
+            for t in timer_cache:
+                self._timers.get(t, {}).update({"last_success": timer_cache.get(t)})
+            # endregion
+
+            if future is not None and not future.done():
+                future.set_result(
+                    ForceRefreshResult(
+                        generation=generation,
+                        requests=requests,
+                        success=self.last_update_success,
+                        timers=frozenset(timers_to_force),
+                    )
+                )
+
+    @property
+    def action_schedules(self) -> dict[str, dict[str, Any]]:
+        """Get the polling schedule for each of the mesh actions."""
+
+        return self._scheduler.as_dict()
+
+    @property
+    def stale_age(self) -> float | None:
+        """Get the number of seconds that the details have been stale for."""
+
+        ret: float | None = None
+        if self.stale_since is not None:
+            ret = round((dt_util.utcnow() - self.stale_since).total_seconds(), 3)
+        return ret
+
+    @override
+    async def async_shutdown(self) -> None:
+        """Cancel any pending timers when the coordinator is shut down."""
+
+        self.consider_home_timers.cancel_all()
+        await super().async_shutdown()
+
     async def async_force_refresh(
         self, timer: CoordinatorTimers | list[CoordinatorTimers]
-    ) -> None:
-        """Force a refresh of the coordinator data."""
+    ) -> ForceRefreshResult:
+        """Force a refresh of the coordinator data.
+
+        Requests made whilst a refresh is waiting to start are merged, so
+        only a single refresh is made for them.
+
+        :return: details of the refresh that satisfied the request
+        """
 
         timers_to_force: list[CoordinatorTimers] = (
             timer if isinstance(timer, list) else [timer]
         )
 
-        # region #-- cahce the timers --#
-        timer_cache: dict[CoordinatorTimers, float | None] = {}
-        for t in timers_to_force:
-            timer_cache.update({t: self._timers.get(t, {}).get("last_success")})
-            self._timers.get(t, {}).update({"last_success": None})
-        # endregion
-
-        # region #-- refresh --#
-        await self.async_refresh()
-        # endregion
+        self._force_refresh_timers.update(timers_to_force)
+        self._force_refresh_requests += 1
+        if self._force_refresh_future is None:
+            self._force_refresh_future = self.hass.loop.create_future()
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_run_forced_refresh(),
+                f"{self.name} forced refresh",
+            )
 
-        # region #-- restore the cache --#
-        for t in timer_cache:
-            self._timers.get(t, {}).update({"last_success": timer_cache.get(t)})
-        # endregion
+        ret: ForceRefreshResult = await asyncio.shield(self._force_refresh_future)
+        return ret
 
 
 class UpdateCoordinatorChangeableInterval(LinksyVelopDataUpdateCoordinator):
@@ -840,6 +1202,7 @@ class LinksysVelopDataUpdateCoordinatorSpeedtest(UpdateCoordinatorChangeableInte
         """Refresh the Speedtest data."""
 
         _result: SpeedtestResult | list[SpeedtestResult] | None
+        mesh: Mesh = self.config_entry.runtime_data.mesh
         result: SpeedtestResult | None = None
         ret: SpeedtestResult | None
         try:
@@ -848,13 +1211,12 @@ class LinksysVelopDataUpdateCoordinatorSpeedtest(UpdateCoordinatorChangeableInte
 
             _LOGGER.debug("retrieving data for the Speedtest coordinator")
 
+            self.telemetry.count_request()
             if self.update_interval == self.progress_update_interval:
-                _result = (
-                    await self.config_entry.runtime_data.mesh.async_get_speedtest_state()
-                )
+                _result = await self._async_request(mesh.async_get_speedtest_state)
             else:
-                _result = await self.config_entry.runtime_data.mesh.async_get_speedtest_results(
-                    only_latest=True,
+                _result = await self._async_request(
+                    mesh.async_get_speedtest_results, only_latest=True
                 )
         except (MeshConnectionError, MeshTimeoutError) as err:
             if not self.config_entry.runtime_data.mesh_is_rebooting:
@@ -862,9 +1224,7 @@ class LinksysVelopDataUpdateCoordinatorSpeedtest(UpdateCoordinatorChangeableInte
                     translation_domain=DOMAIN,
                     translation_key="coordinator_mesh_timeout",
                     translation_placeholders={
-                        "current_timeout": self.config_entry.options.get(
-                            CONF_API_REQUEST_TIMEOUT, DEF_API_REQUEST_TIMEOUT
-                        )
+                        "current_timeout": self._get_timeout_for_error(err)
                     },
                 )
                 _LOGGER.warning(exc_mesh_timeout)
@@ -896,7 +1256,9 @@ class LinksysVelopDataUpdateCoordinatorSpeedtest(UpdateCoordinatorChangeableInte
             ):
                 if self.update_interval == self.progress_update_interval:
                     self.update_interval = self.normal_update_interval
-                    _result = await self.config_entry.runtime_data.mesh.async_get_speedtest_results(
+                    self.telemetry.count_request()
+                    _result = await self._async_request(
+                        mesh.async_get_speedtest_results,
                         only_latest=True,
                         only_completed=True,
                     )
@@ -911,6 +1273,17 @@ class LinksysVelopDataUpdateCoordinatorSpeedtest(UpdateCoordinatorChangeableInte
         return ret
 
 
+def get_mesh_index_for_config_entry(
+    config_entry: LinksysVelopConfigEntry,
+) -> MeshIndex:
+    """Retrieve the current index of the mesh data."""
+    coordinator: LinksysVelopDataUpdateCoordinatorMultiUse = cast(
+        LinksysVelopDataUpdateCoordinatorMultiUse,
+        config_entry.runtime_data.coordinators.get(CoordinatorTypes.MESH),
+    )
+    return coordinator.mesh_index
+
+
 def get_mesh_device_for_config_entry(
     hass: HomeAssistant, config_entry: LinksysVelopConfigEntry
 ) -> DeviceEntry | None:
@@ -3,7 +3,7 @@
 # region #-- imports --#
 import logging
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, partial
 from typing import Any, cast, override
 
 from homeassistant.components.device_tracker import (
@@ -14,11 +14,11 @@ from homeassistant.components.device_tracker import (
     ScannerEntity,
     ScannerEntityDescription,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceEntry, DeviceRegistry
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from pyvelop.mesh import Mesh
 from pyvelop.mesh_entity import AdapterInfo, DeviceEntity
 
 from .const import (
@@ -30,6 +30,7 @@ from .coordinator import (
     LinksysVelopConfigEntry,
     LinksysVelopDataUpdateCoordinatorMultiUse,
     get_mesh_device_for_config_entry,
+    get_mesh_index_for_config_entry,
 )
 from .entities import (
     EntityType,
@@ -38,6 +39,9 @@ from .entities import (
     LinksysVelopMultiUseEntity,
 )
 from .logger import Logger
+from .mesh_index import MeshIndex
+from .presence import signal_device_present
+from .scheduler import DeadlineTimers
 
 # endregion
 
@@ -62,13 +66,9 @@ async def async_setup_entry(
     device: DeviceEntity | None
     device_trackers: list[LinksysVelopDeviceTrackerCoordinatorEntity] = []
     connections: set[tuple[str, str]] = set()
-    mesh: Mesh = config_entry.runtime_data.mesh
+    mesh_index: MeshIndex = get_mesh_index_for_config_entry(config_entry)
     for tracked_device in config_entry.options.get(CONF_DEVICE_TRACKERS, []):
-        if (
-            device := next(
-                (d for d in mesh.devices if d.unique_id.value == tracked_device), None
-            )
-        ) is not None:
+        if (device := mesh_index.devices.get(tracked_device)) is not None:
             device_trackers.append(
                 LinksysVelopDeviceTrackerMultiUseEntity(
                     coordinator=cast(
@@ -131,48 +131,109 @@ class LinksysVelopDeviceTrackerMultiUseEntity(
     """Representation of a device tracker."""
 
     _is_connected: bool | None = None
-    _offline_first_seen: int | None = None
+
+    @property
+    def _velop_id(self) -> str:
+        """Get the ID of the tracked device."""
+
+        return str(self.entity_context.data.get("velop", {}).get("id"))
 
     def _process_device_update(self) -> None:
-        """Establish device state or attribute changes."""
+        """Establish device state changes.
+
+        This is called when the coordinator has new details for the device.
+        The end of the consider_home period is scheduled with the coordinator
+        when the device goes offline, so it happens when due rather than when
+        the state is next updated.
+        """
 
         device: DeviceEntity | None = self._get_target()
-        if device is not None:
-            if device.status.value != self._is_connected:
-                if device.status.value:
-                    _LOGGER.debug("%s: back online", self.name)
-                    self._is_connected = True
-                else:
-                    if device.results_time is not None:
-                        if self._offline_first_seen is None:
-                            # TODO: change this when pyvelop returns the results_time as int
-                            self._offline_first_seen = int(device.results_time)
-                            _LOGGER.debug(
-                                "%s: waiting for consider_home period %s",
-                                self.name,
-                                self.coordinator.config_entry.options.get(
-                                    CONF_CONSIDER_HOME, DEF_CONSIDER_HOME
-                                ),
-                            )
-                        else:
-                            if int(
-                                device.results_time
-                            ) - self._offline_first_seen >= self.coordinator.config_entry.options.get(
-                                CONF_CONSIDER_HOME, DEF_CONSIDER_HOME
-                            ):
-                                _LOGGER.debug(
-                                    "%s: consider_home period expired",
-                                    self.name,
-                                )
-                                self._is_connected = False
-                                self._offline_first_seen = None
-            else:
-                if self._offline_first_seen is not None:
-                    _LOGGER.debug(
-                        "%s: back online in consider_home period",
-                        self.name,
-                    )
-                    self._offline_first_seen = None
+        if device is None:
+            return
+
+        consider_home_timers: DeadlineTimers = self.coordinator.consider_home_timers
+        if device.status.value:
+            if self._velop_id in consider_home_timers:
+                _LOGGER.debug(
+                    "%s: back online in consider_home period",
+                    self.name,
+                )
+                consider_home_timers.cancel(self._velop_id)
+            if not self._is_connected:
+                _LOGGER.debug("%s: back online", self.name)
+                self._is_connected = True
+        elif (
+            self._is_connected is not False
+            and self._velop_id not in consider_home_timers
+        ):
+            self._schedule_consider_home()
+
+    def _schedule_consider_home(self) -> None:
+        """Start the consider_home period for the device."""
+
+        consider_home: float = self.coordinator.config_entry.options.get(
+            CONF_CONSIDER_HOME, DEF_CONSIDER_HOME
+        )
+        _LOGGER.debug(
+            "%s: waiting for consider_home period %s",
+            self.name,
+            consider_home,
+        )
+        self.coordinator.consider_home_timers.schedule(
+            self._velop_id, consider_home, self._async_consider_home_expired
+        )
+
+    @callback
+    def _async_consider_home_expired(self) -> None:
+        """Mark the device as away at the end of the consider_home period."""
+
+        _LOGGER.debug("%s: consider_home period expired", self.name)
+        self._is_connected = False
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_device_present(self) -> None:
+        """Mark the device as home when it has been seen on the local network.
+
+        If the mesh still has the device as offline the consider_home period
+        is started again from the sighting. The details of the device may not
+        change on the next poll, so nothing else would mark it as away.
+        """
+
+        consider_home_timers: DeadlineTimers = self.coordinator.consider_home_timers
+        if not self._is_connected or self._velop_id in consider_home_timers:
+            _LOGGER.debug("%s: seen on the local network", self.name)
+            consider_home_timers.cancel(self._velop_id)
+            self._is_connected = True
+            device: DeviceEntity | None = self._get_target()
+            if device is not None and not device.status.value:
+                self._schedule_consider_home()
+            self.async_write_ha_state()
+
+    @callback
+    @override
+    def _handle_coordinator_update(self) -> None:
+        """Process the new details for the device before updating the state."""
+
+        self._process_device_update()
+        super()._handle_coordinator_update()
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+
+        self._process_device_update()
+        self.async_on_remove(
+            partial(self.coordinator.consider_home_timers.cancel, self._velop_id)
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal_device_present(self.coordinator.config_entry, self._velop_id),
+                self._handle_device_present,
+            )
+        )
 
     @property
     @override
@@ -194,7 +255,6 @@ class LinksysVelopDeviceTrackerMultiUseEntity(
     @override
     def is_connected(self) -> bool | None:
 
-        self._process_device_update()
         return self._is_connected
 
     @cached_property
@@ -3,8 +3,9 @@
 # region #-- imports --#
 from __future__ import annotations
 
-import copy
 import logging
+import time
+from collections.abc import Iterable
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -12,7 +13,13 @@ from pyvelop.action_registry import Actions
 from pyvelop.mesh import Mesh
 
 from .const import CONF_REDACT_OPTIONS
-from .coordinator import LinksysVelopConfigEntry
+from .coordinator import (
+    CoordinatorTypes,
+    LinksysVelopConfigEntry,
+    LinksysVelopDataUpdateCoordinatorMultiUse,
+    LinksyVelopDataUpdateCoordinator,
+)
+from .orchestrator import get_orchestrator
 
 # endregion
 
@@ -21,40 +28,64 @@ _LOGGER = logging.getLogger(__name__)
 DEF_REDACTED: str = "**REDACTED**"
 
 
-def redact(data: dict[str, Any], to_redact: set[str] = set()) -> dict[str, Any]:
-    """Redact sensitive data in a dict. Dotted paths may traverse dicts and lists."""
-    ret: dict[str, Any] = copy.copy(data)
+type RedactionTrie = dict[str, RedactionTrie]
 
-    def apply_redaction(obj: Any, parts: list[str]) -> None:
-        if not parts:
-            return
-
-        # If we're at the final key, redact it wherever obj is a dict.
-        if len(parts) == 1:
-            key = parts[0]
-            if isinstance(obj, dict) and key in obj:
-                obj[key] = DEF_REDACTED
-            elif isinstance(obj, list):
-                for item in obj:
-                    apply_redaction(item, parts)
-            return
-
-        # Still have more segments to traverse.
-        head = parts[0]
-        tail = parts[1:]
-
-        if isinstance(obj, dict):
-            if head in obj:
-                apply_redaction(obj[head], tail)
-
-        elif isinstance(obj, list):
-            for item in obj:
-                apply_redaction(item, parts)
+# marks the end of a path in the trie, empty segments are dropped from the
+# paths so this can't clash with a key
+_REDACT_HERE: str = ""
+
+
+def _compile_redactions(to_redact: Iterable[str]) -> RedactionTrie:
+    """Compile the dotted paths into a trie keyed on each segment."""
+    ret: RedactionTrie = {}
 
     for redaction in to_redact:
         parts = [p for p in redaction.split(".") if p]
-        if parts:
-            apply_redaction(ret, parts)
+        if not parts:
+            continue
+
+        node: RedactionTrie = ret
+        for part in parts:
+            node = node.setdefault(part, {})
+        node[_REDACT_HERE] = {}
+
+    return ret
+
+
+def _apply_redactions(obj: Any, trie: RedactionTrie) -> Any:
+    """Redact the object in a single pass.
+
+    Lists are traversed transparently. Containers are only copied when
+    something inside them is redacted, everything else is shared with the
+    original object, which is left untouched.
+    """
+    ret: Any = obj
+
+    if isinstance(obj, list):
+        redacted: list[Any] = [_apply_redactions(item, trie) for item in obj]
+        if any(new is not old for new, old in zip(redacted, obj, strict=True)):
+            ret = redacted
+    elif isinstance(obj, dict):
+        for key, node in trie.items():
+            if key == _REDACT_HERE or key not in obj:
+                continue
+
+            value: Any = (
+                DEF_REDACTED
+                if _REDACT_HERE in node
+                else _apply_redactions(obj[key], node)
+            )
+            if value is not obj[key]:
+                if ret is obj:
+                    ret = dict(obj)
+                ret[key] = value
+
+    return ret
+
+
+def redact(data: dict[str, Any], to_redact: set[str] = set()) -> dict[str, Any]:
+    """Redact sensitive data in a dict. Dotted paths may traverse dicts and lists."""
+    ret: dict[str, Any] = _apply_redactions(data, _compile_redactions(to_redact))
 
     return ret
 
@@ -63,6 +94,7 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, config_entry: LinksysVelopConfigEntry
 ) -> dict[str, Any]:
     """Diagnostics for the config entry."""
+    started: float = time.perf_counter()
     mesh: Mesh = config_entry.runtime_data.mesh
     mesh_attributes: dict = getattr(mesh, "_mesh_attributes")
 
@@ -95,10 +127,34 @@ async def async_get_config_entry_diagnostics(
         redactions: set[str] = default_redactions.union(supplementary_redactions)
         to_redact.update([f"mesh_details.{action.key}.{r}" for r in redactions])
 
+    collected: float = time.perf_counter()
     ret = redact(
         ret,
         to_redact,
     )
     # endregion
 
+    # region #-- add the telemetry for the coordinators --#
+    coordinators: dict[CoordinatorTypes, Any] = config_entry.runtime_data.coordinators
+    ret["telemetry"] = {
+        coordinator_type: coordinator.telemetry.as_dict()
+        for coordinator_type, coordinator in coordinators.items()
+        if isinstance(coordinator, LinksyVelopDataUpdateCoordinator)
+    }
+    mesh_coordinator: LinksysVelopDataUpdateCoordinatorMultiUse | None
+    if (mesh_coordinator := coordinators.get(CoordinatorTypes.MESH)) is not None:
+        ret["action_schedules"] = mesh_coordinator.action_schedules
+        ret["topology"] = mesh_coordinator.mesh_index.topology_as_dict()
+    ret["orchestrator"] = get_orchestrator(hass).as_dict()
+    ret["request_policy"] = config_entry.runtime_data.request_policy.as_dict()
+    # endregion
+
+    # region #-- report the time taken --#
+    redacted: float = time.perf_counter()
+    ret["timings"] = {
+        "collect_ms": round((collected - started) * 1000, 3),
+        "redact_ms": round((redacted - collected) * 1000, 3),
+    }
+    # endregion
+
     return ret
@@ -4,7 +4,7 @@
 import logging
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
-from typing import Any, cast, override
+from typing import Any, override
 
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
@@ -13,7 +13,6 @@ from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
 from homeassistant.util import slugify
-from pyvelop.mesh import Mesh
 from pyvelop.mesh_entity import DeviceEntity, NodeAdapterInfo, NodeEntity, NodeType
 
 from .const import (
@@ -29,8 +28,8 @@ from .coordinator import (
     LinksysVelopDataUpdateCoordinatorMultiUse,
     LinksysVelopDataUpdateCoordinatorSpeedtest,
 )
-from .helpers import get_mesh_parent_node
 from .logger import Logger
+from .mesh_index import MESH_TARGET, device_target, node_target, tracker_target
 
 # endregion
 
@@ -58,6 +57,40 @@ class LinksysVelopEntityDescription(EntityDescription):
     """Describes Velop switch entity."""
 
     target_type: EntityType
+    update_every_refresh: bool = False
+
+
+def _get_target_key(
+    coordinator: LinksysVelopDataUpdateCoordinatorMultiUse,
+    description: LinksysVelopEntityDescription,
+    entity_context: LinksysVelopEntityContext,
+) -> str | None:
+    """Get the key of the target in the index.
+
+    The key is used as the context for the coordinator listener so that the
+    entity is only updated when the target changes. The placeholder device
+    can change target, and some entities report on the refresh itself, so
+    these are always updated.
+    """
+
+    ret: str | None = None
+
+    if description.update_every_refresh:
+        ret = None
+    elif description.target_type == EntityType.DEVICE:
+        if entity_context.unique_id != coordinator.config_entry.data.get(
+            CONF_UI_PLACEHOLDER_DEVICE_ID
+        ):
+            ret = device_target(str(entity_context.unique_id))
+    elif description.target_type == EntityType.MESH:
+        if (tracker_id := entity_context.data.get("velop", {}).get("id")) is not None:
+            ret = tracker_target(str(tracker_id))
+        else:
+            ret = MESH_TARGET
+    elif description.target_type == EntityType.NODE:
+        ret = node_target(str(entity_context.unique_id))
+
+    return ret
 
 
 class LinksysVelopMultiUseEntity(
@@ -78,7 +111,10 @@ class LinksysVelopMultiUseEntity(
     ) -> None:
         """Initialise entity."""
 
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=_get_target_key(coordinator, description, entity_context),
+        )
 
         # region #-- custom attributes --#
         self.entity_context: LinksysVelopEntityContext = entity_context
@@ -195,44 +231,17 @@ class LinksysVelopMultiUseEntity(
             )
 
             if unique_id is not None:
-                ret = next(
-                    (
-                        d
-                        for d in cast(
-                            Mesh, self.coordinator.data.get(CoordinatorTimers.MESH)
-                        ).devices
-                        if d.unique_id.value == unique_id
-                    ),
-                    None,
-                )
+                ret = self.coordinator.mesh_index.devices.get(unique_id)
         elif self.entity_description.target_type == EntityType.MESH:
-            if self.entity_context.data.get("velop", {}).get("id") is not None:
-                ret = next(
-                    (
-                        d
-                        for d in cast(
-                            list[DeviceEntity],
-                            self.coordinator.data.get(
-                                CoordinatorTimers.DEVICE_TRACKER, []
-                            ),
-                        )
-                        if d.unique_id.value
-                        == self.entity_context.data.get("velop", {}).get("id")
-                    ),
-                    None,
-                )
+            if (
+                tracker_id := self.entity_context.data.get("velop", {}).get("id")
+            ) is not None:
+                ret = self.coordinator.mesh_index.trackers.get(tracker_id)
             else:
                 ret = self.coordinator.data.get(CoordinatorTimers.MESH)
         elif self.entity_description.target_type == EntityType.NODE:
-            ret = next(
-                (
-                    n
-                    for n in cast(
-                        Mesh, self.coordinator.data.get(CoordinatorTimers.MESH)
-                    ).nodes
-                    if n.unique_id.value == self.entity_context.unique_id
-                ),
-                None,
+            ret = self.coordinator.mesh_index.nodes.get(
+                str(self.entity_context.unique_id)
             )
 
         return ret
@@ -27,7 +27,7 @@ from .entities import (
     LinksysVelopEntityDescription,
     LinksysVelopMultiUseEntity,
 )
-from .helpers import remove_velop_entity_from_registry
+from .helpers import remove_velop_entities_from_registry
 from .logger import Logger
 
 # endregion
@@ -115,12 +115,9 @@ async def async_setup_entry(
         entities_to_remove: set[str] = set()
 
         if len(entities_to_remove) > 0:
-            for entity_unique_id in entities_to_remove:
-                remove_velop_entity_from_registry(
-                    hass,
-                    config_entry.entry_id,
-                    entity_unique_id,
-                )
+            remove_velop_entities_from_registry(
+                hass, config_entry.entry_id, entities_to_remove
+            )
 
     def create_node_entities() -> None:
         """Create the node entities.
@@ -1,7 +1,9 @@
 """Helpers."""
 
 # region #-- imports --#
+import hashlib
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from awesomeversion import AwesomeVersion
@@ -10,9 +12,8 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry, DeviceRegistry
 from homeassistant.helpers.entity_registry import EntityRegistry, RegistryEntry
+from homeassistant.helpers.json import json_bytes_sorted
 from homeassistant.loader import Integration, async_get_integration
-from pyvelop.mesh import Mesh
-from pyvelop.mesh_entity import AdapterInfo, NodeEntity
 
 from .const import DOMAIN
 from .logger import Logger
@@ -23,35 +24,24 @@ from .logger import Logger
 _LOGGER: Logger = Logger(logging.getLogger(__name__))
 
 
-def get_mesh_parent_node(node: NodeEntity, mesh: Mesh) -> NodeEntity | None:
-    """Retrieve the parent node from the mesh."""
+def compact_attributes(
+    attributes: dict[str, Any], keys: Iterable[str]
+) -> dict[str, Any]:
+    """Replace the given attributes with a count and digest of their contents.
 
-    parent_node: NodeEntity | None = None
+    The digest is stable so it only changes when the contents do.
+    """
 
-    # region #-- get the primary adapater for the node --#
-    adapter_main: AdapterInfo | None = next(
-        (adi for adi in node.adapter_info if adi.primary),
-        None,
-    )
-    # endregion
-
-    # region #-- get the parent based on ID --#
-    if adapter_main:
-        parent_node = next(
-            (n for n in mesh.nodes if n.unique_id == adapter_main.parent_id),
-            None,
-        )
-    # endregion
+    ret: dict[str, Any] = dict(attributes)
+    for key in keys:
+        if (value := ret.pop(key, None)) is None:
+            continue
+        ret[f"{key}_count"] = len(value)
+        ret[f"{key}_digest"] = hashlib.blake2b(
+            json_bytes_sorted(value), digest_size=8
+        ).hexdigest()
 
-    # region #-- if we don't have the parent yet lookup based on name --#
-    if parent_node is None:
-        parent_node = next(
-            (n for n in mesh.nodes if n.name == node.parent_name),
-            None,
-        )
-    # endregion
-
-    return parent_node
+    return ret
 
 
 def remove_velop_device_from_registry(hass: HomeAssistant, device_id: str) -> None:
@@ -67,23 +57,49 @@ def remove_velop_device_from_registry(hass: HomeAssistant, device_id: str) -> No
         _LOGGER.debug("remove_velop_device_from_registry: device not found")
 
 
-def remove_velop_entity_from_registry(
-    hass: HomeAssistant, config_entry_id: str, unique_id: str
+def remove_velop_entities_from_registry(
+    hass: HomeAssistant, config_entry_id: str, unique_ids: Iterable[str]
+) -> int:
+    """Remove entities from the registry.
+
+    The entities for the config entry are only looked up once, however many
+    are to be removed.
+
+    :param hass: the Home Assistant instance
+    :param config_entry_id: the config entry that the entities belong to
+    :param unique_ids: the unique_ids of the entities to remove
+    :return: the number of entities that were removed
+    """
+
+    ret: int = 0
+    to_remove: set[str] = set(unique_ids)
+    entity_registry: EntityRegistry = er.async_get(hass)
+    config_entities: list[RegistryEntry] = er.async_entries_for_config_entry(
+        entity_registry, config_entry_id
+    )
+    for entity in config_entities:
+        if entity.unique_id in to_remove:
+            _LOGGER.debug("removing %s", entity.entity_id)
+            entity_registry.async_remove(entity.entity_id)
+            ret += 1
+
+    _LOGGER.debug("removed %i of %i entities", ret, len(to_remove))
+    return ret
+
+
+def remove_velop_platform_entities_from_registry(
+    hass: HomeAssistant, config_entry_id: str, platform: str
 ) -> None:
-    """Remove an entity from the registry."""
+    """Remove all entities for the given platform from the registry."""
 
     entity_registry: EntityRegistry = er.async_get(hass)
     config_entities: list[RegistryEntry] = er.async_entries_for_config_entry(
         entity_registry, config_entry_id
     )
-    found_entity: RegistryEntry | None = None
-    if (
-        found_entity := next(
-            (e for e in config_entities if e.unique_id == unique_id), None
-        )
-    ) is not None:
-        _LOGGER.debug("removing %s", found_entity.entity_id)
-        entity_registry.async_remove(found_entity.entity_id)
+    for entity in config_entities:
+        if entity.domain == platform:
+            _LOGGER.debug("removing %s", entity.entity_id)
+            entity_registry.async_remove(entity.entity_id)
 
 
 async def async_get_integration_version(hass: HomeAssistant) -> AwesomeVersion | None:
@@ -1,8 +1,8 @@
 """Logging wrapper."""
 
 # region #-- imports --#
-import inspect
 import logging
+import sys
 from types import FrameType
 from typing import Any
 
@@ -23,36 +23,32 @@ class Logger:
         return getattr(self._logger, name)
 
     def _format(self, msg: str) -> str:
-        """Format the message using as required."""
+        """Prefix the message with the function name and line of the caller.
+
+        The frame is taken directly from the stack rather than via `inspect`,
+        which would read the source file to build the details.
+        """
 
         ret: str = msg
-        caller_details: dict[str, Any] | None = None
-        frame: FrameType | None = inspect.currentframe()
+        # 0 is this function, 1 is the logging method and 2 is the caller
+        caller: FrameType | None = sys._getframe(2)
         try:
-            if frame is not None:
-                caller: FrameType | None = frame.f_back
-                if caller is not None:
-                    caller_class: Any = caller.f_locals.get("self")
-                    if caller_class == self:  # go back again in the stack
-                        caller = caller.f_back
-                    if caller is not None:
-                        caller_info: inspect.Traceback = inspect.getframeinfo(caller)
-                        caller_details = {
-                            "line_no": caller_info.lineno,
-                            "func_name": caller_info.function,
-                        }
+            if caller is not None:
+                ret = f"{caller.f_code.co_name}:{caller.f_lineno}:{msg}"
         finally:
-            del frame
-
-        if caller_details is not None:
-            ret = f"{caller_details.get("func_name")}:{caller_details.get("line_no")}:{msg}"
+            del caller
 
         return ret
 
     def debug(self, msg: str, *args: Any) -> None:
-        """Passthrough for the debug logger."""
+        """Passthrough for the debug logger.
+
+        Nothing is done if debug logging is disabled. The arguments are only
+        merged in to the message if the record is emitted.
+        """
 
-        self._logger.debug(self._format(msg % args))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format(msg), *args)
 
     def get_logger(self) -> logging.Logger:
         """Return the logger that was initially passed in."""
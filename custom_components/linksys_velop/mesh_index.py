@@ -0,0 +1,700 @@
+"""Indexed snapshot of the mesh data."""
+
+# region #-- imports --#
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Self
+
+from pyvelop.mesh import Mesh
+from pyvelop.mesh_attribute import MeshAttribute
+from pyvelop.mesh_entity import (
+    AdapterInfo,
+    DeviceEntity,
+    MeshEntity,
+    NodeEntity,
+    NodeType,
+)
+
+# endregion
+
+DEVICE_FACETS: tuple[str, ...] = ("band", "guest_network", "node", "online")
+DEVICE_FIELDS: tuple[str, ...] = (
+    "band",
+    "guest_network",
+    "id",
+    "ip",
+    "ipv6",
+    "mac",
+    "name",
+    "node",
+    "offline_since",
+    "online",
+    "type",
+)
+MESH_TARGET: str = "mesh"
+
+
+def device_target(unique_id: str) -> str:
+    """Return the key used for the given device in the index."""
+
+    return f"device::{unique_id}"
+
+
+def node_target(unique_id: str) -> str:
+    """Return the key used for the given node in the index."""
+
+    return f"node::{unique_id}"
+
+
+def tracker_target(unique_id: str) -> str:
+    """Return the key used for the given tracked device in the index."""
+
+    return f"tracker::{unique_id}"
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialise the objects that json doesn't understand."""
+
+    ret: Any
+    if isinstance(obj, MeshAttribute):
+        ret = obj.to_dict(include_audit=False)
+    elif callable(getattr(obj, "to_dict", None)):
+        ret = obj.to_dict()
+    elif hasattr(obj, "__dict__"):
+        ret = vars(obj)
+    else:
+        ret = str(obj)
+
+    return ret
+
+
+def _fingerprint_entity(obj: MeshEntity, exclude: Iterable[str] = ()) -> int:
+    """Fingerprint the details of a device or node.
+
+    The details are those received from the mesh for the entity, which its
+    properties are built from, so the properties don't need to be visited.
+    """
+
+    details: dict[str, Any] = getattr(obj, "_data", {})
+    excluded: set[str] = set(exclude)
+
+    return hash(
+        json.dumps(
+            {key: value for key, value in details.items() if key not in excluded},
+            default=_json_default,
+            sort_keys=True,
+        )
+    )
+
+
+def _serialise_mesh(mesh: Mesh, *flags: Any) -> str:
+    """Serialise the raw responses held by the mesh for fingerprinting.
+
+    The processed devices are excluded because they are built from the raw
+    responses, which are already included.
+    """
+
+    mesh_attributes: dict[str, Any] = getattr(mesh, "_mesh_attributes", {})
+    details: dict[str, Any] = {
+        key: value
+        for key, value in mesh_attributes.items()
+        if key != "processed_devices"
+    }
+
+    return json.dumps([details, flags], default=_json_default, sort_keys=True)
+
+
+def _summarise_device(device: DeviceEntity) -> dict[str, Any]:
+    """Summarise a device for the attributes of the mesh entities."""
+
+    ret: dict[str, Any] = {
+        "name": device.name.value,
+        "id": device.unique_id.value,
+    }
+    adi: AdapterInfo | None = next(iter(device.adapter_info), None)
+    if adi is not None and device.status.value:
+        ret["type"] = adi.type.value
+        ret["guest_network"] = adi.guest_network
+        ret["ip"] = adi.ip
+        ret["ipv6"] = adi.ipv6
+        ret["parent_name"] = device.parent_name.value
+
+    return ret
+
+
+def _describe_device(
+    device: DeviceEntity, offline_since: datetime | None
+) -> dict[str, Any]:
+    """Describe a device for querying.
+
+    The details of the connection are only included for online devices
+    because offline devices keep the details that they last had.
+    """
+
+    ret: dict[str, Any] = dict.fromkeys(DEVICE_FIELDS)
+    ret.update(
+        {
+            "id": device.unique_id.value,
+            "name": device.name.value,
+            "offline_since": (
+                offline_since.isoformat() if offline_since is not None else None
+            ),
+            "online": bool(device.status),
+        }
+    )
+    adi: AdapterInfo | None = next(iter(device.adapter_info), None)
+    if adi is not None:
+        ret["mac"] = adi.mac
+        if device.status:
+            ret["band"] = getattr(adi, "band", None)
+            ret["guest_network"] = bool(adi.guest_network)
+            ret["ip"] = adi.ip
+            ret["ipv6"] = adi.ipv6
+            ret["node"] = device.parent_name.value
+            ret["type"] = adi.type.value
+
+    return ret
+
+
+def facet_value(value: Any) -> Any:
+    """Normalise a value so that it can be used to look up a facet."""
+
+    ret: Any = str(value).casefold() if isinstance(value, str) else value
+    return ret
+
+
+@dataclass(frozen=True, kw_only=True)
+class NodePosition:
+    """The position of a node on the mesh.
+
+    `parent` and `children` are the unique_ids of the nodes. `hops` is the
+    number of hops to the primary node, None if the path to the primary
+    node can't be established.
+    """
+
+    backhaul: str | None = None
+    children: tuple[str, ...] = ()
+    device_count: int = 0
+    hops: int | None = None
+    parent: str | None = None
+    parent_name: str | None = None
+
+
+def _freeze[T](items: dict[str, T]) -> Mapping[str, T]:
+    """Return a read-only view of the given dictionary."""
+
+    return MappingProxyType(items)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeshIndex:
+    """Immutable lookup tables built once per refresh of the mesh.
+
+    Entities resolve their target through here instead of scanning the lists
+    provided by the Mesh object, which are rebuilt on each access.
+
+    Aggregates of the devices are calculated on first use and kept for the
+    life of the index, so they are shared by all entities until the next
+    refresh.
+    """
+
+    devices: Mapping[str, DeviceEntity] = field(default_factory=lambda: _freeze({}))
+    nodes: Mapping[str, NodeEntity] = field(default_factory=lambda: _freeze({}))
+    nodes_by_serial: Mapping[str, NodeEntity] = field(
+        default_factory=lambda: _freeze({})
+    )
+    trackers: Mapping[str, DeviceEntity] = field(default_factory=lambda: _freeze({}))
+    lookup: Mapping[str, tuple[DeviceEntity, ...]] = field(
+        default_factory=lambda: _freeze({})
+    )
+    topology: Mapping[str, NodePosition] = field(default_factory=lambda: _freeze({}))
+    fingerprints: Mapping[str, int] = field(default_factory=lambda: _freeze({}))
+    mesh_payload_size: int = 0
+    offline_since: Mapping[str, datetime] = field(default_factory=lambda: _freeze({}))
+
+    @classmethod
+    def build(
+        cls,
+        mesh: Mesh,
+        tracked_devices: Iterable[DeviceEntity] = (),
+        mesh_flags: tuple[Any, ...] = (),
+    ) -> Self:
+        """Build the index from the current details of the mesh.
+
+        `mesh_flags` are included in the fingerprint for the mesh so that
+        state held outside of the mesh, e.g. running tasks, is accounted for.
+        """
+
+        devices: dict[str, DeviceEntity] = {}
+        nodes: dict[str, NodeEntity] = {}
+        nodes_by_serial: dict[str, NodeEntity] = {}
+        serialised_mesh: str = _serialise_mesh(mesh, *mesh_flags)
+        fingerprints: dict[str, int] = {MESH_TARGET: hash(serialised_mesh)}
+
+        for device in mesh.devices:
+            if device.unique_id.value is not None:
+                devices[str(device.unique_id.value)] = device
+                fingerprints[device_target(str(device.unique_id.value))] = (
+                    _fingerprint_entity(device)
+                )
+
+        for node in mesh.nodes:
+            if node.unique_id.value is not None:
+                nodes[str(node.unique_id.value)] = node
+            if node.serial.value is not None:
+                nodes_by_serial[str(node.serial.value)] = node
+
+        # the position on the mesh is part of the fingerprint for a node so
+        # that a change elsewhere in the topology, e.g. the number of hops, is
+        # seen by the node entities
+        topology: dict[str, NodePosition] = _build_topology(nodes)
+        for unique_id, node in nodes.items():
+            fingerprints[node_target(unique_id)] = hash(
+                (_fingerprint_entity(node), topology.get(unique_id))
+            )
+
+        trackers: dict[str, DeviceEntity] = _index_trackers(tracked_devices)
+        fingerprints.update(_fingerprint_trackers(trackers))
+
+        ret: Self = cls(
+            devices=_freeze(devices),
+            lookup=_freeze(_index_lookup(devices.values())),
+            nodes=_freeze(nodes),
+            nodes_by_serial=_freeze(nodes_by_serial),
+            topology=_freeze(topology),
+            trackers=_freeze(trackers),
+            fingerprints=_freeze(fingerprints),
+            mesh_payload_size=len(serialised_mesh),
+        )
+        return ret
+
+    def with_tracked_devices(self, tracked_devices: Iterable[DeviceEntity]) -> Self:
+        """Return a copy of the index with the tracked devices replaced."""
+
+        trackers: dict[str, DeviceEntity] = _index_trackers(tracked_devices)
+        fingerprints: dict[str, int] = {
+            key: value
+            for key, value in self.fingerprints.items()
+            if not key.startswith(tracker_target(""))
+        }
+        fingerprints.update(_fingerprint_trackers(trackers))
+
+        ret: Self = replace(
+            self, trackers=_freeze(trackers), fingerprints=_freeze(fingerprints)
+        )
+        return ret
+
+    def with_devices(self, devices: Iterable[DeviceEntity]) -> Self:
+        """Return a copy of the index with the devices replaced."""
+
+        indexed_devices: dict[str, DeviceEntity] = {}
+        fingerprints: dict[str, int] = {
+            key: value
+            for key, value in self.fingerprints.items()
+            if not key.startswith(device_target(""))
+        }
+        for device in devices:
+            if device.unique_id.value is not None:
+                indexed_devices[str(device.unique_id.value)] = device
+                fingerprints[device_target(str(device.unique_id.value))] = (
+                    _fingerprint_entity(device)
+                )
+
+        ret: Self = replace(
+            self,
+            devices=_freeze(indexed_devices),
+            lookup=_freeze(_index_lookup(indexed_devices.values())),
+            fingerprints=_freeze(fingerprints),
+        )
+        return ret
+
+    def with_offline_since(
+        self, previous: Mapping[str, datetime], now: datetime
+    ) -> Self:
+        """Return a copy of the index with the time each device went offline.
+
+        The time is carried over from the previous index for devices that
+        were already offline, otherwise the device went offline now.
+        """
+
+        offline_since: dict[str, datetime] = {
+            unique_id: previous.get(unique_id, now)
+            for unique_id, device in self.devices.items()
+            if not device.status
+        }
+
+        ret: Self = replace(self, offline_since=_freeze(offline_since))
+        return ret
+
+    def find_devices(self, value: str) -> tuple[DeviceEntity, ...]:
+        """Find the devices by unique_id, name, MAC or IP address.
+
+        The match is not case sensitive.
+        """
+
+        ret: tuple[DeviceEntity, ...] = self.lookup.get(value.strip().casefold(), ())
+        return ret
+
+    def get_parent_node(self, unique_id: str) -> NodeEntity | None:
+        """Get the parent of the given node."""
+
+        ret: NodeEntity | None = None
+        position: NodePosition | None = self.topology.get(unique_id)
+        if position is not None and position.parent is not None:
+            ret = self.nodes.get(position.parent)
+
+        return ret
+
+    def get_position(self, unique_id: str) -> NodePosition:
+        """Get the position of the given node on the mesh."""
+
+        ret: NodePosition = self.topology.get(unique_id, NodePosition())
+        return ret
+
+    def topology_as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the topology for diagnostics."""
+
+        ret: dict[str, dict[str, Any]] = {
+            unique_id: asdict(position) for unique_id, position in self.topology.items()
+        }
+        return ret
+
+    @cached_property
+    def _trackers_by_mac(self) -> dict[str, str]:
+        """Key the unique_id of the tracked devices on their MAC addresses."""
+
+        ret: dict[str, str] = {}
+        adapter: AdapterInfo
+        for unique_id, device in self.trackers.items():
+            for adapter in device.adapter_info:
+                if adapter.mac:
+                    ret.setdefault(_normalise_mac(adapter.mac), unique_id)
+
+        return ret
+
+    def find_tracker_by_mac(self, mac: str) -> str | None:
+        """Find the unique_id of the tracked device with the given MAC address."""
+
+        ret: str | None = self._trackers_by_mac.get(_normalise_mac(mac))
+        return ret
+
+    @cached_property
+    def _device_summaries(self) -> dict[bool, list[dict[str, Any]]]:
+        """Summarise the devices, partitioned by whether they are online."""
+
+        ret: dict[bool, list[dict[str, Any]]] = {True: [], False: []}
+        for device in self.devices.values():
+            ret[bool(device.status)].append(_summarise_device(device))
+
+        return ret
+
+    @cached_property
+    def device_records(self) -> dict[str, dict[str, Any]]:
+        """Describe the devices for querying, keyed on unique_id."""
+
+        ret: dict[str, dict[str, Any]] = {
+            unique_id: _describe_device(device, self.offline_since.get(unique_id))
+            for unique_id, device in self.devices.items()
+        }
+        return ret
+
+    @cached_property
+    def device_facets(self) -> dict[str, dict[Any, frozenset[str]]]:
+        """Group the unique_id of the devices by the values of each facet."""
+
+        facets: dict[str, dict[Any, set[str]]] = {facet: {} for facet in DEVICE_FACETS}
+        for unique_id, record in self.device_records.items():
+            for facet, groups in facets.items():
+                if (value := record.get(facet)) is not None:
+                    groups.setdefault(facet_value(value), set()).add(unique_id)
+
+        ret: dict[str, dict[Any, frozenset[str]]] = {
+            facet: {value: frozenset(ids) for value, ids in groups.items()}
+            for facet, groups in facets.items()
+        }
+        return ret
+
+    @cached_property
+    def device_order(self) -> tuple[str, ...]:
+        """The unique_id of the devices ordered by name."""
+
+        ret: tuple[str, ...] = tuple(
+            sorted(
+                self.device_records,
+                key=lambda unique_id: (
+                    str(self.device_records[unique_id].get("name")).casefold(),
+                    unique_id,
+                ),
+            )
+        )
+        return ret
+
+    @cached_property
+    def guest_summary(self) -> list[dict[str, Any]]:
+        """Summarise the online devices connected to the guest network."""
+
+        ret: list[dict[str, Any]] = [
+            summary for summary in self.online_summary if summary.get("guest_network")
+        ]
+        return ret
+
+    @property
+    def offline_summary(self) -> list[dict[str, Any]]:
+        """Summarise the offline devices."""
+
+        return self._device_summaries[False]
+
+    @property
+    def online_summary(self) -> list[dict[str, Any]]:
+        """Summarise the online devices."""
+
+        return self._device_summaries[True]
+
+    @cached_property
+    def parental_control_rules(self) -> dict[str, Any]:
+        """Get the Parental Control schedules keyed on device name."""
+
+        ret: dict[str, Any] = {
+            device.name.value: device.parental_control_schedule.value
+            for device in self.devices.values()
+            if device.parental_control_schedule
+        }
+        return ret
+
+    @cached_property
+    def _connected_nodes(self) -> frozenset[str]:
+        """The unique_id of the nodes that have online devices connected."""
+
+        return _get_connected_nodes(self.devices.values())
+
+    def is_outdated_by(self, devices: Iterable[DeviceEntity]) -> bool:
+        """Establish if the devices show a change to the rest of the mesh.
+
+        The nodes are not part of the details of the devices, so changes to
+        them are inferred from where the devices are connected. A device that
+        has been added or removed, one connected to an unknown node, or a
+        node that has gained its first or lost its last connected device all
+        need the full details of the mesh.
+        """
+
+        device_list: list[DeviceEntity] = list(devices)
+        unique_ids: set[str] = {
+            str(device.unique_id.value)
+            for device in device_list
+            if device.unique_id.value is not None
+        }
+        connected_nodes: frozenset[str] = _get_connected_nodes(device_list)
+
+        ret: bool = (
+            unique_ids != self.devices.keys()
+            or not connected_nodes.issubset(self.nodes)
+            or connected_nodes != self._connected_nodes
+        )
+        return ret
+
+    def changed_targets(self, previous: Self) -> set[str]:
+        """Return the targets that differ from the previous index.
+
+        The mesh is considered changed if any device has changed because the
+        mesh entities summarise the devices.
+        """
+
+        ret: set[str] = {
+            key
+            for key in self.fingerprints.keys() | previous.fingerprints.keys()
+            if self.fingerprints.get(key) != previous.fingerprints.get(key)
+        }
+        if any(key.startswith(device_target("")) for key in ret):
+            ret.add(MESH_TARGET)
+
+        return ret
+
+
+def _normalise_mac(mac: str) -> str:
+    """Strip the separators from a MAC address so they can be compared."""
+
+    ret: str = "".join(char for char in str(mac).casefold() if char.isalnum())
+    return ret
+
+
+def _lookup_keys(device: DeviceEntity) -> set[str]:
+    """Return the keys that a device can be found by.
+
+    IP addresses are only used for online devices because offline devices
+    keep the address that they last had.
+    """
+
+    ret: set[str] = {
+        str(value).casefold()
+        for value in (device.unique_id.value, device.name.value)
+        if value
+    }
+    adapter: AdapterInfo
+    for adapter in device.adapter_info:
+        if adapter.mac:
+            ret.add(str(adapter.mac).casefold())
+        if adapter.ip and device.status:
+            ret.add(str(adapter.ip).casefold())
+
+    return ret
+
+
+def _get_connected_nodes(devices: Iterable[DeviceEntity]) -> frozenset[str]:
+    """Get the unique_id of the nodes that the online devices connect to."""
+
+    ret: frozenset[str] = frozenset(
+        str(adapter.parent_id)
+        for device in devices
+        if device.status
+        for adapter in device.adapter_info
+        if adapter.parent_id
+    )
+    return ret
+
+
+def _get_backhaul_type(node: NodeEntity) -> str | None:
+    """Get the connection type of the backhaul for the node."""
+
+    ret: str | None = None
+    if node.backhaul.value is not None:
+        connection: Any = getattr(node.backhaul, "connection", None)
+        if connection is not None:
+            ret = str(connection).lower()
+
+    return ret
+
+
+def _get_parent_id(
+    node: NodeEntity,
+    nodes: Mapping[str, NodeEntity],
+    nodes_by_name: Mapping[str, str],
+) -> str | None:
+    """Get the unique_id of the parent based on ID, falling back to the name."""
+
+    ret: str | None = None
+
+    # region #-- get the parent based on ID --#
+    adapter_main: AdapterInfo | None = next(
+        (adi for adi in node.adapter_info if adi.primary),
+        None,
+    )
+    if adapter_main is not None and str(adapter_main.parent_id) in nodes:
+        ret = str(adapter_main.parent_id)
+    # endregion
+
+    # region #-- if we don't have the parent yet lookup based on name --#
+    if ret is None and node.parent_name.value is not None:
+        ret = nodes_by_name.get(str(node.parent_name.value))
+    # endregion
+
+    return ret
+
+
+def _build_topology(nodes: Mapping[str, NodeEntity]) -> dict[str, NodePosition]:
+    """Establish the position of each node on the mesh.
+
+    :param nodes: the nodes keyed on unique_id
+    :return: the position of the nodes keyed on unique_id
+    """
+
+    ret: dict[str, NodePosition] = {}
+
+    nodes_by_name: dict[str, str] = {}
+    for unique_id, node in nodes.items():
+        nodes_by_name.setdefault(str(node.name.value), unique_id)
+
+    # region #-- parent/child relationships --#
+    children: dict[str, list[str]] = {unique_id: [] for unique_id in nodes}
+    parents: dict[str, str | None] = {}
+    for unique_id, node in nodes.items():
+        parent: str | None = None
+        if node.type.value != NodeType.PRIMARY:
+            parent = _get_parent_id(node, nodes, nodes_by_name)
+            if parent == unique_id:
+                parent = None
+        parents[unique_id] = parent
+        if parent is not None:
+            children[parent].append(unique_id)
+    # endregion
+
+    # region #-- hops to the primary node --#
+    # each node is only walked once, the count for a node is reused by its
+    # children; loops and orphaned branches can't reach the primary node.
+    hops: dict[str, int | None] = {
+        unique_id: 0
+        for unique_id, node in nodes.items()
+        if node.type.value == NodeType.PRIMARY
+    }
+    for unique_id in nodes:
+        path: list[str] = []
+        current: str | None = unique_id
+        while current is not None and current not in hops and current not in path:
+            path.append(current)
+            current = parents[current]
+
+        base: int | None = hops.get(current) if current is not None else None
+        for offset, path_id in enumerate(reversed(path), start=1):
+            hops[path_id] = base + offset if base is not None else None
+    # endregion
+
+    for unique_id, node in nodes.items():
+        parent_id: str | None = parents[unique_id]
+        ret[unique_id] = NodePosition(
+            backhaul=_get_backhaul_type(node),
+            children=tuple(sorted(children[unique_id])),
+            device_count=len(node.connected_devices),
+            hops=hops.get(unique_id),
+            parent=parent_id,
+            parent_name=(
+                nodes[parent_id].name.value
+                if parent_id is not None
+                else node.parent_name.value
+            ),
+        )
+
+    return ret
+
+
+def _index_lookup(
+    devices: Iterable[DeviceEntity],
+) -> dict[str, tuple[DeviceEntity, ...]]:
+    """Key the devices on each of their lookup keys."""
+
+    ret: dict[str, tuple[DeviceEntity, ...]] = {}
+    for device in devices:
+        for key in _lookup_keys(device):
+            ret[key] = (*ret.get(key, ()), device)
+
+    return ret
+
+
+def _index_trackers(tracked_devices: Iterable[DeviceEntity]) -> dict[str, DeviceEntity]:
+    """Key the tracked devices on their unique_id."""
+
+    ret: dict[str, DeviceEntity] = {
+        str(device.unique_id.value): device
+        for device in tracked_devices
+        if device.unique_id.value is not None
+    }
+    return ret
+
+
+def _fingerprint_trackers(trackers: Mapping[str, DeviceEntity]) -> dict[str, int]:
+    """Fingerprint the tracked devices.
+
+    The time of the results changes on every request and isn't used by the
+    device trackers so it is ignored, otherwise every tracker would be updated
+    on every poll.
+    """
+
+    ret: dict[str, int] = {
+        tracker_target(unique_id): _fingerprint_entity(
+            device, exclude=("results_time",)
+        )
+        for unique_id, device in trackers.items()
+    }
+    return ret
@@ -0,0 +1,188 @@
+"""Co-ordinate the meshes that are set up by the integration."""
+
+# region #-- imports --#
+import logging
+import math
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, cast
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .coordinator import LinksysVelopConfigEntry, LinksyVelopDataUpdateCoordinator
+from .logger import Logger
+
+# endregion
+
+_LOGGER: Logger = Logger(logging.getLogger(__name__))
+
+# successive multiples of this spread the phases evenly around the interval
+_GOLDEN_RATIO_CONJUGATE: float = (math.sqrt(5) - 1) / 2
+
+
+class MeshOrchestrator:
+    """Spread out the polls of the meshes.
+
+    Each mesh is given a slot that sets the phase of its polls within the
+    scan interval. The phases follow the golden ratio, so they stay evenly
+    spread however many meshes there are without moving the meshes that are
+    already polling.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise."""
+
+        self._entries: dict[str, LinksysVelopConfigEntry] = {}
+        self._hass: HomeAssistant = hass
+        self._slots: dict[str, int] = {}
+
+    def _get_coordinators(
+        self, config_entry: LinksysVelopConfigEntry
+    ) -> list[LinksyVelopDataUpdateCoordinator]:
+        """Get the coordinators that poll the mesh."""
+
+        ret: list[LinksyVelopDataUpdateCoordinator] = [
+            coordinator
+            for coordinator in config_entry.runtime_data.coordinators.values()
+            if isinstance(coordinator, LinksyVelopDataUpdateCoordinator)
+            and coordinator.update_interval is not None
+        ]
+        return ret
+
+    def _get_offset(self, entry_id: str, interval: float) -> float:
+        """Get the offset of the polls for the mesh within the interval."""
+
+        ret: float = round(
+            interval * ((self._slots.get(entry_id, 0) * _GOLDEN_RATIO_CONJUGATE) % 1),
+            3,
+        )
+        return ret
+
+    @callback
+    def _refresh_coordinator(
+        self,
+        config_entry: LinksysVelopConfigEntry,
+        coordinator: LinksyVelopDataUpdateCoordinator,
+        _: datetime,
+    ) -> None:
+        """Refresh the coordinator outside of its schedule."""
+
+        config_entry.async_create_background_task(
+            self._hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} stagger {coordinator.name}",
+        )
+
+    def register(self, config_entry: LinksysVelopConfigEntry) -> None:
+        """Give the mesh a slot in the schedule."""
+
+        slot: int = next(
+            i for i in range(len(self._slots) + 1) if i not in self._slots.values()
+        )
+        self._entries[config_entry.entry_id] = config_entry
+        self._slots[config_entry.entry_id] = slot
+        _LOGGER.debug("%s registered in slot %i", config_entry.title, slot)
+
+    @callback
+    def unregister(self, entry_id: str) -> None:
+        """Release the slot for the mesh."""
+
+        self._entries.pop(entry_id, None)
+        self._slots.pop(entry_id, None)
+
+    @callback
+    def async_stagger(
+        self, config_entry: LinksysVelopConfigEntry
+    ) -> Callable[[], None]:
+        """Move the polls of the mesh to its phase.
+
+        The coordinators schedule their next poll from the end of the last
+        one. A single refresh at the offset moves the schedule to the phase
+        for the slot. The timers of the mesh coordinator are not due at that
+        point so it makes no requests to the mesh.
+
+        :return: a callable to cancel the move
+        """
+
+        cancel_callbacks: list[Callable[[], None]] = []
+        for coordinator in self._get_coordinators(config_entry):
+            offset: float = self._get_offset(
+                config_entry.entry_id,
+                cast(timedelta, coordinator.update_interval).total_seconds(),
+            )
+            if offset == 0:
+                continue
+
+            _LOGGER.debug("%s: staggering polls by %.3fs", coordinator.name, offset)
+
+            cancel_callbacks.append(
+                async_call_later(
+                    self._hass,
+                    offset,
+                    partial(self._refresh_coordinator, config_entry, coordinator),
+                )
+            )
+
+        @callback
+        def _cancel() -> None:
+            for cancel in cancel_callbacks:
+                cancel()
+
+        return _cancel
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cost of polling across all meshes."""
+
+        meshes: dict[str, dict[str, Any]] = {}
+        for entry_id, config_entry in self._entries.items():
+            coordinators: list[LinksyVelopDataUpdateCoordinator] = (
+                self._get_coordinators(config_entry)
+            )
+            meshes[entry_id] = {
+                "duration_ms": sum(
+                    c.telemetry.last.duration_ms or 0
+                    for c in coordinators
+                    if c.telemetry.last is not None
+                ),
+                "failure_streak": max(
+                    (c.telemetry.failure_streak for c in coordinators), default=0
+                ),
+                "offsets": {
+                    c.name: self._get_offset(
+                        entry_id, cast(timedelta, c.update_interval).total_seconds()
+                    )
+                    for c in coordinators
+                },
+                "payload_size": sum(
+                    c.telemetry.payload_size or 0 for c in coordinators
+                ),
+                "requests_total": sum(c.telemetry.requests_total for c in coordinators),
+                "slot": self._slots.get(entry_id),
+                "title": config_entry.title,
+            }
+
+        ret: dict[str, Any] = {
+            "meshes": meshes,
+            "totals": {
+                key: sum(mesh[key] for mesh in meshes.values())
+                for key in ("duration_ms", "payload_size", "requests_total")
+            },
+        }
+        return ret
+
+
+DATA_ORCHESTRATOR: HassKey[MeshOrchestrator] = HassKey(f"{DOMAIN}_orchestrator")
+
+
+@callback
+def get_orchestrator(hass: HomeAssistant) -> MeshOrchestrator:
+    """Get the orchestrator for the integration, creating it if needed."""
+
+    ret: MeshOrchestrator | None
+    if (ret := hass.data.get(DATA_ORCHESTRATOR)) is None:
+        ret = hass.data[DATA_ORCHESTRATOR] = MeshOrchestrator(hass)
+    return ret
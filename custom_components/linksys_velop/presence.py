@@ -0,0 +1,94 @@
+"""Local presence detection for the device trackers."""
+
+# region #-- imports --#
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SIGNAL_DEVICE_PRESENT
+from .coordinator import LinksysVelopConfigEntry, get_mesh_index_for_config_entry
+from .logger import Logger
+
+try:
+    import aiodhcpwatcher
+except ImportError:
+    aiodhcpwatcher = None
+
+# endregion
+
+_LOGGER: Logger = Logger(logging.getLogger(__name__))
+
+
+def signal_device_present(config_entry: LinksysVelopConfigEntry, velop_id: str) -> str:
+    """Return the signal sent when the given device is seen locally."""
+
+    return f"{SIGNAL_DEVICE_PRESENT}_{config_entry.entry_id}_{velop_id}"
+
+
+def is_dhcp_watch_available() -> bool:
+    """Establish if DHCP requests can be watched for.
+
+    aiodhcpwatcher is installed by the dhcp integration.
+    """
+
+    return aiodhcpwatcher is not None
+
+
+class DhcpPresenceWatcher:
+    """Watch for DHCP requests from the tracked devices.
+
+    A device requests an address as soon as it joins the network, so the
+    tracker can be marked as home without waiting for the next poll of the
+    mesh. Polling remains the only way for a tracker to be marked as away.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: LinksysVelopConfigEntry
+    ) -> None:
+        """Initialise."""
+
+        self._config_entry: LinksysVelopConfigEntry = config_entry
+        self._hass: HomeAssistant = hass
+        self._stop: Callable[[], None] | None = None
+
+    async def async_start(self) -> None:
+        """Start watching for DHCP requests."""
+
+        if aiodhcpwatcher is None:
+            _LOGGER.warning(
+                "aiodhcpwatcher is not installed, local presence detection is unavailable"
+            )
+            return
+
+        try:
+            self._stop = await aiodhcpwatcher.async_start(
+                self._async_process_dhcp_request
+            )
+        except OSError as err:
+            _LOGGER.warning("unable to watch for DHCP requests: %s", err)
+        else:
+            _LOGGER.debug("watching for DHCP requests")
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching for DHCP requests."""
+
+        if self._stop is not None:
+            self._stop()
+            self._stop = None
+
+    @callback
+    def _async_process_dhcp_request(self, request: Any) -> None:
+        """Let the tracker know that the device has been seen."""
+
+        velop_id: str | None = get_mesh_index_for_config_entry(
+            self._config_entry
+        ).find_tracker_by_mac(request.mac_address)
+        if velop_id is not None:
+            _LOGGER.debug("DHCP request seen for %s (%s)", velop_id, request.ip_address)
+            async_dispatcher_send(
+                self._hass, signal_device_present(self._config_entry, velop_id)
+            )
@@ -0,0 +1,93 @@
+"""Query the devices held in the index of the mesh."""
+
+# region #-- imports --#
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from .mesh_index import DEVICE_FACETS, MeshIndex, facet_value
+
+# endregion
+
+
+@dataclass(frozen=True, kw_only=True)
+class DeviceQuery:
+    """The filters, page and fields for a query of the devices.
+
+    Filters that are None are not applied. All fields are returned if none
+    are given.
+    """
+
+    band: str | None = None
+    fields: tuple[str, ...] = ()
+    guest_network: bool | None = None
+    limit: int | None = None
+    node: str | None = None
+    offline_for: timedelta | None = None
+    offset: int = 0
+    online: bool | None = None
+
+
+def query_devices(
+    mesh_index: MeshIndex, query: DeviceQuery, now: datetime
+) -> dict[str, Any]:
+    """Run the query against the index.
+
+    The facets of the index are used to find the matching devices so only
+    those devices are visited. Devices are ordered by name so that the pages
+    are stable between refreshes.
+
+    :param mesh_index: the index to query
+    :param query: the details of the query
+    :param now: the time to measure how long devices have been offline from
+    :return: the page of matching devices and the total number that matched
+    """
+
+    matched: set[str] | None = None
+
+    # region #-- filter on the facets --#
+    for facet in DEVICE_FACETS:
+        value: Any = getattr(query, facet)
+        if value is None:
+            continue
+
+        ids: frozenset[str] = mesh_index.device_facets.get(facet, {}).get(
+            facet_value(value), frozenset()
+        )
+        matched = set(ids) if matched is None else matched & ids
+    # endregion
+
+    # region #-- filter on how long the devices have been offline --#
+    if query.offline_for is not None:
+        offline_before: datetime = now - query.offline_for
+        offline_ids: set[str] = {
+            unique_id
+            for unique_id, offline_since in mesh_index.offline_since.items()
+            if offline_since <= offline_before
+        }
+        matched = offline_ids if matched is None else matched & offline_ids
+    # endregion
+
+    ordered: list[str] = [
+        unique_id
+        for unique_id in mesh_index.device_order
+        if matched is None or unique_id in matched
+    ]
+    page: list[str] = ordered[
+        query.offset : (query.offset + query.limit if query.limit is not None else None)
+    ]
+
+    ret: dict[str, Any] = {
+        "devices": [
+            (
+                {field: record.get(field) for field in query.fields}
+                if query.fields
+                else dict(record)
+            )
+            for record in (mesh_index.device_records[unique_id] for unique_id in page)
+        ],
+        "limit": query.limit,
+        "offset": query.offset,
+        "total": len(ordered),
+    }
+    return ret
@@ -0,0 +1,110 @@
+"""Work out what has changed on the mesh between gathers."""
+
+# region #-- imports --#
+from collections.abc import Iterable, Mapping, Set
+from dataclasses import dataclass, field
+from typing import Any
+
+from pyvelop.mesh_entity import AdapterInfo, DeviceEntity, NodeEntity, NodeType
+
+from .mesh_index import MeshIndex
+
+# endregion
+
+
+@dataclass(kw_only=True)
+class MeshChanges:
+    """The changes to apply following a gather of the mesh details.
+
+    Nodes are keyed on their serial and devices on their unique_id.
+    """
+
+    missing_ui_devices: set[str] = field(default_factory=set)
+    new_devices: set[str] = field(default_factory=set)
+    new_nodes: list[NodeEntity] = field(default_factory=list)
+    node_parents: dict[str, str] = field(default_factory=dict)
+    node_updates: dict[str, dict[str, Any]] = field(default_factory=dict)
+    stale_nodes: set[str] = field(default_factory=set)
+    ui_device_names: dict[str, str] = field(default_factory=dict)
+
+
+def _get_primary_ip(node: NodeEntity) -> str | None:
+    """Get the IP address of the primary adapter for the node."""
+
+    adapter: AdapterInfo | None = next(
+        (adi for adi in node.adapter_info if adi.primary), None
+    )
+    ret: str | None = adapter.ip if adapter is not None else None
+    return ret
+
+
+def diff_mesh(
+    *,
+    previous_nodes: Mapping[str, NodeEntity],
+    mesh_index: MeshIndex,
+    previous_devices: Set[str] | None = None,
+    ui_devices: Iterable[str] = (),
+) -> MeshChanges:
+    """Compare the previous and current details of the mesh.
+
+    Each node and device is visited once so the cost is linear in the size of
+    the mesh.
+
+    :param previous_nodes: the nodes before the gather keyed on serial
+    :param mesh_index: the index built after the gather
+    :param previous_devices: the unique_ids of the devices before the gather,
+    new devices are not looked for if not provided
+    :param ui_devices: the unique_ids of the devices created in the UI
+    :return: the changes that need to be applied
+    """
+
+    ret: MeshChanges = MeshChanges()
+    current_nodes: Mapping[str, NodeEntity] = mesh_index.nodes_by_serial
+    current_devices: Mapping[str, DeviceEntity] = mesh_index.devices
+
+    # region #-- compare the nodes --#
+    for serial, cur_node in current_nodes.items():
+        prev_node: NodeEntity | None
+        if (prev_node := previous_nodes.get(serial)) is None:
+            ret.new_nodes.append(cur_node)
+            continue
+
+        attr_to_update: dict[str, Any] = {}
+        if cur_node.type.value == NodeType.SECONDARY:
+            # update the configuration_url
+            cur_ip: str | None = _get_primary_ip(cur_node)
+            if cur_ip != _get_primary_ip(prev_node):
+                attr_to_update["configuration_url"] = (
+                    f"http://{cur_ip}/ca" if cur_ip is not None else None
+                )
+
+            # the via_device reflects the parent/child relationship on the mesh
+            parent_node: NodeEntity | None = mesh_index.get_parent_node(
+                str(cur_node.unique_id.value)
+            )
+            if parent_node is not None and parent_node.serial.value is not None:
+                ret.node_parents[serial] = str(parent_node.serial.value)
+
+        # this doesn't change the visible name in Home Assistant if that was set by the user.
+        if cur_node.name.value != prev_node.name.value:
+            attr_to_update["name"] = cur_node.name.value
+
+        if attr_to_update:
+            ret.node_updates[serial] = attr_to_update
+
+    ret.stale_nodes = set(previous_nodes.keys() - current_nodes.keys())
+    # endregion
+
+    # region #-- compare the devices --#
+    if previous_devices is not None:
+        ret.new_devices = set(current_devices.keys() - previous_devices)
+
+    for ui_device in ui_devices:
+        device: DeviceEntity | None
+        if (device := current_devices.get(ui_device)) is not None:
+            ret.ui_device_names[ui_device] = device.name.value
+        else:
+            ret.missing_ui_devices.add(ui_device)
+    # endregion
+
+    return ret
@@ -0,0 +1,235 @@
+"""Adapt the timeouts for requests to the latency of the mesh."""
+
+# region #-- imports --#
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pyvelop.exceptions import MeshConnectionError, MeshTimeoutError
+
+from .const import (
+    DEF_API_REQUEST_TIMEOUT,
+    DEF_CIRCUIT_BREAKER_COOLDOWN_SECS,
+    DEF_CIRCUIT_BREAKER_THRESHOLD,
+    DEF_REQUEST_RETRIES,
+    DEF_REQUEST_RETRY_DELAY_SECS,
+    DEF_REQUEST_TIMEOUT_MAX_FACTOR,
+    DEF_REQUEST_TIMEOUT_MIN,
+)
+from .logger import Logger
+
+# endregion
+
+_LOGGER: Logger = Logger(logging.getLogger(__name__))
+
+# weights for the smoothed latency and its variation as used for TCP (RFC 6298)
+_ALPHA: float = 1 / 8
+_BETA: float = 1 / 4
+
+
+class CircuitOpenError(MeshConnectionError):
+    """Requests are not being made because the action keeps failing."""
+
+
+class RequestTimeoutError(MeshTimeoutError):
+    """The action did not complete within the timeout for it."""
+
+    def __init__(self, action: str, timeout: float | None) -> None:
+        """Initialise and set the message to include the timeout."""
+
+        super().__init__()
+        self.action: str = action
+        self.timeout: float | None = timeout
+        self.args = (f"Timeout Error: {action} took longer than {timeout}s",)
+
+
+@dataclass(kw_only=True)
+class ActionLatency:
+    """The latency observed for an action."""
+
+    backoff: int = 0
+    failures: int = 0
+    open_until: float | None = None
+    samples: int = 0
+    srtt: float | None = None
+    rttvar: float | None = None
+
+
+class RequestPolicy:
+    """Time out each action from the latency of previous ones.
+
+    The timeout for an action is its smoothed latency plus four times the
+    variation, as for TCP retransmissions, kept between `min_timeout` and
+    `max_timeout`, or twice the smoothed latency for actions made up of
+    several slow requests. There is no timeout for an action until it has
+    completed once and it doubles each time the action times out.
+
+    Failed requests are retried after a jittered, exponential delay. After
+    `breaker_threshold` consecutive calls for an action have failed, with
+    their retries, no requests are made for that action for
+    `breaker_cooldown` seconds, after which a single request is let through
+    to check whether it has recovered. Each action has its own breaker so a
+    slow action, such as a speedtest, does not hold back the others.
+    """
+
+    def __init__(
+        self,
+        default_timeout: float = DEF_API_REQUEST_TIMEOUT,
+        *,
+        breaker_cooldown: float = DEF_CIRCUIT_BREAKER_COOLDOWN_SECS,
+        breaker_threshold: int = DEF_CIRCUIT_BREAKER_THRESHOLD,
+        min_timeout: float = DEF_REQUEST_TIMEOUT_MIN,
+        retries: int = DEF_REQUEST_RETRIES,
+        retry_delay: float = DEF_REQUEST_RETRY_DELAY_SECS,
+    ) -> None:
+        """Initialise."""
+
+        self._actions: dict[str, ActionLatency] = {}
+        self._breaker_cooldown: float = breaker_cooldown
+        self._breaker_threshold: int = max(1, breaker_threshold)
+        self._retries: int = max(0, retries)
+        self._retry_delay: float = retry_delay
+        self.default_timeout: float = default_timeout
+        self.max_timeout: float = max(
+            default_timeout, default_timeout * DEF_REQUEST_TIMEOUT_MAX_FACTOR
+        )
+        self.min_timeout: float = min(min_timeout, default_timeout)
+
+    def close_circuits(self) -> None:
+        """Let requests for every action through again."""
+
+        for latency in self._actions.values():
+            latency.failures = 0
+            latency.open_until = None
+
+    def is_open(self, action: str) -> bool:
+        """Establish if requests for the action are being held back."""
+
+        latency: ActionLatency = self._actions.get(action, ActionLatency())
+        ret: bool = (
+            latency.open_until is not None and time.monotonic() < latency.open_until
+        )
+        return ret
+
+    def get_timeout(self, action: str) -> float | None:
+        """Get the timeout to use for the next call for the action.
+
+        None is returned until the action has completed once, the timeout of
+        the mesh for each individual request is all that applies until then.
+        """
+
+        latency: ActionLatency = self._actions.get(action, ActionLatency())
+        ret: float | None = None
+        if latency.srtt is not None and latency.rttvar is not None:
+            max_timeout: float = max(
+                self.max_timeout, latency.srtt * DEF_REQUEST_TIMEOUT_MAX_FACTOR
+            )
+            ret = round(
+                min(
+                    max(latency.srtt + 4 * latency.rttvar, self.min_timeout)
+                    * 2**latency.backoff,
+                    max_timeout,
+                ),
+                3,
+            )
+
+        return ret
+
+    def record_failure(self, action: str) -> None:
+        """Record a call for the action that failed once retries were used up."""
+
+        latency: ActionLatency = self._actions.setdefault(action, ActionLatency())
+        latency.failures += 1
+        if latency.failures >= self._breaker_threshold:
+            if not self.is_open(action):
+                _LOGGER.debug(
+                    "%s: %i consecutive failures, holding back requests for %ss",
+                    action,
+                    latency.failures,
+                    self._breaker_cooldown,
+                )
+            latency.open_until = time.monotonic() + self._breaker_cooldown
+
+    def record_success(self, action: str, elapsed: float) -> None:
+        """Record the time taken for a successful request for the action."""
+
+        latency: ActionLatency = self._actions.setdefault(action, ActionLatency())
+        if latency.srtt is None or latency.rttvar is None:
+            latency.srtt = elapsed
+            latency.rttvar = elapsed / 2
+        else:
+            latency.rttvar = (1 - _BETA) * latency.rttvar + _BETA * abs(
+                latency.srtt - elapsed
+            )
+            latency.srtt = (1 - _ALPHA) * latency.srtt + _ALPHA * elapsed
+        latency.backoff = 0
+        latency.failures = 0
+        latency.open_until = None
+        latency.samples += 1
+
+    async def async_request(
+        self, method: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> Any:
+        """Make the request to the mesh within the timeout for the action.
+
+        The action is the name of the method called. The timeout applies to
+        the whole call, which can be made up of several requests. The timeout
+        of the mesh is not changed, it is shared by every request made to the
+        mesh and so still applies to each individual request.
+
+        :param method: the method of the mesh to call
+        :return: the result of the method
+        """
+
+        action: str = method.__name__
+        if self.is_open(action):
+            raise CircuitOpenError
+
+        attempt: int = 0
+        while True:
+            started: float = time.monotonic()
+            timeout: float | None = self.get_timeout(action)
+            try:
+                async with asyncio.timeout(timeout):
+                    ret: Any = await method(*args, **kwargs)
+            except (MeshConnectionError, MeshTimeoutError, TimeoutError) as err:
+                self._actions.setdefault(action, ActionLatency()).backoff += 1
+                if attempt >= self._retries or self.is_open(action):
+                    self.record_failure(action)
+                    if isinstance(err, TimeoutError):
+                        raise RequestTimeoutError(action, timeout) from err
+                    raise
+            else:
+                self.record_success(action, time.monotonic() - started)
+                return ret
+
+            delay: float = self._retry_delay * 2**attempt * random.uniform(0.5, 1.5)
+            _LOGGER.debug("retrying %s in %.3fs", action, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timeouts for diagnostics."""
+
+        ret: dict[str, Any] = {
+            "actions": {
+                action: {
+                    "backoff": latency.backoff,
+                    "circuit_open": self.is_open(action),
+                    "failures": latency.failures,
+                    "samples": latency.samples,
+                    "srtt": latency.srtt,
+                    "rttvar": latency.rttvar,
+                    "timeout": self.get_timeout(action),
+                }
+                for action, latency in self._actions.items()
+            },
+            "default_timeout": self.default_timeout,
+            "max_timeout": self.max_timeout,
+            "min_timeout": self.min_timeout,
+        }
+        return ret
@@ -0,0 +1,211 @@
+"""Scheduling of the requests made to the mesh and the resulting timers."""
+
+# region #-- imports --#
+import asyncio
+import heapq
+import json
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from pyvelop.action_registry import Actions
+
+from .const import DEF_MAX_POLL_BACKOFF
+from .logger import Logger
+
+# endregion
+
+_LOGGER: Logger = Logger(logging.getLogger(__name__))
+
+# These actions make up the details of the devices. They can be requested
+# without gathering everything else so are kept at the base interval.
+DEVICE_ACTIONS: frozenset[str] = frozenset(
+    {
+        Actions.GET_DEVICES.key,
+        Actions.GET_LAN_SETTINGS.key,
+        Actions.GET_PARENTAL_CONTROL_INFO.key,
+    }
+)
+
+
+@dataclass(kw_only=True)
+class ActionSchedule:
+    """Polling state for a single action."""
+
+    fingerprint: int | None = None
+    interval: float
+    last_polled: float | None = None
+    unchanged: int = 0
+
+
+class MeshActionScheduler:
+    """Decide whether a full gather of the mesh details is needed.
+
+    Each action is tracked separately. The interval for an action doubles each
+    time its response is unchanged, up to `max_backoff` times the base
+    interval, and returns to the base interval as soon as the response
+    changes. A full gather is due when any action is due.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        max_backoff: int = DEF_MAX_POLL_BACKOFF,
+        exclude: Iterable[str] = DEVICE_ACTIONS,
+    ) -> None:
+        """Initialise."""
+
+        self._base_interval: float = base_interval
+        self._exclude: frozenset[str] = frozenset(exclude)
+        self._max_backoff: int = max(1, max_backoff)
+        self._schedules: dict[str, ActionSchedule] = {}
+
+    def expire(self) -> None:
+        """Make all actions due."""
+
+        for schedule in self._schedules.values():
+            schedule.last_polled = None
+
+    def is_gather_due(self, now: float) -> bool:
+        """Establish if any of the actions are due to be requested."""
+
+        ret: bool = not self._schedules or any(
+            schedule.last_polled is None
+            or now - schedule.last_polled >= schedule.interval
+            for schedule in self._schedules.values()
+        )
+        return ret
+
+    def observe(self, responses: Mapping[str, Any], now: float) -> set[str]:
+        """Record the responses from a full gather.
+
+        :return: the actions that have changed since they were last observed
+        """
+
+        ret: set[str] = set()
+        for key, response in responses.items():
+            if key in self._exclude:
+                continue
+
+            try:
+                fingerprint: int = hash(
+                    json.dumps(response, default=str, sort_keys=True)
+                )
+            except (TypeError, ValueError):
+                continue
+
+            schedule: ActionSchedule = self._schedules.setdefault(
+                key, ActionSchedule(interval=self._base_interval)
+            )
+            if schedule.fingerprint == fingerprint:
+                schedule.unchanged += 1
+                schedule.interval = min(
+                    schedule.interval * 2, self._base_interval * self._max_backoff
+                )
+            else:
+                schedule.unchanged = 0
+                schedule.interval = self._base_interval
+                ret.add(key)
+            schedule.fingerprint = fingerprint
+            schedule.last_polled = now
+
+        return ret
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the current schedules."""
+
+        ret: dict[str, dict[str, Any]] = {
+            key: asdict(schedule) for key, schedule in self._schedules.items()
+        }
+        return ret
+
+
+class DeadlineTimers:
+    """Run actions at their deadline using a single timer.
+
+    The deadlines are kept in a heap and only the earliest has a timer set on
+    the event loop, so the cost of many pending deadlines stays low. Each key
+    has at most one deadline, scheduling it again replaces the previous one.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Initialise."""
+
+        self._actions: dict[str, tuple[float, Callable[[], None]]] = {}
+        self._deadlines: list[tuple[float, str]] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop = loop
+
+    def __contains__(self, key: str) -> bool:
+        """Establish if the key has a pending deadline."""
+
+        return key in self._actions
+
+    def cancel(self, key: str) -> None:
+        """Cancel the deadline for the key.
+
+        The entry in the heap is discarded when it reaches the top.
+        """
+
+        if self._actions.pop(key, None) is not None:
+            self._arm()
+
+    def cancel_all(self) -> None:
+        """Cancel all deadlines."""
+
+        self._actions.clear()
+        self._deadlines.clear()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def schedule(self, key: str, delay: float, action: Callable[[], None]) -> None:
+        """Run the action for the key once the delay has passed."""
+
+        deadline: float = self._loop.time() + delay
+        self._actions[key] = (deadline, action)
+        heapq.heappush(self._deadlines, (deadline, key))
+        self._arm()
+
+    def _is_current(self, deadline: float, key: str) -> bool:
+        """Establish if the entry in the heap is still the deadline for the key."""
+
+        action: tuple[float, Callable[[], None]] | None = self._actions.get(key)
+        ret: bool = action is not None and action[0] == deadline
+        return ret
+
+    def _arm(self) -> None:
+        """Set the timer for the earliest deadline."""
+
+        while self._deadlines and not self._is_current(*self._deadlines[0]):
+            heapq.heappop(self._deadlines)
+
+        when: float | None = self._deadlines[0][0] if self._deadlines else None
+        if self._handle is not None:
+            if self._handle.when() == when:
+                return
+            self._handle.cancel()
+            self._handle = None
+
+        if when is not None:
+            self._handle = self._loop.call_at(when, self._run_due)
+
+    def _run_due(self) -> None:
+        """Run the actions that have reached their deadline.
+
+        An action that fails doesn't stop the others from running.
+        """
+
+        self._handle = None
+        now: float = self._loop.time()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, key = heapq.heappop(self._deadlines)
+            if self._is_current(deadline, key):
+                _, action = self._actions.pop(key)
+                try:
+                    action()
+                except Exception:
+                    _LOGGER.exception("error running the deadline for %s", key)
+
+        self._arm()
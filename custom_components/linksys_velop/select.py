@@ -2,7 +2,7 @@
 
 # region #-- imports --#
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from typing import Any, cast, override
 
@@ -27,6 +27,7 @@ from .coordinator import (
     CoordinatorTypes,
     LinksysVelopConfigEntry,
     LinksysVelopDataUpdateCoordinatorMultiUse,
+    get_mesh_index_for_config_entry,
 )
 from .entities import (
     EntityType,
@@ -34,8 +35,9 @@ from .entities import (
     LinksysVelopEntityDescription,
     LinksysVelopMultiUseEntity,
 )
-from .helpers import remove_velop_entity_from_registry
+from .helpers import remove_velop_entities_from_registry
 from .logger import Logger
+from .mesh_index import MeshIndex
 
 # endregion
 
@@ -69,13 +71,13 @@ def get_current_reboot_schedule(mesh: Mesh, *args) -> str | None:
     return ret
 
 
-def get_placeholder_device_options(mesh: Mesh) -> dict[str, str]:
+def get_placeholder_device_options(devices: Iterable[DeviceEntity]) -> dict[str, str]:
     """Retrieve the list of device options available for the placeholder device."""
 
     ret: dict[str, str] = {}
 
     d: DeviceEntity
-    for d in mesh.devices:
+    for d in devices:
         adi: AdapterInfo | None = next(iter(d.adapter_info), None)
         name: str = (
             d.name.value
@@ -99,7 +101,7 @@ async def async_update_reboot_schedule(mesh: Mesh, option: str) -> None:
         )
 
 
-async def async_update_placeholder_device(mesh: Mesh, option: str) -> None:
+async def async_update_placeholder_device(mesh_index: MeshIndex, option: str) -> None:
     """Calculate the new placeholder device ID and send the signal."""
 
     velop_id: str | None = None
@@ -111,16 +113,8 @@ async def async_update_placeholder_device(mesh: Mesh, option: str) -> None:
         if not option.startswith(f"{EMPTY_NAME} (")
         else option.split("(")[1].strip(")")
     )
-    dev: DeviceEntity
-    for dev in mesh.devices:
-        match_against: list[str] = [dev.name.lower(), str(dev.unique_id)]
-        if option.startswith(f"{EMPTY_NAME} (") and dev.status:
-            adi: AdapterInfo | None = next(iter(dev.adapter_info), None)
-            if adi is not None and adi.ip is not None:
-                match_against.append(adi.ip)
-        if match_on.lower() in match_against:
-            velop_id = dev.unique_id.value
-            break
+    if matches := mesh_index.find_devices(match_on):
+        velop_id = matches[0].unique_id.value
     # endregion
 
     # region #-- send a signal informing that the placeholder device has updated --#
@@ -204,15 +198,23 @@ async def async_setup_entry(
                         entity_category=EntityCategory.CONFIG,
                         key="",
                         name="Devices",
-                        options_fn=lambda m: list(
-                            get_placeholder_device_options(m).values()
+                        options_fn=lambda _: list(
+                            get_placeholder_device_options(
+                                get_mesh_index_for_config_entry(
+                                    config_entry
+                                ).devices.values()
+                            ).values()
+                        ),
+                        set_fn=lambda _, option: async_update_placeholder_device(
+                            get_mesh_index_for_config_entry(config_entry), option
                         ),
-                        set_fn=async_update_placeholder_device,
                         target_type=EntityType.DEVICE,
                         translation_key="mesh_devices",
-                        value_fn=lambda m, uid: get_placeholder_device_options(m).get(
-                            uid
-                        ),
+                        value_fn=lambda _, uid: get_placeholder_device_options(
+                            get_mesh_index_for_config_entry(
+                                config_entry
+                            ).devices.values()
+                        ).get(uid),
                     )
                 )
 
@@ -305,12 +307,9 @@ async def async_setup_entry(
             )
 
         if len(entities_to_remove) > 0:
-            for entity_unique_id in entities_to_remove:
-                remove_velop_entity_from_registry(
-                    hass,
-                    config_entry.entry_id,
-                    entity_unique_id,
-                )
+            remove_velop_entities_from_registry(
+                hass, config_entry.entry_id, entities_to_remove
+            )
 
     def create_node_entities() -> None:
         """Create the node entities.
@@ -15,7 +15,12 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT, UnitOfDataRate
+from homeassistant.const import (
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -38,13 +43,19 @@ from pyvelop.mesh_entity import (
     SignalStrength,
 )
 
-from .const import CONF_NODE_IMAGES, CONF_UI_DEVICES
+from .const import (
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_NODE_IMAGES,
+    CONF_UI_DEVICES,
+    DEF_COMPACT_ATTRIBUTES,
+)
 from .coordinator import (
     CoordinatorTimers,
     CoordinatorTypes,
     LinksysVelopConfigEntry,
     LinksysVelopDataUpdateCoordinatorMultiUse,
     LinksysVelopDataUpdateCoordinatorSpeedtest,
+    get_mesh_index_for_config_entry,
 )
 from .entities import (
     EntityType,
@@ -53,8 +64,10 @@ from .entities import (
     LinksysVelopMultiUseEntity,
     LinksysVelopSpeedtestEntity,
 )
-from .helpers import remove_velop_entity_from_registry
+from .helpers import compact_attributes, remove_velop_entities_from_registry
 from .logger import Logger
+from .mesh_index import MeshIndex, NodePosition
+from .telemetry import CoordinatorTelemetry, RefreshSample
 
 # endregion
 
@@ -72,28 +85,6 @@ class LinksysVelopSensorEntityDescription(
     value_fn: Callable[..., StateType | dt.date | dt.datetime | Decimal] | None = None
 
 
-def get_devices(mesh: Mesh, state: bool = True) -> list[dict[str, Any]]:
-    """Get the matching devices from the Mesh."""
-    ret: list[dict[str, Any]] = []
-    device: DeviceEntity
-    for device in mesh.devices:
-        if bool(device.status) == state:
-            props: dict[str, Any] = {
-                "name": device.name.value,
-                "id": device.unique_id.value,
-            }
-            adi: AdapterInfo | None = next((adapter for adapter in device.adapter_info))
-            if adi is not None and device.status.value:
-                props["type"] = adi.type.value
-                props["guest_network"] = adi.guest_network
-                props["ip"] = adi.ip
-                props["ipv6"] = adi.ipv6
-                props["parent_name"] = device.parent_name.value
-            ret.append(props)
-
-    return ret
-
-
 def get_device_adapter_info(device: DeviceEntity, key: str) -> Any:
     """Retrieve the give details about a device adapter."""
 
@@ -143,6 +134,9 @@ async def async_setup_entry(
     """Initialise a sensor."""
 
     known_nodes: set[str] = set()
+    node_descriptions: dict[
+        tuple[bool, bool], tuple[LinksysVelopSensorEntityDescription, ...]
+    ] = {}
 
     def _create_entities() -> None:
         """Create the mesh and device entities."""
@@ -350,14 +344,25 @@ async def async_setup_entry(
         mesh_entities: list[LinksysVelopSensorEntityDescription] = []
         speedtest_entities: list[LinksysVelopSensorEntityDescription] = []
 
+        def _mesh_index() -> MeshIndex:
+            """Get the index from the latest refresh."""
+            return get_mesh_index_for_config_entry(config_entry)
+
+        def _telemetry() -> CoordinatorTelemetry:
+            """Get the telemetry for the mesh coordinator."""
+            return cast(
+                LinksysVelopDataUpdateCoordinatorMultiUse,
+                config_entry.runtime_data.coordinators.get(CoordinatorTypes.MESH),
+            ).telemetry
+
         if Actions.GET_DEVICES.key in config_entry.runtime_data.mesh.capabilities:
             mesh_entities.extend(
                 [
                     LinksysVelopSensorEntityDescription(
                         entity_category=EntityCategory.DIAGNOSTIC,
-                        esa_fn=lambda m: (
-                            {"devices": get_devices(m, False)}
-                            if get_devices(m, False)
+                        esa_fn=lambda _: (
+                            {"devices": _mesh_index().offline_summary}
+                            if _mesh_index().offline_summary
                             else {}
                         ),
                         key="",
@@ -365,19 +370,21 @@ async def async_setup_entry(
                         state_class=SensorStateClass.MEASUREMENT,
                         target_type=EntityType.MESH,
                         translation_key="offline_devices",
-                        value_fn=lambda m: (len(get_devices(m, False))),
+                        value_fn=lambda _: len(_mesh_index().offline_summary),
                     ),
                     LinksysVelopSensorEntityDescription(
                         entity_category=EntityCategory.DIAGNOSTIC,
-                        esa_fn=lambda m: (
-                            {"devices": get_devices(m)} if get_devices(m) else {}
+                        esa_fn=lambda _: (
+                            {"devices": _mesh_index().online_summary}
+                            if _mesh_index().online_summary
+                            else {}
                         ),
                         key="",
                         name="Online Devices",
                         state_class=SensorStateClass.MEASUREMENT,
                         target_type=EntityType.MESH,
                         translation_key="online_devices",
-                        value_fn=lambda m: len(get_devices(m)),
+                        value_fn=lambda _: len(_mesh_index().online_summary),
                     ),
                 ]
             )
@@ -389,13 +396,9 @@ async def async_setup_entry(
             mesh_entities.append(
                 LinksysVelopSensorEntityDescription(
                     entity_category=EntityCategory.DIAGNOSTIC,
-                    esa_fn=lambda m: (
-                        {
-                            "devices": (
-                                [d for d in get_devices(m) if d.get("guest_network")]
-                            )
-                        }
-                        if [d for d in get_devices(m) if d.get("guest_network")]
+                    esa_fn=lambda _: (
+                        {"devices": _mesh_index().guest_summary}
+                        if _mesh_index().guest_summary
                         else {}
                     ),
                     key="",
@@ -403,9 +406,7 @@ async def async_setup_entry(
                     state_class=SensorStateClass.MEASUREMENT,
                     target_type=EntityType.MESH,
                     translation_key="guest_devices",
-                    value_fn=lambda m: (
-                        len([d for d in get_devices(m) if d.get("guest_network")])
-                    ),
+                    value_fn=lambda _: len(_mesh_index().guest_summary),
                 ),
             )
 
@@ -552,6 +553,74 @@ async def async_setup_entry(
                 ),
             )
 
+        # region #-- telemetry for the refreshes --#
+        mesh_entities.extend(
+            [
+                LinksysVelopSensorEntityDescription(
+                    device_class=SensorDeviceClass.DATA_SIZE,
+                    entity_category=EntityCategory.DIAGNOSTIC,
+                    entity_registry_enabled_default=False,
+                    key="",
+                    name="Mesh Payload Size",
+                    native_unit_of_measurement=UnitOfInformation.BYTES,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    target_type=EntityType.MESH,
+                    translation_key="mesh_payload_size",
+                    update_every_refresh=True,
+                    value_fn=lambda _: _telemetry().payload_size,
+                ),
+                LinksysVelopSensorEntityDescription(
+                    entity_category=EntityCategory.DIAGNOSTIC,
+                    entity_registry_enabled_default=False,
+                    key="",
+                    name="Mesh Requests",
+                    state_class=SensorStateClass.TOTAL_INCREASING,
+                    target_type=EntityType.MESH,
+                    translation_key="mesh_requests",
+                    update_every_refresh=True,
+                    value_fn=lambda _: _telemetry().requests_total,
+                ),
+                LinksysVelopSensorEntityDescription(
+                    device_class=SensorDeviceClass.DURATION,
+                    entity_category=EntityCategory.DIAGNOSTIC,
+                    entity_registry_enabled_default=False,
+                    esa_fn=lambda _: (
+                        {
+                            "phases": cast(RefreshSample, _telemetry().last).phases_ms,
+                            "request": cast(RefreshSample, _telemetry().last).request,
+                            "started": cast(RefreshSample, _telemetry().last).started,
+                        }
+                        if _telemetry().last is not None
+                        else {}
+                    ),
+                    key="",
+                    name="Refresh Duration",
+                    native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+                    state_class=SensorStateClass.MEASUREMENT,
+                    target_type=EntityType.MESH,
+                    translation_key="refresh_duration",
+                    update_every_refresh=True,
+                    value_fn=lambda _: (
+                        cast(RefreshSample, _telemetry().last).duration_ms
+                        if _telemetry().last is not None
+                        else None
+                    ),
+                ),
+                LinksysVelopSensorEntityDescription(
+                    entity_category=EntityCategory.DIAGNOSTIC,
+                    entity_registry_enabled_default=False,
+                    key="",
+                    name="Refresh Failure Streak",
+                    state_class=SensorStateClass.MEASUREMENT,
+                    target_type=EntityType.MESH,
+                    translation_key="refresh_failure_streak",
+                    update_every_refresh=True,
+                    value_fn=lambda _: _telemetry().failure_streak,
+                ),
+            ]
+        )
+        # endregion
+
         ret = *[
             LinksysVelopSensorMultiUseEntity(
                 entity_context=context,
@@ -578,237 +647,241 @@ async def async_setup_entry(
 
         return ret
 
+    def _position(node: Any) -> NodePosition:
+        """Get the position of the node on the mesh."""
+
+        return get_mesh_index_for_config_entry(config_entry).get_position(
+            str(cast(NodeEntity, node).unique_id.value)
+        )
+
+    def _describe_node(
+        is_secondary: bool, is_wifi_node: bool
+    ) -> tuple[LinksysVelopSensorEntityDescription, ...]:
+        """Describe the entities for a type of node.
+
+        The descriptions only depend on the capabilities of the mesh and the
+        type of node, so they are built once and shared by the nodes of that type.
+        """
+
+        ret: tuple[LinksysVelopSensorEntityDescription, ...] = ()
+        mesh_entities: list[LinksysVelopSensorEntityDescription] = []
+
+        if (
+            Actions.GET_BACKHAUL.key in config_entry.runtime_data.mesh.capabilities
+            and is_secondary
+        ):
+            mesh_entities.extend(
+                [
+                    LinksysVelopSensorEntityDescription(
+                        device_class=SensorDeviceClass.TIMESTAMP,
+                        entity_category=EntityCategory.DIAGNOSTIC,
+                        entity_registry_enabled_default=False,
+                        key="",
+                        name="Backhaul Last Checked",
+                        target_type=EntityType.NODE,
+                        translation_key="backhaul_last_checked",
+                        value_fn=lambda n: (
+                            get_node_bachaul_info(n, "last_checked")
+                            if isinstance(n, NodeEntity)
+                            else None
+                        ),
+                    ),
+                    LinksysVelopSensorEntityDescription(
+                        device_class=SensorDeviceClass.DATA_RATE,
+                        entity_category=EntityCategory.DIAGNOSTIC,
+                        key="",
+                        name="Backhaul Speed",
+                        native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+                        suggested_display_precision=2,
+                        target_type=EntityType.NODE,
+                        translation_key="backhaul_speed",
+                        value_fn=lambda n: (
+                            get_node_bachaul_info(n, "speed_mbps")
+                            if isinstance(n, NodeEntity)
+                            else None
+                        ),
+                    ),
+                    LinksysVelopSensorEntityDescription(
+                        device_class=SensorDeviceClass.ENUM,
+                        entity_category=EntityCategory.DIAGNOSTIC,
+                        key="",
+                        name="Backhaul Type",
+                        options=[val.lower() for val in ConnectionType],
+                        target_type=EntityType.NODE,
+                        translation_key="backhaul_connection_type",
+                        value_fn=lambda n: (
+                            cast(
+                                ConnectionType,
+                                get_node_bachaul_info(n, "connection"),
+                            ).lower()
+                            if isinstance(n, NodeEntity)
+                            and get_node_bachaul_info(n, "connection") is not None
+                            else None
+                        ),
+                    ),
+                    LinksysVelopSensorEntityDescription(
+                        entity_category=EntityCategory.DIAGNOSTIC,
+                        esa_fn=lambda n: ({"parent_ip": cast(NodeEntity, n).parent_ip}),
+                        key="parent_name",
+                        name="Parent",
+                        target_type=EntityType.NODE,
+                        translation_key="parent_name",
+                        value_fn=lambda n: _position(n).parent_name,
+                    ),
+                    LinksysVelopSensorEntityDescription(
+                        entity_category=EntityCategory.DIAGNOSTIC,
+                        key="",
+                        name="Hops to Primary",
+                        state_class=SensorStateClass.MEASUREMENT,
+                        target_type=EntityType.NODE,
+                        translation_key="hops_to_primary",
+                        value_fn=lambda n: _position(n).hops,
+                    ),
+                ]
+            )
+
+            if is_wifi_node:
+                mesh_entities.extend(
+                    [
+                        LinksysVelopSensorEntityDescription(
+                            device_class=SensorDeviceClass.ENUM,
+                            entity_category=EntityCategory.DIAGNOSTIC,
+                            key="",
+                            name="Backhaul Friendly Signal Strength",
+                            options=[val.lower() for val in SignalStrength],
+                            target_type=EntityType.NODE,
+                            translation_key="backhaul_friendly_signal_strength",
+                            value_fn=lambda n: (
+                                cast(
+                                    SignalStrength,
+                                    get_node_bachaul_info(n, "signal_strength"),
+                                ).lower()
+                                if isinstance(n, NodeEntity)
+                                and get_node_bachaul_info(n, "signal_strength")
+                                is not None
+                                else None
+                            ),
+                        ),
+                        LinksysVelopSensorEntityDescription(
+                            entity_category=EntityCategory.DIAGNOSTIC,
+                            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+                            key="",
+                            name="Backhaul Signal Strength",
+                            native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+                            target_type=EntityType.NODE,
+                            translation_key="backhaul_signal_strength",
+                            value_fn=lambda n: (
+                                get_node_bachaul_info(n, "rssi_dbm")
+                                if isinstance(n, NodeEntity)
+                                else None
+                            ),
+                        ),
+                    ]
+                )
+
+        if Actions.GET_DEVICES.key in config_entry.runtime_data.mesh.capabilities:
+            mesh_entities.extend(
+                [
+                    LinksysVelopSensorEntityDescription(
+                        entity_category=EntityCategory.DIAGNOSTIC,
+                        esa_fn=lambda n: (
+                            {"devices": get_node_devices(cast(NodeEntity, n))}
+                            if cast(NodeEntity, n).connected_devices
+                            else {}
+                        ),
+                        key="",
+                        name="Connected Devices",
+                        state_class=SensorStateClass.MEASUREMENT,
+                        target_type=EntityType.NODE,
+                        translation_key="connected_devices",
+                        value_fn=lambda n: _position(n).device_count,
+                    ),
+                    LinksysVelopSensorEntityDescription(
+                        entity_category=EntityCategory.DIAGNOSTIC,
+                        key="model",
+                        name="Model",
+                        pic_fn=lambda d: (
+                            f"{prefix.rstrip('/').strip()}/{cast(NodeEntity, d).model}.png"
+                            if d is not None
+                            and (prefix := config_entry.options.get(CONF_NODE_IMAGES))
+                            not in (None, "")
+                            else None
+                        ),
+                        target_type=EntityType.NODE,
+                        translation_key="model",
+                    ),
+                    LinksysVelopSensorEntityDescription(
+                        entity_category=EntityCategory.DIAGNOSTIC,
+                        key="serial",
+                        name="Serial",
+                        target_type=EntityType.NODE,
+                        translation_key="serial",
+                    ),
+                    LinksysVelopSensorEntityDescription(
+                        device_class=SensorDeviceClass.ENUM,
+                        entity_category=EntityCategory.DIAGNOSTIC,
+                        key="",
+                        name="Type",
+                        options=[member.value for member in NodeType],
+                        target_type=EntityType.NODE,
+                        translation_key="node_type",
+                        value_fn=lambda n: cast(NodeEntity, n).type.value,
+                    ),
+                ]
+            )
+
+        if (
+            Actions.GET_UPDATE_FIRMWARE_STATE.key
+            in config_entry.runtime_data.mesh.capabilities
+        ):
+            mesh_entities.append(
+                LinksysVelopSensorEntityDescription(
+                    device_class=SensorDeviceClass.TIMESTAMP,
+                    entity_category=EntityCategory.DIAGNOSTIC,
+                    entity_registry_enabled_default=False,
+                    key="",
+                    name="Last Update Check",
+                    target_type=EntityType.NODE,
+                    translation_key="last_update_check",
+                    value_fn=lambda n: (
+                        dt_util.parse_datetime(
+                            str(cast(NodeEntity, n).last_update_check)
+                        )
+                        if cast(NodeEntity, n).last_update_check is not None
+                        else None
+                    ),
+                ),
+            )
+
+        ret = tuple(mesh_entities)
+        return ret
+
     def _init_node_entities() -> tuple[LinksysVelopSensorCoordinatorEntity, ...]:
         """Describe the entities that target nodes."""
 
         ret: tuple[LinksysVelopSensorCoordinatorEntity, ...] = ()
         ret_temp: list[LinksysVelopSensorCoordinatorEntity] = []
-        current_nodes: set[str] = {
-            n.unique_id
-            for n in config_entry.runtime_data.mesh.nodes
-            if n.unique_id is not None
-        }
-        new_nodes: set[str] = current_nodes - known_nodes
+        mesh_index: MeshIndex = get_mesh_index_for_config_entry(config_entry)
+        new_nodes: set[str] = mesh_index.nodes.keys() - known_nodes
 
         if new_nodes:
             known_nodes.update(new_nodes)
             for node in new_nodes:
-                mesh_entities: list[LinksysVelopSensorEntityDescription] = []
+                mesh_entities: tuple[LinksysVelopSensorEntityDescription, ...] = ()
                 context: LinksysVelopEntityContext = LinksysVelopEntityContext(
                     unique_id=node
                 )
-                node_details: NodeEntity | None = next(
-                    (
-                        n
-                        for n in config_entry.runtime_data.mesh.nodes
-                        if n.unique_id == context.unique_id
-                    ),
-                    None,
-                )
+                node_details: NodeEntity | None = mesh_index.nodes.get(node)
 
                 if node_details is not None:
-                    is_wifi_node: bool = (
+                    node_type: tuple[bool, bool] = (
+                        node_details.type == NodeType.SECONDARY,
                         node_details.backhaul.value is not None
-                        and node_details.backhaul.connection == ConnectionType.WIRELESS
+                        and node_details.backhaul.connection == ConnectionType.WIRELESS,
                     )
-
-                    if (
-                        Actions.GET_BACKHAUL.key
-                        in config_entry.runtime_data.mesh.capabilities
-                        and node_details.type == NodeType.SECONDARY
-                    ):
-                        mesh_entities.extend(
-                            [
-                                LinksysVelopSensorEntityDescription(
-                                    device_class=SensorDeviceClass.TIMESTAMP,
-                                    entity_category=EntityCategory.DIAGNOSTIC,
-                                    entity_registry_enabled_default=False,
-                                    key="",
-                                    name="Backhaul Last Checked",
-                                    target_type=EntityType.NODE,
-                                    translation_key="backhaul_last_checked",
-                                    value_fn=lambda n: (
-                                        get_node_bachaul_info(n, "last_checked")
-                                        if isinstance(n, NodeEntity)
-                                        else None
-                                    ),
-                                ),
-                                LinksysVelopSensorEntityDescription(
-                                    device_class=SensorDeviceClass.DATA_RATE,
-                                    entity_category=EntityCategory.DIAGNOSTIC,
-                                    key="",
-                                    name="Backhaul Speed",
-                                    native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
-                                    suggested_display_precision=2,
-                                    target_type=EntityType.NODE,
-                                    translation_key="backhaul_speed",
-                                    value_fn=lambda n: (
-                                        get_node_bachaul_info(n, "speed_mbps")
-                                        if isinstance(n, NodeEntity)
-                                        else None
-                                    ),
-                                ),
-                                LinksysVelopSensorEntityDescription(
-                                    device_class=SensorDeviceClass.ENUM,
-                                    entity_category=EntityCategory.DIAGNOSTIC,
-                                    key="",
-                                    name="Backhaul Type",
-                                    options=[val.lower() for val in ConnectionType],
-                                    target_type=EntityType.NODE,
-                                    translation_key="backhaul_connection_type",
-                                    value_fn=lambda n: (
-                                        cast(
-                                            ConnectionType,
-                                            get_node_bachaul_info(n, "connection"),
-                                        ).lower()
-                                        if isinstance(n, NodeEntity)
-                                        and get_node_bachaul_info(n, "connection")
-                                        is not None
-                                        else None
-                                    ),
-                                ),
-                                LinksysVelopSensorEntityDescription(
-                                    entity_category=EntityCategory.DIAGNOSTIC,
-                                    esa_fn=lambda n: (
-                                        {"parent_ip": cast(NodeEntity, n).parent_ip}
-                                    ),
-                                    key="parent_name",
-                                    name="Parent",
-                                    target_type=EntityType.NODE,
-                                    translation_key="parent_name",
-                                ),
-                            ]
-                        )
-
-                        if is_wifi_node:
-                            mesh_entities.extend(
-                                [
-                                    LinksysVelopSensorEntityDescription(
-                                        device_class=SensorDeviceClass.ENUM,
-                                        entity_category=EntityCategory.DIAGNOSTIC,
-                                        key="",
-                                        name="Backhaul Friendly Signal Strength",
-                                        options=[val.lower() for val in SignalStrength],
-                                        target_type=EntityType.NODE,
-                                        translation_key="backhaul_friendly_signal_strength",
-                                        value_fn=lambda n: (
-                                            cast(
-                                                SignalStrength,
-                                                get_node_bachaul_info(
-                                                    n, "signal_strength"
-                                                ),
-                                            ).lower()
-                                            if isinstance(n, NodeEntity)
-                                            and get_node_bachaul_info(
-                                                n, "signal_strength"
-                                            )
-                                            is not None
-                                            else None
-                                        ),
-                                    ),
-                                    LinksysVelopSensorEntityDescription(
-                                        entity_category=EntityCategory.DIAGNOSTIC,
-                                        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
-                                        key="",
-                                        name="Backhaul Signal Strength",
-                                        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-                                        target_type=EntityType.NODE,
-                                        translation_key="backhaul_signal_strength",
-                                        value_fn=lambda n: (
-                                            get_node_bachaul_info(n, "rssi_dbm")
-                                            if isinstance(n, NodeEntity)
-                                            else None
-                                        ),
-                                    ),
-                                ]
-                            )
-
-                    if (
-                        Actions.GET_DEVICES.key
-                        in config_entry.runtime_data.mesh.capabilities
-                    ):
-                        mesh_entities.extend(
-                            [
-                                LinksysVelopSensorEntityDescription(
-                                    entity_category=EntityCategory.DIAGNOSTIC,
-                                    esa_fn=lambda n: (
-                                        {
-                                            "devices": get_node_devices(
-                                                cast(NodeEntity, n)
-                                            )
-                                        }
-                                        if cast(NodeEntity, n).connected_devices
-                                        else {}
-                                    ),
-                                    key="",
-                                    name="Connected Devices",
-                                    state_class=SensorStateClass.MEASUREMENT,
-                                    target_type=EntityType.NODE,
-                                    translation_key="connected_devices",
-                                    value_fn=lambda n: (
-                                        len(cast(NodeEntity, n).connected_devices)
-                                    ),
-                                ),
-                                LinksysVelopSensorEntityDescription(
-                                    entity_category=EntityCategory.DIAGNOSTIC,
-                                    key="model",
-                                    name="Model",
-                                    pic_fn=lambda d: (
-                                        f"{prefix.rstrip('/').strip()}/{cast(NodeEntity, d).model}.png"
-                                        if d is not None
-                                        and (
-                                            prefix := config_entry.options.get(
-                                                CONF_NODE_IMAGES
-                                            )
-                                        )
-                                        not in (None, "")
-                                        else None
-                                    ),
-                                    target_type=EntityType.NODE,
-                                    translation_key="model",
-                                ),
-                                LinksysVelopSensorEntityDescription(
-                                    entity_category=EntityCategory.DIAGNOSTIC,
-                                    key="serial",
-                                    name="Serial",
-                                    target_type=EntityType.NODE,
-                                    translation_key="serial",
-                                ),
-                                LinksysVelopSensorEntityDescription(
-                                    device_class=SensorDeviceClass.ENUM,
-                                    entity_category=EntityCategory.DIAGNOSTIC,
-                                    key="",
-                                    name="Type",
-                                    options=[member.value for member in NodeType],
-                                    target_type=EntityType.NODE,
-                                    translation_key="node_type",
-                                    value_fn=lambda n: cast(NodeEntity, n).type.value,
-                                ),
-                            ]
-                        )
-
-                    if (
-                        Actions.GET_UPDATE_FIRMWARE_STATE.key
-                        in config_entry.runtime_data.mesh.capabilities
-                    ):
-                        mesh_entities.append(
-                            LinksysVelopSensorEntityDescription(
-                                device_class=SensorDeviceClass.TIMESTAMP,
-                                entity_category=EntityCategory.DIAGNOSTIC,
-                                entity_registry_enabled_default=False,
-                                key="",
-                                name="Last Update Check",
-                                target_type=EntityType.NODE,
-                                translation_key="last_update_check",
-                                value_fn=lambda n: (
-                                    dt_util.parse_datetime(
-                                        str(cast(NodeEntity, n).last_update_check)
-                                    )
-                                    if cast(NodeEntity, n).last_update_check is not None
-                                    else None
-                                ),
-                            ),
-                        )
+                    if node_type not in node_descriptions:
+                        node_descriptions[node_type] = _describe_node(*node_type)
+                    mesh_entities = node_descriptions[node_type]
 
                 ret_temp.extend(
                     [
@@ -869,6 +942,7 @@ async def async_setup_entry(
                         f"{node.unique_id}::{ENTITY_DOMAIN}::backhaul_last_checked",
                         f"{node.unique_id}::{ENTITY_DOMAIN}::backhaul_speed",
                         f"{node.unique_id}::{ENTITY_DOMAIN}::backhaul_type",
+                        f"{node.unique_id}::{ENTITY_DOMAIN}::hops_to_primary",
                         f"{node.unique_id}::{ENTITY_DOMAIN}::parent",
                     }
                 )
@@ -952,12 +1026,9 @@ async def async_setup_entry(
         # endregion
 
         if len(entities_to_remove) > 0:
-            for entity_unique_id in entities_to_remove:
-                remove_velop_entity_from_registry(
-                    hass,
-                    config_entry.entry_id,
-                    entity_unique_id,
-                )
+            remove_velop_entities_from_registry(
+                hass, config_entry.entry_id, entities_to_remove
+            )
 
     def create_node_entities() -> None:
         """Create the node entities.
@@ -996,6 +1067,10 @@ class LinksysVelopSensorMultiUseEntity(
 ):
     """Linksys Velop sensor that uses multi use DataUpdateCoordinator."""
 
+    _unrecorded_attributes: frozenset[str] = frozenset(
+        {"devices", "reservations", "sites"}
+    )
+
     @property
     @override
     def entity_picture(self) -> str | None:
@@ -1010,6 +1085,18 @@ class LinksysVelopSensorMultiUseEntity(
     @override
     def extra_state_attributes(self) -> dict[str, Any] | None:
 
+        ret: dict[str, Any] | None = self.get_extra_state_attributes()
+
+        if ret and self.coordinator.config_entry.options.get(
+            CONF_COMPACT_ATTRIBUTES, DEF_COMPACT_ATTRIBUTES
+        ):
+            ret = compact_attributes(ret, self._unrecorded_attributes)
+
+        return ret
+
+    def get_extra_state_attributes(self) -> dict[str, Any] | None:
+        """Get the attributes without compacting them."""
+
         ret: dict[str, Any] | None = None
 
         if self.entity_description.esa_fn is not None:
@@ -5,14 +5,21 @@ from __future__ import annotations
 
 import functools
 import logging
-import uuid
+from datetime import timedelta
+from typing import Any, cast
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ServiceValidationError
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity_platform import EntityPlatform, async_get_platforms
+from homeassistant.util import dt as dt_util
 from pyvelop.exceptions import MeshInvalidInput, MeshTooManyMatches
-from pyvelop.mesh import Mesh
 from pyvelop.mesh_entity import (
     DeviceEntity,
     NodeEntity,
@@ -22,8 +29,16 @@ from pyvelop.mesh_entity import (
 )
 
 from .const import CONF_EVENTS_OPTIONS, DEF_EVENTS_OPTIONS, DOMAIN, EventSubTypes
-from .coordinator import LinksysVelopConfigEntry
+from .coordinator import (
+    CoordinatorTimers,
+    CoordinatorTypes,
+    LinksysVelopConfigEntry,
+    LinksysVelopDataUpdateCoordinatorMultiUse,
+    get_mesh_index_for_config_entry,
+)
 from .logger import Logger
+from .mesh_index import DEVICE_FIELDS, MeshIndex
+from .query import DeviceQuery, query_devices
 
 # endregion
 
@@ -60,6 +75,39 @@ def deprectated_service(solution: str):
     return deprecated_decorator
 
 
+def _get_internet_access_rules(pause: bool) -> dict[str, str | None]:
+    """Build the rules to pause or resume Internet access."""
+    ret: dict[str, str | None] = {}
+
+    for weekday in Weekdays:
+        ret[weekday.name.lower()] = (
+            None
+            if not pause
+            else str(
+                ParentalControl.binary_to_human_readable(
+                    ParentalControl.ALL_PAUSED_SCHEDULE().get(weekday.name.lower(), "")
+                )
+            )
+        )
+
+    return ret
+
+
+def _get_internet_rules(**kwargs) -> dict[str, str | None]:
+    """Build the rules from the times in the service call."""
+    ret: dict[str, str | None] = {}
+
+    for day in Weekdays:
+        times: list[str] = kwargs.get(day.name.lower(), [])
+        if times:
+            times = ["00:00-00:00" if t == "all_day" else t for t in times]
+            ret[day.name.lower()] = ",".join(times)
+        else:
+            ret[day.name.lower()] = None
+
+    return ret
+
+
 class LinksysVelopServiceHandler:
     """Define and action serice calls."""
 
@@ -96,6 +144,59 @@ class LinksysVelopServiceHandler:
                 }
             )
         },
+        "devices_internet_access": {
+            "schema": vol.Schema(
+                {
+                    vol.Required("mesh"): str,
+                    vol.Required("devices"): [str],
+                    vol.Required("pause"): bool,
+                }
+            ),
+            "supports_response": SupportsResponse.OPTIONAL,
+        },
+        "devices_internet_rules": {
+            "schema": vol.Schema(
+                {
+                    vol.Required("mesh"): str,
+                    vol.Required("devices"): [str],
+                    vol.Optional("sunday"): list,
+                    vol.Optional("monday"): list,
+                    vol.Optional("tuesday"): list,
+                    vol.Optional("wednesday"): list,
+                    vol.Optional("thursday"): list,
+                    vol.Optional("friday"): list,
+                    vol.Optional("saturday"): list,
+                }
+            ),
+            "supports_response": SupportsResponse.OPTIONAL,
+        },
+        "entity_attributes": {
+            "schema": vol.Schema(
+                {
+                    vol.Required("mesh"): str,
+                    vol.Required("entity_id"): str,
+                }
+            ),
+            "supports_response": SupportsResponse.ONLY,
+        },
+        "query": {
+            "schema": vol.Schema(
+                {
+                    vol.Required("mesh"): str,
+                    vol.Optional("band"): str,
+                    vol.Optional("fields"): [vol.In(DEVICE_FIELDS)],
+                    vol.Optional("guest_network"): bool,
+                    vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                    vol.Optional("node"): str,
+                    vol.Optional("offline_for"): vol.All(
+                        vol.Coerce(int), vol.Range(min=0)
+                    ),
+                    vol.Optional("offset"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional("online"): bool,
+                }
+            ),
+            "supports_response": SupportsResponse.ONLY,
+        },
         "reboot_node": {
             "schema": vol.Schema(
                 {
@@ -120,37 +221,83 @@ class LinksysVelopServiceHandler:
         """Initialise."""
         self._hass: HomeAssistant = hass
 
-    def _get_device(self, mesh: Mesh, value: str) -> list[DeviceEntity] | None:
-        """Get a device from the Mesh based on name or unique ID.
+    def _get_device(
+        self, mesh_index: MeshIndex, value: str
+    ) -> list[DeviceEntity] | None:
+        """Get a device from the Mesh based on name, unique ID, MAC or IP.
 
         N.B. this uses the devices from the last poll to retrieve
         details.
         """
-        ret: list[DeviceEntity] | None = None
-
-        try:
-            _ = uuid.UUID(value)
-            ret = [
-                device
-                for device in mesh.devices
-                if getattr(device, "unique_id", "").lower() == value.lower()
-            ]
-        except ValueError:
-            ret = [
-                device
-                for device in mesh.devices
-                if getattr(device, "name", "").lower() == value.lower()
-            ]
+        ret: list[DeviceEntity] = list(mesh_index.find_devices(value))
 
         return ret or None
 
-    async def _async_service_call(self, call: ServiceCall) -> None:
+    async def _async_set_rules_for_devices(
+        self,
+        config_entry: LinksysVelopConfigEntry,
+        devices: list[str],
+        rules: dict[str, str | None],
+        pause: bool | None = None,
+    ) -> ServiceResponse:
+        """Apply the same Parental Control rules to multiple devices.
+
+        The Mesh replaces the whole rule list for a device on each write so the
+        devices are updated one after the other. A single refresh is requested
+        once all devices have been updated.
+
+        :return: the outcome for each of the requested devices
+        """
+        results: dict[str, dict[str, Any]] = {}
+        applied: set[str] = set()
+        mesh_index: MeshIndex = get_mesh_index_for_config_entry(config_entry)
+
+        for value in dict.fromkeys(devices):
+            device: list[DeviceEntity] | None = self._get_device(mesh_index, value)
+            if device is None:
+                results[value] = {"success": False, "error": f"Unknown device: {value}"}
+                continue
+            if len(device) > 1:
+                results[value] = {
+                    "success": False,
+                    "error": f"Multiple devices match: {value}",
+                }
+                continue
+
+            device_id: str = str(device[0].unique_id.value)
+            results[value] = {"id": device_id, "success": True}
+            if device_id in applied:
+                continue
+
+            try:
+                if pause is None:
+                    await device[0].async_set_parental_control_rules(rules)
+                else:
+                    await device[0].async_set_parental_control_rules(rules, pause)
+            except Exception as err:
+                _LOGGER.warning("%s: %s", value, err)
+                results[value].update({"success": False, "error": str(err)})
+            else:
+                applied.add(device_id)
+
+        if applied:
+            coordinator: LinksysVelopDataUpdateCoordinatorMultiUse = cast(
+                LinksysVelopDataUpdateCoordinatorMultiUse,
+                config_entry.runtime_data.coordinators.get(CoordinatorTypes.MESH),
+            )
+            await coordinator.async_force_refresh(CoordinatorTimers.MESH)
+
+        ret: ServiceResponse = {"results": results}
+        return ret
+
+    async def _async_service_call(self, call: ServiceCall) -> ServiceResponse:
         """Call the required method based on the given argument.
 
         :param call: the service call that should be made
-        :return: None
+        :return: the response from the service, if it provides one
         """
 
+        ret: ServiceResponse = None
         args = call.data.copy()
         config_entry_id: str | None = args.pop("mesh")
         if config_entry_id is not None:
@@ -173,7 +320,7 @@ class LinksysVelopServiceHandler:
             _LOGGER.debug("using %s", config_entry.runtime_data.mesh)
             if (method := getattr(self, call.service, None)) is not None:
                 try:
-                    await method(**args, config_entry=config_entry)
+                    ret = await method(**args, config_entry=config_entry)
                 except MeshInvalidInput as exc:
                     raise ServiceValidationError(
                         translation_domain=DOMAIN,
@@ -185,8 +332,22 @@ class LinksysVelopServiceHandler:
                     ) from exc
                 except Exception as err:
                     _LOGGER.warning("%s", err)
+                    # a response is expected so the failure needs reporting
+                    if (
+                        self.SERVICES.get(call.service, {}).get("supports_response")
+                        == SupportsResponse.ONLY
+                    ):
+                        raise HomeAssistantError(
+                            translation_domain=DOMAIN,
+                            translation_key="general",
+                            translation_placeholders={
+                                "exc_type": type(err).__name__,
+                                "exc_msg": str(err),
+                            },
+                        ) from err
 
         _LOGGER.debug("exited")
+        return ret
 
     def register_services(self) -> None:
         """Register the services."""
@@ -196,6 +357,9 @@ class LinksysVelopServiceHandler:
                 service=service_name,
                 service_func=self._async_service_call,
                 schema=service_details.get("schema", None),
+                supports_response=service_details.get(
+                    "supports_response", SupportsResponse.NONE
+                ),
             )
 
     def unregister_services(self) -> None:
@@ -212,7 +376,7 @@ class LinksysVelopServiceHandler:
         device: list[DeviceEntity] | None = None
         if (
             device := self._get_device(
-                config_entry.runtime_data.mesh, kwargs.get("device", "")
+                get_mesh_index_for_config_entry(config_entry), kwargs.get("device", "")
             )
         ) is None:
             raise MeshInvalidInput(
@@ -239,26 +403,16 @@ class LinksysVelopServiceHandler:
         device: list[DeviceEntity] | None = None
         if (
             device := self._get_device(
-                config_entry.runtime_data.mesh, kwargs.get("device", "")
+                get_mesh_index_for_config_entry(config_entry), kwargs.get("device", "")
             )
         ) is None:
             raise MeshInvalidInput(
                 f"Unknown device: {kwargs.get('device', '')}"
             ) from None
 
-        rules_to_apply: dict[str, str | None] = {}
-        for weekday in Weekdays:
-            rules_to_apply[weekday.name.lower()] = (
-                None
-                if not kwargs.get("pause", False)
-                else str(
-                    ParentalControl.binary_to_human_readable(
-                        ParentalControl.ALL_PAUSED_SCHEDULE().get(
-                            weekday.name.lower(), ""
-                        )
-                    )
-                )
-            )
+        rules_to_apply: dict[str, str | None] = _get_internet_access_rules(
+            kwargs.get("pause", False)
+        )
 
         await device[0].async_set_parental_control_rules(
             rules_to_apply, True if kwargs.get("pause", False) else False
@@ -275,33 +429,117 @@ class LinksysVelopServiceHandler:
         device: list[DeviceEntity] | None = None
         if (
             device := self._get_device(
-                config_entry.runtime_data.mesh, kwargs.get("device", "")
+                get_mesh_index_for_config_entry(config_entry), kwargs.get("device", "")
             )
         ) is None:
             raise MeshInvalidInput(
                 f"Unknown device: {kwargs.get('device', '')}"
             ) from None
 
-        def _process_times() -> dict[str, str | None]:
-            """Process the times from the service call."""
-            ret: dict[str, str | None] = {}
+        rules_to_apply: dict[str, str | None] = _get_internet_rules(**kwargs)
+        _LOGGER.debug("rules_to_apply: %s", rules_to_apply)
 
-            for day in Weekdays:
-                times: list[str] = kwargs.get(day.name.lower(), [])
-                if times:
-                    times = ["00:00-00:00" if t == "all_day" else t for t in times]
-                    ret[day.name.lower()] = ",".join(times)
-                else:
-                    ret[day.name.lower()] = None
+        await device[0].async_set_parental_control_rules(rules_to_apply)
 
-            return ret
+        _LOGGER.debug("exited")
+
+    async def devices_internet_access(
+        self, config_entry: LinksysVelopConfigEntry, **kwargs
+    ) -> ServiceResponse:
+        """Change state of Internet access for multiple devices."""
+        _LOGGER.debug("entered, %s", kwargs)
+
+        pause: bool = True if kwargs.get("pause", False) else False
+        rules_to_apply: dict[str, str | None] = _get_internet_access_rules(pause)
+
+        ret: ServiceResponse = await self._async_set_rules_for_devices(
+            config_entry, kwargs.get("devices", []), rules_to_apply, pause
+        )
+
+        _LOGGER.debug("exited")
+        return ret
+
+    async def devices_internet_rules(
+        self, config_entry: LinksysVelopConfigEntry, **kwargs
+    ) -> ServiceResponse:
+        """Set Parental Control rules for multiple devices."""
+        _LOGGER.debug("entered, %s", kwargs)
 
-        rules_to_apply: dict[str, str | None] = _process_times()
+        rules_to_apply: dict[str, str | None] = _get_internet_rules(**kwargs)
         _LOGGER.debug("rules_to_apply: %s", rules_to_apply)
 
-        await device[0].async_set_parental_control_rules(rules_to_apply)
+        ret: ServiceResponse = await self._async_set_rules_for_devices(
+            config_entry, kwargs.get("devices", []), rules_to_apply
+        )
+
+        _LOGGER.debug("exited")
+        return ret
+
+    async def entity_attributes(
+        self, config_entry: LinksysVelopConfigEntry, **kwargs
+    ) -> ServiceResponse:
+        """Get the full attributes for an entity.
+
+        The attributes are returned as they would be without the compact
+        attributes option, so lists of devices etc. are available on demand.
+        """
+        _LOGGER.debug("entered, kwargs: %s", kwargs)
+
+        entity_id: str = kwargs.get("entity_id", "")
+        platforms: list[EntityPlatform] = [
+            platform
+            for platform in async_get_platforms(self._hass, DOMAIN)
+            if platform.config_entry is not None
+            and platform.config_entry.entry_id == config_entry.entry_id
+        ]
+        entity: Any = next(
+            (
+                platform.entities[entity_id]
+                for platform in platforms
+                if entity_id in platform.entities
+            ),
+            None,
+        )
+        if entity is None or not hasattr(entity, "get_extra_state_attributes"):
+            raise MeshInvalidInput(f"Unknown entity: {entity_id}") from None
+
+        ret: ServiceResponse = {"attributes": entity.get_extra_state_attributes() or {}}
+
+        _LOGGER.debug("exited")
+        return ret
+
+    async def query(
+        self, config_entry: LinksysVelopConfigEntry, **kwargs
+    ) -> ServiceResponse:
+        """Query the devices from the last poll of the mesh.
+
+        `offline_for` is the number of minutes that a device has been offline
+        for, measured from when it was first seen offline.
+        """
+        _LOGGER.debug("entered, kwargs: %s", kwargs)
+
+        device_query: DeviceQuery = DeviceQuery(
+            band=kwargs.get("band"),
+            fields=tuple(kwargs.get("fields", ())),
+            guest_network=kwargs.get("guest_network"),
+            limit=kwargs.get("limit"),
+            node=kwargs.get("node"),
+            offline_for=(
+                timedelta(minutes=kwargs["offline_for"])
+                if "offline_for" in kwargs
+                else None
+            ),
+            offset=kwargs.get("offset", 0),
+            online=kwargs.get("online"),
+        )
+        ret: ServiceResponse = query_devices(
+            get_mesh_index_for_config_entry(config_entry),
+            device_query,
+            dt_util.utcnow(),
+        )
 
         _LOGGER.debug("exited")
+        return ret
 
     async def reboot_node(
         self, config_entry: LinksysVelopConfigEntry, **kwargs
@@ -358,7 +596,7 @@ class LinksysVelopServiceHandler:
         device: list[DeviceEntity] | None = None
         if (
             device := self._get_device(
-                config_entry.runtime_data.mesh, kwargs.get("device", "")
+                get_mesh_index_for_config_entry(config_entry), kwargs.get("device", "")
             )
         ) is None:
             raise MeshInvalidInput(
@@ -17,11 +17,16 @@ from pyvelop.mesh_attribute import MeshAttribute
 from pyvelop.mesh_entity import DeviceEntity, ParentalControl, Weekdays
 
 from . import LinksysVelopConfigEntry
-from .const import CONF_UI_DEVICES
+from .const import (
+    CONF_COMPACT_ATTRIBUTES,
+    CONF_UI_DEVICES,
+    DEF_COMPACT_ATTRIBUTES,
+)
 from .coordinator import (
     CoordinatorTimers,
     CoordinatorTypes,
     LinksysVelopDataUpdateCoordinatorMultiUse,
+    get_mesh_index_for_config_entry,
 )
 from .entities import (
     EntityType,
@@ -29,7 +34,7 @@ from .entities import (
     LinksysVelopEntityDescription,
     LinksysVelopMultiUseEntity,
 )
-from .helpers import remove_velop_entity_from_registry
+from .helpers import compact_attributes, remove_velop_entities_from_registry
 from .logger import Logger
 
 # endregion
@@ -238,17 +243,11 @@ async def async_setup_entry(
             mesh_entities.append(
                 LinksysVelopSwitchEntityDescription(
                     entity_category=EntityCategory.CONFIG,
-                    esa_fn=lambda m: (
-                        {
-                            "rules": {
-                                cast(DeviceEntity, device)
-                                .name.value: cast(DeviceEntity, device)
-                                .parental_control_schedule.value
-                                for device in cast(Mesh, m).devices
-                                if cast(DeviceEntity, device).parental_control_schedule
-                            }
-                        }
-                    ),
+                    esa_fn=lambda _: {
+                        "rules": get_mesh_index_for_config_entry(
+                            config_entry
+                        ).parental_control_rules
+                    },
                     key="parental_control_enabled",
                     name="Parental Control",
                     off_fn=async_set_mesh_parental_control_state,
@@ -355,12 +354,9 @@ async def async_setup_entry(
             entities_to_remove.add(f"{config_entry.entry_id}::{ENTITY_DOMAIN}::wps")
 
         if len(entities_to_remove) > 0:
-            for entity_unique_id in entities_to_remove:
-                remove_velop_entity_from_registry(
-                    hass,
-                    config_entry.entry_id,
-                    entity_unique_id,
-                )
+            remove_velop_entities_from_registry(
+                hass, config_entry.entry_id, entities_to_remove
+            )
 
     def create_node_entities() -> None:
         """Create the node entities.
@@ -399,6 +395,8 @@ class LinksysVelopSwitchMultiUseEntity(
 ):
     """Linksys Velop switch that uses the multi use DataUpdateCoordinator."""
 
+    _unrecorded_attributes: frozenset[str] = frozenset({"rules"})
+
     @override
     async def async_turn_on(self, **kwargs: Any) -> None:
 
@@ -415,6 +413,18 @@ class LinksysVelopSwitchMultiUseEntity(
     @override
     def extra_state_attributes(self) -> dict[str, Any] | None:
 
+        ret: dict[str, Any] | None = self.get_extra_state_attributes()
+
+        if ret and self.coordinator.config_entry.options.get(
+            CONF_COMPACT_ATTRIBUTES, DEF_COMPACT_ATTRIBUTES
+        ):
+            ret = compact_attributes(ret, self._unrecorded_attributes)
+
+        return ret
+
+    def get_extra_state_attributes(self) -> dict[str, Any] | None:
+        """Get the attributes without compacting them."""
+
         ret: dict[str, Any] | None = None
 
         if self.entity_description.esa_fn is not None:
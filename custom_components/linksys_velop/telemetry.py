@@ -0,0 +1,125 @@
+"""Record the cost of refreshing the data from the mesh."""
+
+# region #-- imports --#
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import DEF_TELEMETRY_HISTORY
+
+# endregion
+
+
+@dataclass(kw_only=True)
+class RefreshSample:
+    """Measurements for a single refresh of a coordinator."""
+
+    duration_ms: float | None = None
+    payload_size: int | None = None
+    phases_ms: dict[str, float] = field(default_factory=dict)
+    request: str | None = None
+    requests: int = 0
+    started: datetime = field(default_factory=dt_util.utcnow)
+    success: bool | None = None
+
+
+class CoordinatorTelemetry:
+    """Keep the measurements for the recent refreshes of a coordinator.
+
+    Phases are timed by the caller taking `time.perf_counter()` at the start
+    of the phase and passing it to `record_phase` at the end. Phases recorded
+    outside of a refresh, e.g. updating the listeners, are added to the most
+    recent refresh.
+    """
+
+    def __init__(self, history: int = DEF_TELEMETRY_HISTORY) -> None:
+        """Initialise."""
+
+        self._current: RefreshSample | None = None
+        self._started: float | None = None
+        self.failure_streak: int = 0
+        self.history: deque[RefreshSample] = deque(maxlen=history)
+        self.payload_size: int | None = None
+        self.requests_total: int = 0
+
+    @property
+    def last(self) -> RefreshSample | None:
+        """Get the most recent completed refresh."""
+
+        ret: RefreshSample | None = self.history[-1] if self.history else None
+        return ret
+
+    def _sample(self) -> RefreshSample | None:
+        """Get the sample that measurements should be added to."""
+
+        ret: RefreshSample | None = self._current or self.last
+        return ret
+
+    def count_request(self, count: int = 1) -> None:
+        """Count the requests made to the mesh."""
+
+        self.requests_total += count
+        if (sample := self._sample()) is not None:
+            sample.requests += count
+
+    def describe(self, request: str) -> None:
+        """Set the type of request being made for the current refresh."""
+
+        if self._current is not None:
+            self._current.request = request
+
+    def finish(self, success: bool) -> None:
+        """Complete the current refresh."""
+
+        if self._current is None or self._started is None:
+            return
+
+        self._current.duration_ms = round(
+            (time.perf_counter() - self._started) * 1000, 3
+        )
+        self._current.success = success
+        self.failure_streak = 0 if success else self.failure_streak + 1
+        self.history.append(self._current)
+        self._current = None
+        self._started = None
+
+    def record_payload(self, size: int) -> None:
+        """Record the size of the data received from the mesh."""
+
+        self.payload_size = size
+        if (sample := self._sample()) is not None:
+            sample.payload_size = size
+
+    def record_phase(self, phase: str, started: float) -> None:
+        """Record the time taken for a phase of the refresh.
+
+        :param phase: the name of the phase
+        :param started: the value of `time.perf_counter()` when the phase started
+        """
+
+        if (sample := self._sample()) is not None:
+            sample.phases_ms[phase] = round(
+                sample.phases_ms.get(phase, 0) + (time.perf_counter() - started) * 1000,
+                3,
+            )
+
+    def start(self) -> None:
+        """Start measuring a refresh."""
+
+        self._current = RefreshSample()
+        self._started = time.perf_counter()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the telemetry for diagnostics."""
+
+        ret: dict[str, Any] = {
+            "failure_streak": self.failure_streak,
+            "history": [asdict(sample) for sample in self.history],
+            "payload_size": self.payload_size,
+            "requests_total": self.requests_total,
+        }
+        return ret
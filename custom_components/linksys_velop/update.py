@@ -24,6 +24,7 @@ from .coordinator import (
     CoordinatorTimers,
     CoordinatorTypes,
     LinksysVelopDataUpdateCoordinatorMultiUse,
+    get_mesh_index_for_config_entry,
 )
 from .entities import (
     EntityType,
@@ -31,7 +32,7 @@ from .entities import (
     LinksysVelopEntityDescription,
     LinksysVelopMultiUseEntity,
 )
-from .helpers import remove_velop_entity_from_registry
+from .helpers import remove_velop_entities_from_registry
 from .logger import Logger
 
 # endregion
@@ -83,42 +84,39 @@ async def async_setup_entry(
         """Describe the entities that target nodes."""
         ret: tuple[LinksysVelopUpdateCoordinatorEntity, ...] = ()
         ret_temp: list[LinksysVelopUpdateCoordinatorEntity] = []
-        current_nodes: set[str] = {
-            str(cast(NodeEntity, n).unique_id)
-            for n in config_entry.runtime_data.mesh.nodes
-            if cast(NodeEntity, n).unique_id.value is not None
-        }
-        new_nodes: set[str] = current_nodes - known_nodes
+        new_nodes: set[str] = (
+            get_mesh_index_for_config_entry(config_entry).nodes.keys() - known_nodes
+        )
 
         if new_nodes:
             known_nodes.update(new_nodes)
+            # the same descriptions are used for all nodes
+            mesh_entities: list[LinksysVelopUpdateEntityDescription] = []
+
+            if (
+                Actions.GET_UPDATE_FIRMWARE_STATE.key
+                in config_entry.runtime_data.mesh.capabilities
+            ):
+                mesh_entities.append(
+                    LinksysVelopUpdateEntityDescription(
+                        device_class=UpdateDeviceClass.FIRMWARE,
+                        key="",
+                        name="Update",
+                        pic_fn=lambda n: (
+                            f"{prefix.rstrip('/').strip()}/{cast(NodeEntity, n).model.value}.png"
+                            if (prefix := config_entry.options.get(CONF_NODE_IMAGES))
+                            not in (None, "")
+                            else None
+                        ),
+                        target_type=EntityType.NODE,
+                        translation_key="update",
+                    ),
+                )
+
             for node in new_nodes:
                 context: LinksysVelopEntityContext = LinksysVelopEntityContext(
                     unique_id=node
                 )
-                mesh_entities: list[LinksysVelopUpdateEntityDescription] = []
-
-                if (
-                    Actions.GET_UPDATE_FIRMWARE_STATE.key
-                    in config_entry.runtime_data.mesh.capabilities
-                ):
-                    mesh_entities.append(
-                        LinksysVelopUpdateEntityDescription(
-                            device_class=UpdateDeviceClass.FIRMWARE,
-                            key="",
-                            name="Update",
-                            pic_fn=lambda n: (
-                                f"{prefix.rstrip('/').strip()}/{cast(NodeEntity, n).model.value}.png"
-                                if (
-                                    prefix := config_entry.options.get(CONF_NODE_IMAGES)
-                                )
-                                not in (None, "")
-                                else None
-                            ),
-                            target_type=EntityType.NODE,
-                            translation_key="update",
-                        ),
-                    )
 
                 ret_temp.extend(
                     [
@@ -155,12 +153,9 @@ async def async_setup_entry(
         # endregion
 
         if len(entities_to_remove) > 0:
-            for entity_unique_id in entities_to_remove:
-                remove_velop_entity_from_registry(
-                    hass,
-                    config_entry.entry_id,
-                    entity_unique_id,
-                )
+            remove_velop_entities_from_registry(
+                hass, config_entry.entry_id, entities_to_remove
+            )
 
     def create_node_entities() -> None:
         """Create the node entities.
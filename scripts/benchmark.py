@@ -0,0 +1,159 @@
+"""Measure the cost of polling a mesh using the mock router.
+
+Each poll gathers the details of the mesh, or only the devices, and indexes
+them in the same way as the coordinator. The time taken for each, the
+number of entities that would be updated, the requests made to the mesh and
+the memory allocated are written out as a line of JSON per poll, followed by
+a summary.
+
+Home Assistant, pyvelop and aiohttp need to be installed, e.g.
+
+    python scripts/benchmark.py --nodes 3 --devices 2000 --polls 20
+"""
+
+# region #-- imports --#
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+from pyvelop.exceptions import MeshConnectionError, MeshTimeoutError
+from pyvelop.mesh import Mesh
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.linksys_velop.mesh_index import MeshIndex  # noqa: E402
+from mock_router import MeshProfile, MockRouter  # noqa: E402
+
+# endregion
+
+
+def _summarise(values: list[float]) -> dict[str, float]:
+    """Summarise the measurements for the polls."""
+
+    ordered: list[float] = sorted(values)
+    ret: dict[str, float] = {
+        "max": round(ordered[-1], 3),
+        "median": round(statistics.median(ordered), 3),
+        "p95": round(ordered[max(0, round(len(ordered) * 0.95) - 1)], 3),
+    }
+    return ret
+
+
+async def async_poll(
+    mesh: Mesh, mesh_index: MeshIndex, devices_only: bool
+) -> tuple[MeshIndex, dict[str, float]]:
+    """Poll the mesh once and index the result.
+
+    :return: the new index and the measurements for the poll
+    """
+
+    started: float = time.perf_counter()
+    devices: Any = None
+    if devices_only:
+        devices = await mesh.async_get_devices(force_refresh=True)
+    else:
+        await mesh.async_gather_details()
+    fetched: float = time.perf_counter()
+
+    new_index: MeshIndex = (
+        mesh_index.with_devices(devices) if devices_only else MeshIndex.build(mesh)
+    )
+    changed: set[str] = new_index.changed_targets(mesh_index)
+    indexed: float = time.perf_counter()
+
+    ret: dict[str, float] = {
+        "changed_targets": len(changed),
+        "fetch_ms": round((fetched - started) * 1000, 3),
+        "index_ms": round((indexed - fetched) * 1000, 3),
+    }
+    return new_index, ret
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the polls against the mock router."""
+
+    router: MockRouter = MockRouter(
+        MeshProfile(
+            churn=args.churn,
+            devices=args.devices,
+            latency=args.latency,
+            nodes=args.nodes,
+            seed=args.seed,
+            timeout_rate=args.timeout_rate,
+        )
+    )
+    address: str = await router.async_start()
+    failures: int = 0
+    polls: list[dict[str, float]] = []
+    try:
+        async with aiohttp.ClientSession() as session:
+            mesh: Mesh = Mesh(
+                node=address,
+                password="admin",
+                request_timeout=args.timeout,
+                session=session,
+            )
+            await mesh.async_initialise()
+            mesh_index: MeshIndex = MeshIndex.build(mesh)
+
+            tracemalloc.start()
+            for _ in range(args.polls):
+                requests: int = router.requests
+                tracemalloc.reset_peak()
+                try:
+                    mesh_index, measurements = await async_poll(
+                        mesh, mesh_index, args.devices_only
+                    )
+                except (MeshConnectionError, MeshTimeoutError) as err:
+                    failures += 1
+                    sys.stdout.write(f"{json.dumps({'error': type(err).__name__})}\n")
+                    continue
+                current, peak = tracemalloc.get_traced_memory()
+                measurements.update(
+                    {
+                        "memory_kib": round(current / 1024, 1),
+                        "peak_memory_kib": round(peak / 1024, 1),
+                        "requests": router.requests - requests,
+                    }
+                )
+                polls.append(measurements)
+                sys.stdout.write(f"{json.dumps(measurements)}\n")
+            tracemalloc.stop()
+    finally:
+        await router.async_stop()
+
+    summary: dict[str, Any] = {"failures": failures, "polls": len(polls)}
+    if polls:
+        summary.update(
+            {key: _summarise([poll[key] for poll in polls]) for key in polls[0]}
+        )
+    sys.stdout.write(f"{json.dumps(summary, indent=4)}\n")
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--churn", default=0.01, type=float)
+    parser.add_argument("--devices", default=100, type=int)
+    parser.add_argument("--devices-only", action="store_true")
+    parser.add_argument("--latency", default=0.0, type=float)
+    parser.add_argument("--nodes", default=3, type=int)
+    parser.add_argument("--polls", default=10, type=int)
+    parser.add_argument("--seed", default=None, type=int)
+    parser.add_argument("--timeout", default=10, type=float)
+    parser.add_argument("--timeout-rate", default=0.0, type=float)
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""A stand-in for a Velop mesh that answers the JNAP requests made by pyvelop.
+
+The mesh is made up from a profile, so it can have any number of nodes and
+devices. Each poll of the devices can take some of them on or offline, and
+the responses can be delayed or left unanswered to act like a slow mesh.
+"""
+
+# region #-- imports --#
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import web
+
+# endregion
+
+JNAP_BASE: str = "http://linksys.com/jnap/"
+
+ACTION_CHECK_PASSWORD: str = f"{JNAP_BASE}core/CheckAdminPassword"
+ACTION_GET_BACKHAUL: str = f"{JNAP_BASE}nodes/diagnostics/GetBackhaulInfo"
+ACTION_GET_CHANNEL_SCAN_STATUS: str = f"{JNAP_BASE}nodes/setup/GetSelectedChannels"
+ACTION_GET_DEVICES: str = f"{JNAP_BASE}devicelist/GetDevices3"
+ACTION_GET_LAN_SETTINGS: str = f"{JNAP_BASE}router/GetLANSettings"
+ACTION_GET_SPEEDTEST_RESULTS: str = f"{JNAP_BASE}healthcheck/GetHealthCheckResults"
+ACTION_GET_SPEEDTEST_STATUS: str = f"{JNAP_BASE}healthcheck/GetHealthCheckStatus"
+ACTION_GET_WAN_INFO: str = f"{JNAP_BASE}router/GetWANStatus3"
+ACTION_REBOOT: str = f"{JNAP_BASE}core/Reboot"
+ACTION_START_CHANNEL_SCAN: str = f"{JNAP_BASE}nodes/setup/StartAutoChannelSelection"
+ACTION_START_SPEEDTEST: str = f"{JNAP_BASE}healthcheck/RunHealthCheck"
+ACTION_TRANSACTION: str = f"{JNAP_BASE}core/Transaction"
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeshProfile:
+    """The make up and behaviour of the mock mesh.
+
+    `churn` is the fraction of the devices that change between online and
+    offline on each poll of the devices. `timeout_rate` is the fraction of
+    requests that are never answered.
+    """
+
+    churn: float = 0.01
+    devices: int = 100
+    latency: float = 0.0
+    nodes: int = 3
+    seed: int | None = None
+    timeout_rate: float = 0.0
+
+
+def _mac(prefix: int, index: int) -> str:
+    """Make a MAC address from the index."""
+
+    ret: str = ":".join(
+        f"{octet:02X}" for octet in (0x02, prefix, *index.to_bytes(4, "big"))
+    )
+    return ret
+
+
+class MockRouter:
+    """Answer the JNAP requests for a mesh made up from the profile."""
+
+    def __init__(self, profile: MeshProfile) -> None:
+        """Initialise."""
+
+        self._profile: MeshProfile = profile
+        self._random: random.Random = random.Random(profile.seed)
+        self._runner: web.AppRunner | None = None
+        self._scan_running: bool = False
+        self.requests: int = 0
+
+        self._nodes: list[dict[str, Any]] = [
+            self._make_node(index) for index in range(max(1, profile.nodes))
+        ]
+        self._devices: list[dict[str, Any]] = [
+            self._make_device(index) for index in range(profile.devices)
+        ]
+        self._online: list[bool] = [self._random.random() < 0.75 for _ in self._devices]
+
+    def _make_node(self, index: int) -> dict[str, Any]:
+        """Describe a node, the first is the primary."""
+
+        ret: dict[str, Any] = {
+            "connections": [
+                {
+                    "ipAddress": f"192.168.1.{index + 1}",
+                    "macAddress": _mac(0x01, index),
+                    "parentDeviceID": None if index == 0 else "node-0",
+                }
+            ],
+            "deviceID": f"node-{index}",
+            "friendlyName": f"Node {index}",
+            "isAuthority": index == 0,
+            "knownInterfaces": [
+                {"interfaceType": "Wired", "macAddress": _mac(0x01, index)}
+            ],
+            "model": {
+                "description": "Velop",
+                "deviceType": "Infrastructure",
+                "hardwareVersion": "1",
+                "manufacturer": "Linksys",
+                "modelNumber": "WHW03",
+            },
+            "nodeType": "Master" if index == 0 else "Slave",
+            "properties": [],
+            "unit": {
+                "firmwareDate": "2024-01-01T00:00:00Z",
+                "firmwareVersion": "1.1.20.000000",
+                "operatingSystem": "Linux",
+                "serialNumber": f"SERIAL{index:06d}",
+            },
+        }
+        return ret
+
+    def _make_device(self, index: int) -> dict[str, Any]:
+        """Describe a device that connects to one of the nodes."""
+
+        ret: dict[str, Any] = {
+            "connections": [],
+            "deviceID": f"device-{index}",
+            "friendlyName": f"Device {index}",
+            "knownInterfaces": [
+                {
+                    "band": "5GHz",
+                    "interfaceType": "Wireless",
+                    "macAddress": _mac(0x02, index),
+                }
+            ],
+            "model": {"deviceType": "Computer", "manufacturer": "Mock"},
+            "properties": [],
+            "unit": {"operatingSystem": "Linux"},
+        }
+        return ret
+
+    def _device_details(self, index: int) -> dict[str, Any]:
+        """Describe the device with its current connection."""
+
+        device: dict[str, Any] = self._devices[index]
+        ret: dict[str, Any] = dict(device)
+        if self._online[index]:
+            ret["connections"] = [
+                {
+                    "ipAddress": f"10.{index >> 16 & 0xFF}.{index >> 8 & 0xFF}.{index & 0xFF}",
+                    "macAddress": device["knownInterfaces"][0]["macAddress"],
+                    "parentDeviceID": self._nodes[index % len(self._nodes)]["deviceID"],
+                }
+            ]
+        return ret
+
+    def churn(self) -> int:
+        """Take some of the devices on or offline.
+
+        :return: the number of devices that changed
+        """
+
+        ret: int = 0
+        if self._devices:
+            ret = int(len(self._devices) * self._profile.churn)
+            for index in self._random.sample(range(len(self._devices)), ret):
+                self._online[index] = not self._online[index]
+
+        return ret
+
+    def _output(self, action: str) -> dict[str, Any] | None:
+        """Get the output for the action, None if it isn't supported."""
+
+        ret: dict[str, Any] | None = None
+        if action in (ACTION_CHECK_PASSWORD, ACTION_GET_LAN_SETTINGS):
+            ret = {}
+        elif action == ACTION_GET_BACKHAUL:
+            ret = {
+                "backhaulDevices": [
+                    {
+                        "connectionType": "Wireless",
+                        "deviceUUID": node["deviceID"],
+                        "parentIPAddress": "192.168.1.1",
+                        "speedMbps": "866.7",
+                        "timestamp": "2024-01-01T00:00:00Z",
+                        "wireless": {"signalDecibels": -50, "stationRSSI": 45},
+                    }
+                    for node in self._nodes[1:]
+                ]
+            }
+        elif action == ACTION_GET_CHANNEL_SCAN_STATUS:
+            ret = {"isRunning": self._scan_running}
+            self._scan_running = False
+        elif action == ACTION_GET_DEVICES:
+            ret = {
+                "devices": self._nodes
+                + [self._device_details(index) for index in range(len(self._devices))]
+            }
+        elif action == ACTION_GET_SPEEDTEST_RESULTS:
+            ret = {"healthCheckResults": []}
+        elif action == ACTION_GET_SPEEDTEST_STATUS:
+            ret = {"healthCheckModuleCurrentlyRunning": None}
+        elif action == ACTION_GET_WAN_INFO:
+            ret = {"wanStatus": "Connected"}
+        elif action in (ACTION_REBOOT, ACTION_START_SPEEDTEST):
+            ret = {}
+        elif action == ACTION_START_CHANNEL_SCAN:
+            self._scan_running = True
+            ret = {}
+
+        return ret
+
+    def _respond(self, action: str) -> dict[str, Any]:
+        """Build the response for a single action."""
+
+        output: dict[str, Any] | None = self._output(action)
+        ret: dict[str, Any] = (
+            {"result": "_ErrorUnknownAction"}
+            if output is None
+            else {"output": output, "result": "OK"}
+        )
+        return ret
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Answer a request, acting like a slow mesh if the profile says to."""
+
+        self.requests += 1
+        if self._random.random() < self._profile.timeout_rate:
+            await asyncio.Event().wait()
+        if self._profile.latency:
+            await asyncio.sleep(self._profile.latency)
+
+        if request.method != "POST":
+            return web.Response(text="pong")
+
+        action: str = request.headers.get("X-JNAP-Action", "")
+        payload: Any = await request.json()
+        if action == ACTION_GET_DEVICES:
+            self.churn()
+
+        body: dict[str, Any]
+        if action == ACTION_TRANSACTION:
+            if any(item.get("action") == ACTION_GET_DEVICES for item in payload):
+                self.churn()
+            body = {
+                "responses": [self._respond(item.get("action")) for item in payload],
+                "result": "OK",
+            }
+        else:
+            body = self._respond(action)
+
+        return web.json_response(body)
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start answering requests.
+
+        :return: the address of the mock mesh to give to pyvelop
+        """
+
+        app: web.Application = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site: web.TCPSite = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        address: tuple[str, int] = self._runner.addresses[0][:2]
+        ret: str = f"{address[0]}:{address[1]}"
+        return ret
+
+    async def async_stop(self) -> None:
+        """Stop answering requests."""
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
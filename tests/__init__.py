@@ -0,0 +1 @@
+"""Tests for the Linksys Velop integration."""
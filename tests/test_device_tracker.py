@@ -0,0 +1,77 @@
+"""Tests for the device tracker entities."""
+
+# region #-- imports --#
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyvelop.action_registry")
+
+from homeassistant.components.device_tracker import CONF_CONSIDER_HOME  # noqa: E402
+
+from custom_components.linksys_velop.device_tracker import (  # noqa: E402
+    LinksysVelopDeviceTrackerMultiUseEntity,
+)
+from custom_components.linksys_velop.scheduler import DeadlineTimers  # noqa: E402
+
+# endregion
+
+
+class _Tracker(LinksysVelopDeviceTrackerMultiUseEntity):
+    """A tracker that can be built without a platform."""
+
+    name = "tracker"
+
+
+def _make_tracker(
+    timers: DeadlineTimers, online: bool, consider_home: float
+) -> _Tracker:
+    """Build a tracker for a device with the given status in the mesh."""
+
+    ret: _Tracker = _Tracker.__new__(_Tracker)
+    ret.entity_context = SimpleNamespace(data={"velop": {"id": "device"}})
+    ret.coordinator = SimpleNamespace(
+        config_entry=SimpleNamespace(options={CONF_CONSIDER_HOME: consider_home}),
+        consider_home_timers=timers,
+    )
+    ret._get_target = lambda: SimpleNamespace(status=SimpleNamespace(value=online))
+    ret.async_write_ha_state = MagicMock()
+    return ret
+
+
+def test_sighting_whilst_offline_is_away_after_consider_home() -> None:
+    """A device seen on the network but offline in the mesh goes away."""
+
+    async def _run() -> None:
+        timers: DeadlineTimers = DeadlineTimers(asyncio.get_running_loop())
+        tracker: _Tracker = _make_tracker(timers, online=False, consider_home=0.05)
+        tracker._is_connected = False
+
+        tracker._handle_device_present()
+        assert tracker.is_connected is True
+        assert "device" in timers
+
+        await asyncio.sleep(0.1)
+        assert tracker.is_connected is False
+        assert "device" not in timers
+
+    asyncio.run(_run())
+
+
+def test_sighting_whilst_online_stays_home() -> None:
+    """A device seen on the network and online in the mesh stays home."""
+
+    async def _run() -> None:
+        timers: DeadlineTimers = DeadlineTimers(asyncio.get_running_loop())
+        tracker: _Tracker = _make_tracker(timers, online=True, consider_home=0.05)
+        tracker._is_connected = False
+
+        tracker._handle_device_present()
+        await asyncio.sleep(0.1)
+        assert tracker.is_connected is True
+        assert "device" not in timers
+
+    asyncio.run(_run())
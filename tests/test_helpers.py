@@ -0,0 +1,49 @@
+"""Tests for the helpers."""
+
+# region #-- imports --#
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyvelop.action_registry")
+
+from custom_components.linksys_velop.helpers import compact_attributes  # noqa: E402
+
+# endregion
+
+DEVICES: list[dict[str, str]] = [
+    {"ip": "192.168.1.10", "name": "Laptop"},
+    {"ip": "192.168.1.11", "name": "Phone"},
+]
+
+
+def test_compact_attributes_replaces_the_keys() -> None:
+    """The given keys are replaced with a count and digest."""
+
+    attributes: dict = {"devices": DEVICES, "total": 2}
+    ret: dict = compact_attributes(attributes, ("devices", "missing"))
+
+    assert set(ret) == {"devices_count", "devices_digest", "total"}
+    assert ret["devices_count"] == 2
+    assert len(ret["devices_digest"]) == 16
+    assert ret["total"] == 2
+    assert attributes["devices"] is DEVICES
+
+
+def test_compact_attributes_digest_follows_the_contents() -> None:
+    """The digest only changes when the contents do."""
+
+    digest: str = compact_attributes({"devices": DEVICES}, ("devices",))[
+        "devices_digest"
+    ]
+
+    reordered: list[dict[str, str]] = [
+        {"name": device["name"], "ip": device["ip"]} for device in DEVICES
+    ]
+    assert (
+        compact_attributes({"devices": reordered}, ("devices",))["devices_digest"]
+        == digest
+    )
+    assert (
+        compact_attributes({"devices": DEVICES[:1]}, ("devices",))["devices_digest"]
+        != digest
+    )
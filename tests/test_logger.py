@@ -0,0 +1,90 @@
+"""Tests for the logging wrapper."""
+
+# region #-- imports --#
+import logging
+import sys
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyvelop.action_registry")
+
+from custom_components.linksys_velop.logger import Logger  # noqa: E402
+
+# endregion
+
+
+class _Arg:
+    """An argument that counts how often it is formatted."""
+
+    def __init__(self) -> None:
+        """Initialise."""
+
+        self.formatted: int = 0
+
+    def __str__(self) -> str:
+        """Count the formatting."""
+
+        self.formatted += 1
+        return "arg"
+
+
+@pytest.fixture
+def logger() -> Iterator[logging.Logger]:
+    """Provide a logger that is removed from the hierarchy after the test."""
+
+    ret: logging.Logger = logging.getLogger(f"{__name__}.wrapped")
+    yield ret
+    ret.setLevel(logging.NOTSET)
+    ret.filters.clear()
+
+
+def test_debug_does_nothing_when_disabled(logger: logging.Logger) -> None:
+    """The caller is not looked up and the arguments are not formatted."""
+
+    logger.setLevel(logging.INFO)
+    arg: _Arg = _Arg()
+
+    with patch.object(Logger, "_format") as mock_format:
+        Logger(logger).debug("value %s", arg)
+
+    mock_format.assert_not_called()
+    assert arg.formatted == 0
+
+
+def test_debug_prefixes_the_caller(
+    logger: logging.Logger, caplog: pytest.LogCaptureFixture
+) -> None:
+    """The message is prefixed with the function and line of the caller."""
+
+    logger.setLevel(logging.DEBUG)
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        line: int = sys._getframe().f_lineno + 1
+        Logger(logger).debug("value %s", 1)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        f"test_debug_prefixes_the_caller:{line}:value 1"
+    ]
+
+
+def test_debug_formats_the_arguments_lazily(logger: logging.Logger) -> None:
+    """The arguments are not formatted if the record is not emitted."""
+
+    logger.setLevel(logging.DEBUG)
+    logger.addFilter(lambda _: False)
+    arg: _Arg = _Arg()
+
+    Logger(logger).debug("value %s", arg)
+
+    assert arg.formatted == 0
+
+
+def test_passthrough(logger: logging.Logger) -> None:
+    """Other attributes come from the wrapped logger."""
+
+    wrapped: Logger = Logger(logger)
+
+    assert wrapped.name == logger.name
+    assert wrapped.get_logger() is logger
@@ -0,0 +1,121 @@
+"""Tests for querying the devices."""
+
+# region #-- imports --#
+from datetime import UTC, datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyvelop.action_registry")
+
+from custom_components.linksys_velop.mesh_index import MeshIndex  # noqa: E402
+from custom_components.linksys_velop.query import (  # noqa: E402
+    DeviceQuery,
+    query_devices,
+)
+
+# endregion
+
+NOW: datetime = datetime(2026, 1, 1, 12, tzinfo=UTC)
+
+
+def _make_device(
+    unique_id: str, name: str, *, band: str = "5GHz", node: str = "Lounge"
+) -> SimpleNamespace:
+    """Build an online device."""
+
+    ret: SimpleNamespace = SimpleNamespace(
+        adapter_info=[
+            SimpleNamespace(
+                band=band,
+                guest_network=False,
+                ip="192.168.1.10",
+                ipv6=None,
+                mac="00:11:22:33:44:55",
+                type=SimpleNamespace(value="wireless"),
+            )
+        ],
+        name=SimpleNamespace(value=name),
+        parent_name=SimpleNamespace(value=node),
+        status=True,
+        unique_id=SimpleNamespace(value=unique_id),
+    )
+    return ret
+
+
+@pytest.fixture
+def mesh_index() -> MeshIndex:
+    """Index a mix of online and offline devices."""
+
+    devices: list[SimpleNamespace] = [
+        _make_device("a", "Phone"),
+        _make_device("b", "laptop", band="2.4GHz"),
+        _make_device("c", "Camera", node="Office"),
+        _make_device("d", "Doorbell"),
+        _make_device("e", "Echo"),
+    ]
+    devices[3].status = False
+    devices[4].status = False
+
+    ret: MeshIndex = MeshIndex(
+        devices=MappingProxyType(
+            {device.unique_id.value: device for device in devices}
+        ),
+        offline_since=MappingProxyType(
+            {"d": NOW - timedelta(days=2), "e": NOW - timedelta(hours=1)}
+        ),
+    )
+    return ret
+
+
+def test_all_devices_ordered_by_name(mesh_index: MeshIndex) -> None:
+    """All devices are returned ordered by name if there are no filters."""
+
+    ret: dict = query_devices(mesh_index, DeviceQuery(), NOW)
+
+    assert [device["name"] for device in ret["devices"]] == [
+        "Camera",
+        "Doorbell",
+        "Echo",
+        "laptop",
+        "Phone",
+    ]
+    assert ret["total"] == 5
+
+
+def test_facets_are_combined(mesh_index: MeshIndex) -> None:
+    """The facets are matched ignoring case and must all match."""
+
+    ret: dict = query_devices(
+        mesh_index, DeviceQuery(band="5ghz", node="LOUNGE", online=True), NOW
+    )
+
+    assert [device["id"] for device in ret["devices"]] == ["a"]
+
+
+def test_offline_for(mesh_index: MeshIndex) -> None:
+    """Only devices offline for at least the given time are matched."""
+
+    ret: dict = query_devices(
+        mesh_index, DeviceQuery(offline_for=timedelta(days=1)), NOW
+    )
+
+    assert [device["id"] for device in ret["devices"]] == ["d"]
+    assert ret["devices"][0]["offline_since"] == "2025-12-30T12:00:00+00:00"
+
+
+def test_paging_and_fields(mesh_index: MeshIndex) -> None:
+    """A page of the matches is returned with only the requested fields."""
+
+    ret: dict = query_devices(
+        mesh_index, DeviceQuery(fields=("id", "name"), limit=2, offset=1), NOW
+    )
+
+    assert ret["devices"] == [
+        {"id": "d", "name": "Doorbell"},
+        {"id": "e", "name": "Echo"},
+    ]
+    assert ret["limit"] == 2
+    assert ret["offset"] == 1
+    assert ret["total"] == 5
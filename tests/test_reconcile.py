@@ -0,0 +1,143 @@
+"""Tests for working out the changes to the mesh."""
+
+# region #-- imports --#
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyvelop.action_registry")
+
+from pyvelop.mesh_entity import NodeType  # noqa: E402
+
+from custom_components.linksys_velop.mesh_index import (  # noqa: E402
+    MeshIndex,
+    NodePosition,
+)
+from custom_components.linksys_velop.reconcile import (  # noqa: E402
+    MeshChanges,
+    diff_mesh,
+)
+
+# endregion
+
+
+def _make_node(
+    index: int, name: str | None = None, ip: str | None = None
+) -> SimpleNamespace:
+    """Build a node, the first is the primary."""
+
+    ret: SimpleNamespace = SimpleNamespace(
+        adapter_info=[SimpleNamespace(primary=True, ip=ip or f"192.168.1.{index + 1}")],
+        name=SimpleNamespace(value=name or f"Node {index}"),
+        serial=SimpleNamespace(value=f"SERIAL{index}"),
+        type=SimpleNamespace(
+            value=NodeType.PRIMARY if index == 0 else NodeType.SECONDARY
+        ),
+        unique_id=SimpleNamespace(value=f"node-{index}"),
+    )
+    return ret
+
+
+def _make_device(index: int) -> SimpleNamespace:
+    """Build a device."""
+
+    ret: SimpleNamespace = SimpleNamespace(
+        name=SimpleNamespace(value=f"Device {index}"),
+        unique_id=SimpleNamespace(value=f"device-{index}"),
+    )
+    return ret
+
+
+def _make_index(nodes: list, devices: list) -> MeshIndex:
+    """Index the nodes and devices, with the secondaries under the primary."""
+
+    ret: MeshIndex = MeshIndex(
+        devices=MappingProxyType(
+            {device.unique_id.value: device for device in devices}
+        ),
+        nodes=MappingProxyType({node.unique_id.value: node for node in nodes}),
+        nodes_by_serial=MappingProxyType({node.serial.value: node for node in nodes}),
+        topology=MappingProxyType(
+            {
+                node.unique_id.value: NodePosition(
+                    parent=None if node.type.value == NodeType.PRIMARY else "node-0"
+                )
+                for node in nodes
+            }
+        ),
+    )
+    return ret
+
+
+def test_node_changes() -> None:
+    """New, stale, renamed and moved nodes are found."""
+
+    previous: list[SimpleNamespace] = [_make_node(0), _make_node(1), _make_node(2)]
+    current: list[SimpleNamespace] = [
+        _make_node(0),
+        _make_node(1, name="Lounge", ip="192.168.1.20"),
+        _make_node(3),
+    ]
+
+    changes: MeshChanges = diff_mesh(
+        previous_nodes={node.serial.value: node for node in previous},
+        mesh_index=_make_index(current, []),
+    )
+
+    assert [node.serial.value for node in changes.new_nodes] == ["SERIAL3"]
+    assert changes.stale_nodes == {"SERIAL2"}
+    assert changes.node_updates == {
+        "SERIAL1": {
+            "configuration_url": "http://192.168.1.20/ca",
+            "name": "Lounge",
+        }
+    }
+    assert changes.node_parents == {"SERIAL1": "SERIAL0"}
+
+
+def test_device_changes() -> None:
+    """New devices and the names of the UI devices are found."""
+
+    devices: list[SimpleNamespace] = [_make_device(index) for index in range(3)]
+
+    changes: MeshChanges = diff_mesh(
+        previous_nodes={},
+        mesh_index=_make_index([], devices),
+        previous_devices={"device-0", "device-1"},
+        ui_devices=("device-1", "device-9"),
+    )
+
+    assert changes.new_devices == {"device-2"}
+    assert changes.ui_device_names == {"device-1": "Device 1"}
+    assert changes.missing_ui_devices == {"device-9"}
+
+
+def test_new_devices_are_not_looked_for_without_previous() -> None:
+    """New devices are only found if the previous devices are known."""
+
+    changes: MeshChanges = diff_mesh(
+        previous_nodes={}, mesh_index=_make_index([], [_make_device(0)])
+    )
+
+    assert changes.new_devices == set()
+
+
+def test_large_mesh() -> None:
+    """A mesh of 1,000 devices is compared in a single pass."""
+
+    nodes: list[SimpleNamespace] = [_make_node(index) for index in range(10)]
+    devices: list[SimpleNamespace] = [_make_device(index) for index in range(1000)]
+
+    changes: MeshChanges = diff_mesh(
+        previous_nodes={node.serial.value: node for node in nodes[:-1]},
+        mesh_index=_make_index(nodes, devices),
+        previous_devices={f"device-{index}" for index in range(990)},
+        ui_devices=[f"device-{index}" for index in range(0, 1000, 100)],
+    )
+
+    assert len(changes.new_devices) == 10
+    assert [node.serial.value for node in changes.new_nodes] == ["SERIAL9"]
+    assert changes.node_updates == {}
+    assert len(changes.node_parents) == 8
+    assert len(changes.ui_device_names) == 10
@@ -0,0 +1,105 @@
+"""Tests for the request policy."""
+
+# region #-- imports --#
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyvelop.action_registry")
+
+from pyvelop.exceptions import MeshConnectionError, MeshTimeoutError  # noqa: E402
+
+from custom_components.linksys_velop.request_policy import (  # noqa: E402
+    CircuitOpenError,
+    RequestPolicy,
+    RequestTimeoutError,
+)
+
+# endregion
+
+
+def _make_policy(**kwargs) -> RequestPolicy:
+    """Build a policy that retries without waiting."""
+
+    ret: RequestPolicy = RequestPolicy(
+        1, breaker_threshold=2, min_timeout=0.05, retry_delay=0, **kwargs
+    )
+    return ret
+
+
+async def async_get_devices(delay: float = 0) -> str:
+    """Respond after the delay."""
+
+    await asyncio.sleep(delay)
+    return "devices"
+
+
+async def async_start_speedtest() -> None:
+    """Fail to respond."""
+
+    raise MeshConnectionError
+
+
+def test_failures_are_counted_per_call() -> None:
+    """Retries of a call count as a single failure."""
+
+    async def _run() -> None:
+        policy: RequestPolicy = _make_policy(retries=2)
+        calls: list[None] = []
+
+        async def async_gather_details() -> None:
+            calls.append(None)
+            raise MeshConnectionError
+
+        with pytest.raises(MeshConnectionError):
+            await policy.async_request(async_gather_details)
+        assert len(calls) == 3
+        assert not policy.is_open("async_gather_details")
+
+        with pytest.raises(MeshConnectionError):
+            await policy.async_request(async_gather_details)
+        assert policy.is_open("async_gather_details")
+
+        with pytest.raises(CircuitOpenError):
+            await policy.async_request(async_gather_details)
+        assert len(calls) == 6
+
+    asyncio.run(_run())
+
+
+def test_open_circuit_only_holds_back_the_action() -> None:
+    """A failing action does not hold back requests for other actions."""
+
+    async def _run() -> None:
+        policy: RequestPolicy = _make_policy(retries=0)
+        for _ in range(2):
+            with pytest.raises(MeshConnectionError):
+                await policy.async_request(async_start_speedtest)
+
+        assert policy.is_open("async_start_speedtest")
+        assert await policy.async_request(async_get_devices) == "devices"
+
+        policy.close_circuits()
+        assert not policy.is_open("async_start_speedtest")
+
+    asyncio.run(_run())
+
+
+def test_timeout_reports_the_adaptive_timeout() -> None:
+    """The error for a timed out action has the timeout that applied."""
+
+    async def _run() -> None:
+        policy: RequestPolicy = _make_policy(retries=0)
+        assert policy.get_timeout("async_get_devices") is None
+        await policy.async_request(async_get_devices, 0.01)
+        timeout: float | None = policy.get_timeout("async_get_devices")
+        assert timeout is not None
+
+        with pytest.raises(MeshTimeoutError) as exc_info:
+            await policy.async_request(async_get_devices, 1)
+        assert isinstance(exc_info.value, RequestTimeoutError)
+        assert exc_info.value.timeout == timeout
+        assert f"{timeout}s" in str(exc_info.value)
+
+    asyncio.run(_run())
@@ -0,0 +1,109 @@
+"""Tests for the scheduling of the timers."""
+
+# region #-- imports --#
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyvelop.action_registry")
+
+from custom_components.linksys_velop.scheduler import DeadlineTimers  # noqa: E402
+
+# endregion
+
+
+def test_actions_run_in_deadline_order() -> None:
+    """The actions run once their deadline has passed, earliest first."""
+
+    async def _test() -> list[str]:
+        ran: list[str] = []
+        timers: DeadlineTimers = DeadlineTimers(asyncio.get_running_loop())
+        timers.schedule("later", 0.02, lambda: ran.append("later"))
+        timers.schedule("sooner", 0.01, lambda: ran.append("sooner"))
+        assert "later" in timers
+        await asyncio.sleep(0.05)
+        assert "later" not in timers
+        return ran
+
+    assert asyncio.run(_test()) == ["sooner", "later"]
+
+
+def test_cancel() -> None:
+    """A cancelled action doesn't run."""
+
+    async def _test() -> list[str]:
+        ran: list[str] = []
+        timers: DeadlineTimers = DeadlineTimers(asyncio.get_running_loop())
+        timers.schedule("cancelled", 0.01, lambda: ran.append("cancelled"))
+        timers.schedule("kept", 0.02, lambda: ran.append("kept"))
+        timers.cancel("cancelled")
+        await asyncio.sleep(0.05)
+        return ran
+
+    assert asyncio.run(_test()) == ["kept"]
+
+
+def test_cancel_all() -> None:
+    """No actions run once all are cancelled."""
+
+    async def _test() -> list[str]:
+        ran: list[str] = []
+        timers: DeadlineTimers = DeadlineTimers(asyncio.get_running_loop())
+        for key in ("one", "two"):
+            timers.schedule(key, 0.01, lambda key=key: ran.append(key))
+        timers.cancel_all()
+        await asyncio.sleep(0.03)
+        return ran
+
+    assert asyncio.run(_test()) == []
+
+
+def test_schedule_replaces() -> None:
+    """Scheduling a key again replaces the previous deadline and action."""
+
+    async def _test() -> list[str]:
+        ran: list[str] = []
+        timers: DeadlineTimers = DeadlineTimers(asyncio.get_running_loop())
+        timers.schedule("key", 0.01, lambda: ran.append("first"))
+        timers.schedule("key", 0.1, lambda: ran.append("second"))
+        await asyncio.sleep(0.05)
+        assert ran == []
+        await asyncio.sleep(0.1)
+        return ran
+
+    assert asyncio.run(_test()) == ["second"]
+
+
+def test_single_timer() -> None:
+    """Only the earliest deadline has a timer on the event loop."""
+
+    async def _test() -> int:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        timers: DeadlineTimers = DeadlineTimers(loop)
+        with patch.object(loop, "call_at", wraps=loop.call_at) as mock_call_at:
+            for index in range(100):
+                timers.schedule(f"device-{index}", 10 + index, lambda: None)
+            calls: int = mock_call_at.call_count
+        timers.cancel_all()
+        return calls
+
+    assert asyncio.run(_test()) == 1
+
+
+def test_failing_action() -> None:
+    """An action that fails doesn't stop the others."""
+
+    def _fail() -> None:
+        raise RuntimeError
+
+    async def _test() -> list[str]:
+        ran: list[str] = []
+        timers: DeadlineTimers = DeadlineTimers(asyncio.get_running_loop())
+        timers.schedule("failing", 0.01, _fail)
+        timers.schedule("kept", 0.01, lambda: ran.append("kept"))
+        await asyncio.sleep(0.03)
+        return ran
+
+    assert asyncio.run(_test()) == ["kept"]
@@ -0,0 +1,57 @@
+"""Tests for the sensor entities."""
+
+# region #-- imports --#
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyvelop.action_registry")
+
+from custom_components.linksys_velop.const import (  # noqa: E402
+    CONF_COMPACT_ATTRIBUTES,
+)
+from custom_components.linksys_velop.sensor import (  # noqa: E402
+    LinksysVelopSensorMultiUseEntity,
+)
+
+# endregion
+
+DEVICES: list[dict[str, str]] = [{"ip": "192.168.1.10", "name": "Laptop"}]
+
+
+def _make_sensor(compact: bool) -> LinksysVelopSensorMultiUseEntity:
+    """Build a sensor listing devices without a platform."""
+
+    ret: LinksysVelopSensorMultiUseEntity = LinksysVelopSensorMultiUseEntity.__new__(
+        LinksysVelopSensorMultiUseEntity
+    )
+    ret.coordinator = SimpleNamespace(
+        config_entry=SimpleNamespace(options={CONF_COMPACT_ATTRIBUTES: compact})
+    )
+    ret.entity_description = SimpleNamespace(
+        esa_fn=lambda _: {"devices": DEVICES, "total": len(DEVICES)}
+    )
+    ret._get_target = lambda: None
+    return ret
+
+
+def test_attributes_are_full_by_default() -> None:
+    """The lists are in the attributes if compacting is off."""
+
+    sensor: LinksysVelopSensorMultiUseEntity = _make_sensor(compact=False)
+
+    assert sensor.extra_state_attributes == {"devices": DEVICES, "total": 1}
+
+
+def test_attributes_are_compacted() -> None:
+    """The lists are replaced in the attributes if compacting is on."""
+
+    sensor: LinksysVelopSensorMultiUseEntity = _make_sensor(compact=True)
+
+    attributes: dict | None = sensor.extra_state_attributes
+    assert attributes is not None
+    assert "devices" not in attributes
+    assert attributes["devices_count"] == 1
+    assert attributes["total"] == 1
+    assert sensor.get_extra_state_attributes() == {"devices": DEVICES, "total": 1}
@@ -0,0 +1,161 @@
+"""Tests for the service handler."""
+
+# region #-- imports --#
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pyvelop.action_registry")
+
+from pyvelop.exceptions import MeshInvalidInput  # noqa: E402
+
+from custom_components.linksys_velop.coordinator import (  # noqa: E402
+    CoordinatorTimers,
+    CoordinatorTypes,
+)
+from custom_components.linksys_velop.service_handler import (  # noqa: E402
+    LinksysVelopServiceHandler,
+)
+
+# endregion
+
+
+def _make_platform(entry_id: str, entities: dict) -> SimpleNamespace:
+    """Build an entity platform for the config entry."""
+
+    ret: SimpleNamespace = SimpleNamespace(
+        config_entry=SimpleNamespace(entry_id=entry_id), entities=entities
+    )
+    return ret
+
+
+def test_entity_attributes_are_returned_in_full() -> None:
+    """The attributes of the entity are returned without compacting."""
+
+    attributes: dict = {"devices": [{"name": "Laptop"}], "total": 1}
+    entity: SimpleNamespace = SimpleNamespace(
+        get_extra_state_attributes=lambda: attributes
+    )
+    platforms: list[SimpleNamespace] = [
+        _make_platform("other", {"sensor.devices": SimpleNamespace()}),
+        _make_platform("entry", {"sensor.devices": entity}),
+    ]
+    handler: LinksysVelopServiceHandler = LinksysVelopServiceHandler(MagicMock())
+
+    with patch(
+        "custom_components.linksys_velop.service_handler.async_get_platforms",
+        return_value=platforms,
+    ):
+        ret = asyncio.run(
+            handler.entity_attributes(
+                SimpleNamespace(entry_id="entry"), entity_id="sensor.devices"
+            )
+        )
+
+    assert ret == {"attributes": attributes}
+
+
+def test_entity_attributes_for_an_unknown_entity() -> None:
+    """An entity not belonging to the mesh is rejected."""
+
+    platforms: list[SimpleNamespace] = [
+        _make_platform(
+            "other",
+            {"sensor.devices": SimpleNamespace(get_extra_state_attributes=lambda: {})},
+        ),
+    ]
+    handler: LinksysVelopServiceHandler = LinksysVelopServiceHandler(MagicMock())
+
+    with (
+        patch(
+            "custom_components.linksys_velop.service_handler.async_get_platforms",
+            return_value=platforms,
+        ),
+        pytest.raises(MeshInvalidInput),
+    ):
+        asyncio.run(
+            handler.entity_attributes(
+                SimpleNamespace(entry_id="entry"), entity_id="sensor.devices"
+            )
+        )
+
+
+def _make_device(unique_id: str, error: Exception | None = None) -> SimpleNamespace:
+    """Build a device that fails to have its rules set if given an error."""
+
+    ret: SimpleNamespace = SimpleNamespace(
+        async_set_parental_control_rules=AsyncMock(side_effect=error),
+        unique_id=SimpleNamespace(value=unique_id),
+    )
+    return ret
+
+
+def _make_config_entry() -> SimpleNamespace:
+    """Build a config entry with a mesh coordinator."""
+
+    ret: SimpleNamespace = SimpleNamespace(
+        runtime_data=SimpleNamespace(
+            coordinators={
+                CoordinatorTypes.MESH: SimpleNamespace(
+                    async_force_refresh=AsyncMock(), mesh_index=None
+                )
+            }
+        )
+    )
+    return ret
+
+
+def test_devices_internet_access_partial_failure() -> None:
+    """Each device has its own outcome and the mesh is refreshed once."""
+
+    laptop: SimpleNamespace = _make_device("laptop")
+    phone: SimpleNamespace = _make_device("phone", MeshInvalidInput("Rules Overlap"))
+    devices: dict[str, list[SimpleNamespace]] = {
+        "Laptop": [laptop],
+        "laptop": [laptop],
+        "Phone": [phone],
+        "TV": [_make_device("tv-1"), _make_device("tv-2")],
+    }
+    config_entry: SimpleNamespace = _make_config_entry()
+    handler: LinksysVelopServiceHandler = LinksysVelopServiceHandler(MagicMock())
+
+    with patch.object(
+        handler, "_get_device", side_effect=lambda _, value: devices.get(value)
+    ):
+        ret = asyncio.run(
+            handler.devices_internet_access(
+                config_entry,
+                devices=["Laptop", "laptop", "Phone", "TV", "Unknown"],
+                pause=True,
+            )
+        )
+
+    results: dict = ret["results"]
+    assert results["Laptop"] == {"id": "laptop", "success": True}
+    assert results["laptop"] == {"id": "laptop", "success": True}
+    assert results["Phone"]["success"] is False
+    assert "Rules Overlap" in results["Phone"]["error"]
+    assert results["TV"]["success"] is False
+    assert results["Unknown"]["success"] is False
+    laptop.async_set_parental_control_rules.assert_awaited_once()
+    coordinator = config_entry.runtime_data.coordinators[CoordinatorTypes.MESH]
+    coordinator.async_force_refresh.assert_awaited_once_with(CoordinatorTimers.MESH)
+
+
+def test_devices_internet_rules_without_changes() -> None:
+    """The mesh isn't refreshed if no device was changed."""
+
+    config_entry: SimpleNamespace = _make_config_entry()
+    handler: LinksysVelopServiceHandler = LinksysVelopServiceHandler(MagicMock())
+
+    with patch.object(handler, "_get_device", return_value=None):
+        ret = asyncio.run(
+            handler.devices_internet_rules(config_entry, devices=["Unknown"])
+        )
+
+    assert ret["results"]["Unknown"]["success"] is False
+    coordinator = config_entry.runtime_data.coordinators[CoordinatorTypes.MESH]
+    coordinator.async_force_refresh.assert_not_awaited()